@@ -9,9 +9,13 @@ Dependencies:
 - redis==7.x
 """
 
+import redis  # v7.x
+
 from api.server import create_application
 from api.middleware import (
     AuthenticationMiddleware,
+    CacheBatchMiddleware,
+    DatabaseSessionMiddleware,
     TelemetryMiddleware,
     ErrorHandlerMiddleware
 )
@@ -28,10 +32,11 @@ cache_settings = CacheSettings()
 # Initialize cache manager
 cache_manager = CacheManager(cache_settings)
 
-# Initialize auth manager with Redis session store
+# Initialize auth manager with Redis session store; BlitzyAuthManager is
+# synchronous, so it gets a blocking client rather than the redis.asyncio one
 auth_manager = BlitzyAuthManager(
     security_settings=security_settings,
-    session_store=cache_manager._client,
+    session_store=redis.Redis.from_url(cache_settings.get_connection_url()),
     rate_limiter=None,  # Will be injected by middleware
     audit_logger=None   # Will be injected by middleware
 )
@@ -81,6 +86,8 @@ track_metric(
 __all__ = [
     'app',
     'AuthenticationMiddleware',
+    'CacheBatchMiddleware',
+    'DatabaseSessionMiddleware',
     'TelemetryMiddleware', 
     'ErrorHandlerMiddleware'
 ]
\ No newline at end of file
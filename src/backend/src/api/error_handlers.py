@@ -11,7 +11,6 @@ Dependencies:
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
-from datetime import datetime
 from typing import Dict, Any, Optional
 
 from core.exceptions import (
@@ -46,8 +45,7 @@ def register_exception_handlers(app: FastAPI) -> None:
                 "HTTPException",
                 "RequestValidationError",
                 "Exception"
-            ],
-            "timestamp": datetime.utcnow().isoformat()
+            ]
         }
     )
 
@@ -71,10 +69,11 @@ async def handle_custom_exception(
     # Enhanced error context
     error_context = {
         "error_code": exc.error_code,
+        "status_code": exc.status_code,
         "path": request.url.path,
         "method": request.method,
         "trace_id": trace_id,
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": exc.timestamp,
         **exc.metadata
     }
 
@@ -213,8 +212,7 @@ async def handle_generic_exception(
             "path": request.url.path,
             "method": request.method,
             "headers": dict(request.headers),
-            "query_params": dict(request.query_params),
-            "timestamp": datetime.utcnow().isoformat()
+            "query_params": dict(request.query_params)
         }
     )
 
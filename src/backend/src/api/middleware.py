@@ -8,14 +8,18 @@ Version: 1.0.0
 
 import logging
 import time
-from typing import Dict, Optional, Callable
+import uuid
+from typing import Dict, Optional
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.types import ASGIApp, Receive, Scope, Send
 import redis  # v7.x
 
 from core.auth import BlitzyAuthManager
+from core.cache import CacheError, CacheManager, current_pipeline
 from core.telemetry import track_metric, MetricsTracker
 from core.exceptions import AuthenticationError, RateLimitError
+from db.session import ScopedAsyncSession, current_request_id
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -206,6 +210,85 @@ class TelemetryMiddleware(BaseHTTPMiddleware):
             )
             raise
 
+class CacheBatchMiddleware:
+    """
+    ASGI middleware coalescing a request's cache writes into one pipeline round-trip.
+    The pipeline is flushed once the whole send cycle has finished, so writes queued
+    by background tasks and dependency teardown are sent as well.
+    """
+
+    def __init__(self, cache_manager: CacheManager, app: Optional[ASGIApp] = None):
+        """Initialize cache batching middleware.
+        
+        Args:
+            cache_manager: CacheManager whose writes are batched
+            app: Downstream ASGI application
+        """
+        self.app = app
+        self.cache_manager = cache_manager
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Process request with a request-scoped cache write pipeline.
+        
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
+        """
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        token = current_pipeline.set(self.cache_manager.pipeline())
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            try:
+                await self.cache_manager.flush()
+            except CacheError as e:
+                # The response is already sent; stale entries expire by TTL
+                logger.error(
+                    f"Failed to flush cache writes: {str(e)}",
+                    extra={'path': scope.get('path')}
+                )
+            current_pipeline.reset(token)
+
+class DatabaseSessionMiddleware:
+    """
+    ASGI middleware scoping one database session to each request.
+    Written against raw ASGI rather than BaseHTTPMiddleware, whose call_next returns
+    once the response starts: the session is removed only after the response has been
+    sent and get_db's teardown has committed, including for background tasks.
+    """
+
+    def __init__(self, app: Optional[ASGIApp] = None):
+        """Initialize database session middleware.
+        
+        Args:
+            app: Downstream ASGI application
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Process request with a request-scoped database session.
+        
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
+        """
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        # A generated id keeps scopes distinct even if clients reuse X-Request-ID
+        token = current_request_id.set(uuid.uuid4().hex)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            await ScopedAsyncSession.remove()
+            current_request_id.reset(token)
+
 class RateLimitMiddleware(BaseHTTPMiddleware):
     """Enhanced middleware for enforcing adaptive API rate limits with burst handling."""
 
@@ -13,11 +13,12 @@ from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, Security, status
 from fastapi.security import OAuth2PasswordBearer
 from prometheus_client import Counter, Histogram
-from redis import Redis
+from redis.asyncio import Redis
 from pythonjsonlogger import jsonlogger
 
 from models.user import User, ROLE_ADMIN, ROLE_CS_MANAGER, ROLE_CS_REP
 from services.user import UserService
+from db.repositories.users import decode_user, user_cache_key
 from core.security import FieldEncryption
 from core.exceptions import (
     AuthenticationError,
@@ -34,7 +35,7 @@ logger.addHandler(json_handler)
 # Initialize router
 router = APIRouter(prefix="/users", tags=["users"])
 
-# Initialize Redis cache
+# Initialize async Redis cache, the client type UserService and UserRepository use
 cache = Redis(host="localhost", port=6379, db=0)
 
 # Initialize metrics
@@ -153,11 +154,13 @@ async def get_user(
     try:
         with request_latency.labels("/users/{user_id}").time():
             # Check cache
-            cache_key = f"user:{str(user_id)}"
-            cached_user = cache.get(cache_key)
+            cache_key = user_cache_key(user_id)
+            cached_user = await cache.get(cache_key)
             
-            if cached_user:
-                return eval(cached_user)
+            # The entry is the repository's encoded row, filled by the service on a miss
+            user = decode_user(cached_user) if cached_user else None
+            if user:
+                return user.to_dict(exclude_fields=["hashed_password"])
 
             # Get user from service
             user = await user_service.get_user(user_id)
@@ -167,9 +170,7 @@ async def get_user(
                     detail="User not found"
                 )
 
-            # Cache result
             user_dict = user.to_dict(exclude_fields=["hashed_password"])
-            cache.setex(cache_key, 300, str(user_dict))  # 5 minute cache
 
             user_requests.labels(
                 endpoint="/users/{user_id}",
@@ -221,7 +222,7 @@ async def update_user(
                 )
 
             # Invalidate cache
-            cache.delete(f"user:{str(user_id)}")
+            await cache.delete(user_cache_key(user_id))
 
             # Log update
             logger.info(
@@ -272,7 +273,7 @@ async def delete_user(
                 )
 
             # Invalidate cache
-            cache.delete(f"user:{str(user_id)}")
+            await cache.delete(user_cache_key(user_id))
 
             # Log deletion
             logger.info(
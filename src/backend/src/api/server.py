@@ -10,6 +10,7 @@ Dependencies:
 - redis==7.x
 """
 
+import asyncio
 import logging
 from typing import Dict, Any
 import uvicorn
@@ -18,14 +19,19 @@ from fastapi.middleware.cors import CORSMiddleware
 from opentelemetry import trace
 
 from config.settings import get_api_prefix, get_app_settings
+from config.cache import CacheSettings
 from api.middleware import (
     AuthenticationMiddleware,
+    CacheBatchMiddleware,
+    DatabaseSessionMiddleware,
     TelemetryMiddleware,
     RateLimitMiddleware
 )
 from api.routes.health import router as health_router
+from core.cache import CacheManager
 from core.telemetry import track_metric, MetricsTracker
 from core.exceptions import BaseCustomException
+from db.repositories.local_cache import local_cache
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -53,6 +59,9 @@ def create_application() -> FastAPI:
         openapi_url=f"{get_api_prefix()}/openapi.json"
     )
 
+    # Redis client shared by the application's cache consumers
+    app.state.cache_manager = CacheManager(CacheSettings())
+
     # Configure middleware
     configure_middleware(app)
 
@@ -96,12 +105,18 @@ def create_application() -> FastAPI:
     async def startup_event():
         """Initialize services on startup."""
         logger.info("Starting application")
+
+        # Keep this worker's in-process repository cache coherent with other workers
+        app.state.local_cache_listener = asyncio.create_task(
+            local_cache.listen(app.state.cache_manager._client)
+        )
         track_metric('app.startup', 1)
 
     @app.on_event("shutdown")
     async def shutdown_event():
         """Cleanup on shutdown."""
         logger.info("Shutting down application")
+        app.state.local_cache_listener.cancel()
         track_metric('app.shutdown', 1)
 
     return app
@@ -152,6 +167,15 @@ def configure_middleware(app: FastAPI) -> None:
         response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
         return response
 
+    # Request-scoped database session shared by all get_db calls. Added after
+    # the BaseHTTPMiddleware layers so it wraps them: their call_next returns
+    # when the response starts, before dependency teardown has committed
+    app.add_middleware(DatabaseSessionMiddleware)
+
+    # Request-scoped batching of cache writes, outermost so writes queued while
+    # the session is torn down are flushed too
+    app.add_middleware(CacheBatchMiddleware, cache_manager=app.state.cache_manager)
+
 @tracer.start_as_current_span('configure_routers')
 def configure_routers(app: FastAPI) -> None:
     """
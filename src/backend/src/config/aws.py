@@ -9,6 +9,7 @@ Dependencies:
 - boto3==1.28.44
 """
 
+import functools
 import os
 from typing import Dict, Any
 from pydantic import BaseModel, Field
@@ -170,4 +171,8 @@ region = aws_settings.region
 sagemaker_config = aws_settings.sagemaker_config
 s3_config = aws_settings.s3_config
 kms_config = aws_settings.kms_config
-get_boto3_session = aws_settings.get_boto3_session
\ No newline at end of file
+
+@functools.lru_cache(maxsize=1)
+def get_boto3_session() -> Session:
+    """Return the process-wide boto3 session; creating one reloads config and botocore data."""
+    return aws_settings.get_boto3_session()
\ No newline at end of file
@@ -19,6 +19,7 @@ REDIS_PORT = int(os.getenv('REDIS_PORT', '6379'))
 REDIS_PASSWORD = os.getenv('REDIS_PASSWORD', None)
 REDIS_SSL = os.getenv('REDIS_SSL', 'False').lower() == 'true'
 REDIS_CLUSTER_MODE = os.getenv('REDIS_CLUSTER_MODE', 'False').lower() == 'true'
+REDIS_SOCKET_PATH = os.getenv('REDIS_SOCKET_PATH')  # Unix socket of a co-located Redis
 
 # Cache configuration defaults
 DEFAULT_TTL = 3600  # 1 hour in seconds
@@ -50,6 +51,7 @@ class CacheSettings:
     password: str = REDIS_PASSWORD
     ssl_enabled: bool = REDIS_SSL
     cluster_mode: bool = REDIS_CLUSTER_MODE
+    socket_path: Optional[str] = REDIS_SOCKET_PATH
     
     # Cache configuration
     ttl_config: Dict[str, int] = dataclasses.field(default_factory=lambda: CACHE_TYPES)
@@ -86,6 +88,11 @@ class CacheSettings:
             hosts = ','.join(self.cluster_nodes)
             return f'{scheme}://{auth}{hosts}'
         
+        # Co-located node over a Unix domain socket, skipping the TCP stack
+        if self.socket_path:
+            query = f'?password={self.password}' if self.password else ''
+            return f'unix://{self.socket_path}{query}'
+        
         # Single node connection
         return f'{scheme}://{auth}{self.host}:{self.port}'
 
@@ -60,6 +60,9 @@ class DatabaseSettings:
     # High availability settings
     replica_hosts: str = dataclasses.field(default_factory=lambda: os.getenv('DB_REPLICA_HOSTS', ''))
     read_only: bool = dataclasses.field(default_factory=lambda: os.getenv('DB_READ_ONLY', 'false').lower() == 'true')
+    replica_url: str = dataclasses.field(default_factory=lambda: os.getenv('DATABASE_REPLICA_URL', ''))
+    replica_pool_size: int = dataclasses.field(default_factory=lambda: int(os.getenv('DB_REPLICA_POOL_SIZE', '40')))
+    replica_max_overflow: int = dataclasses.field(default_factory=lambda: int(os.getenv('DB_REPLICA_MAX_OVERFLOW', '20')))
     
     # Debug settings
     echo_sql: bool = dataclasses.field(default_factory=lambda: os.getenv('DB_ECHO_SQL', 'false').lower() == 'true')
@@ -101,6 +104,41 @@ class DatabaseSettings:
                 error_code=DATABASE_ERROR_CODES['CONNECTION_ERROR']
             )
 
+    def get_async_connection_url(self) -> str:
+        """
+        Generate the asyncpg connection URL. SSL and replica routing are passed as
+        connect arguments by get_async_engine_args, since asyncpg does not read libpq
+        query parameters.
+        """
+        return f"postgresql+asyncpg://{self.username}:{self.password}@{self.host}:{self.port}/{self.database}"
+
+    def get_async_engine_args(self) -> Dict:
+        """Return async engine configuration mirroring get_engine_args for the asyncpg driver."""
+        args = {
+            'pool_size': self.pool_size,
+            'max_overflow': self.max_overflow,
+            'pool_timeout': self.pool_timeout,
+            'pool_pre_ping': True,
+            'pool_recycle': 3600,
+            'echo': self.echo_sql,
+            'connect_args': {
+                'timeout': 10,
+                # Applied by the server at connection startup, with no extra round-trip
+                'server_settings': {
+                    'application_name': 'csai_platform',
+                    'search_path': self.schema
+                }
+            }
+        }
+
+        # Configure SSL if enabled
+        if self.ssl_enabled:
+            ssl_context = self.configure_ssl_context()
+            if ssl_context:
+                args['connect_args']['ssl'] = ssl_context
+
+        return args
+
     def configure_ssl_context(self) -> Optional[ssl.SSLContext]:
         """Configure SSL context for secure database connections."""
         if not self.ssl_enabled:
@@ -9,10 +9,12 @@ Dependencies:
 
 import json
 import asyncio
+from contextvars import ContextVar
 from typing import Any, Dict, Optional
-import redis
-from redis.cluster import RedisCluster
-from redis.connection import ConnectionPool
+import redis.asyncio as redis
+from redis.asyncio.client import Pipeline
+from redis.asyncio.cluster import RedisCluster
+from redis.asyncio.connection import ConnectionPool
 from redis.exceptions import RedisError, ConnectionError, TimeoutError
 
 from ..config.cache import CacheSettings
@@ -21,6 +23,12 @@ from .exceptions import BaseCustomException
 # Global cache key prefix to namespace all keys
 CACHE_KEY_PREFIX: str = 'csai'
 
+# Upper bound on pooled connections per process
+DEFAULT_MAX_CONNECTIONS: int = 64
+
+# Request-scoped write pipeline, installed by CacheBatchMiddleware
+current_pipeline: ContextVar[Optional[Pipeline]] = ContextVar('current_pipeline', default=None)
+
 class CacheError(BaseCustomException):
     """Enhanced custom exception class for cache-related errors with monitoring integration."""
     
@@ -53,36 +61,35 @@ class CacheManager:
         }
         
         # Configure connection pool
+        pool_settings = pool_settings or {}
         pool_config = {
-            'max_connections': pool_settings.get('max_connections', 50),
+            'max_connections': pool_settings.get('max_connections', DEFAULT_MAX_CONNECTIONS),
             'socket_timeout': pool_settings.get('socket_timeout', 5),
             'socket_connect_timeout': pool_settings.get('socket_connect_timeout', 2),
             'retry_on_timeout': True,
             'health_check_interval': 30
         }
         
+        # Values stay raw bytes: repositories share this client for binary msgpack
+        # payloads, and json.loads below accepts bytes for the manager's own entries
         try:
             if settings.cluster_mode:
-                self._pool = ConnectionPool.from_url(
+                # Cluster clients keep one pool per node
+                self._pool = None
+                self._client = RedisCluster.from_url(
                     settings.get_connection_url(),
+                    decode_responses=False,
                     **pool_config
                 )
-                self._client = RedisCluster(
-                    connection_pool=self._pool,
-                    decode_responses=True
-                )
             else:
                 self._pool = ConnectionPool.from_url(
                     settings.get_connection_url(),
+                    decode_responses=False,
                     **pool_config
                 )
-                self._client = redis.Redis(
-                    connection_pool=self._pool,
-                    decode_responses=True
-                )
+                self._client = redis.Redis(connection_pool=self._pool)
             
-            # Verify connection
-            self._client.ping()
+            # Connections are opened on first use; health_check() verifies reachability
             
         except (ConnectionError, TimeoutError) as e:
             raise CacheError(
@@ -91,6 +98,33 @@ class CacheManager:
                 metadata={"connection_url": settings.get_connection_url()}
             )
 
+    def pipeline(self) -> Pipeline:
+        """Create a non-transactional pipeline for batching cache writes.
+        
+        Returns:
+            Pipeline bound to this manager's connection pool
+        """
+        return self._client.pipeline(transaction=False)
+
+    async def flush(self) -> None:
+        """Send writes queued on the request pipeline in one round-trip.
+        
+        Raises:
+            CacheError: If the queued commands fail
+        """
+        pipe = current_pipeline.get()
+        if pipe is None or not len(pipe):
+            return
+        
+        try:
+            await pipe.execute()
+        except RedisError as e:
+            self._stats['errors'] += 1
+            raise CacheError(
+                message=f"Cache flush error: {str(e)}",
+                error_code="CACHE007"
+            )
+
     async def get(self, key: str, track_stats: bool = True) -> Any:
         """Retrieve value from cache with monitoring.
         
@@ -103,6 +137,9 @@ class CacheManager:
         """
         cache_key = f"{CACHE_KEY_PREFIX}:{key}"
         
+        # Reads are a flush point so they observe this request's queued writes
+        await self.flush()
+        
         try:
             start_time = asyncio.get_event_loop().time()
             value = await self._client.get(cache_key)
@@ -141,7 +178,7 @@ class CacheManager:
             metadata: Optional context for TTL adjustment
             
         Returns:
-            Success status
+            Success status; True once queued when a request pipeline is active
         """
         cache_key = f"{CACHE_KEY_PREFIX}:{key}"
         
@@ -155,6 +192,12 @@ class CacheManager:
             # Implement cache stampede prevention with small random jitter
             ttl = int(ttl * (1 + (asyncio.get_event_loop().time() % 0.1)))
             
+            # Inside a request, defer the write to the next flush point
+            pipe = current_pipeline.get()
+            if pipe is not None:
+                pipe.setex(cache_key, ttl, serialized_value)
+                return True
+            
             success = await self._client.setex(
                 cache_key,
                 ttl,
@@ -182,6 +225,10 @@ class CacheManager:
         """
         cache_key = f"{CACHE_KEY_PREFIX}:{key}"
         
+        # Deletes run immediately so later reads in the request miss; queued writes
+        # are flushed first so none of them can restore the entry afterwards
+        await self.flush()
+        
         try:
             return bool(await self._client.delete(cache_key))
         except RedisError as e:
@@ -201,6 +248,8 @@ class CacheManager:
         Returns:
             Success status
         """
+        await self.flush()
+        
         try:
             cache_pattern = f"{CACHE_KEY_PREFIX}:{pattern}"
             keys = await self._client.keys(cache_pattern)
@@ -0,0 +1,28 @@
+"""
+Lightweight time helpers for the Customer Success AI Platform core.
+Kept free of platform imports so exceptions and logging can share them without
+import cycles.
+"""
+
+import time
+
+# Last formatted UTC second as (epoch_seconds, 'YYYY-MM-DDTHH:MM:SS')
+_timestamp_cache = (-1, '')
+
+def utc_timestamp() -> str:
+    """
+    Return the current UTC time as an ISO 8601 string with microseconds.
+
+    The date/time portion is formatted at most once per second and reused,
+    so repeated calls only pay for the microsecond suffix.
+
+    Returns:
+        str: Timestamp such as '2024-01-31T12:00:00.123456'
+    """
+    global _timestamp_cache
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    cached_seconds, prefix = _timestamp_cache
+    if seconds != cached_seconds:
+        prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(seconds))
+        _timestamp_cache = (seconds, prefix)
+    return f"{prefix}.{nanos // 1000:06d}"
@@ -2,58 +2,63 @@
 Core exception classes for the Customer Success AI Platform.
 Provides a comprehensive hierarchy of custom exceptions with standardized error handling,
 monitoring integration, and enhanced context tracking.
+
+Exceptions are logged once by the API exception handlers rather than on construction,
+keeping raise paths cheap.
 """
 
 # fastapi v0.100+
 from fastapi import HTTPException
-from datetime import datetime
-import uuid
-import logging
+import os
 from typing import Dict, List, Optional, Any
 
+from core.clock import utc_timestamp
+
+# Auth context keys stripped before attaching the context to an exception
+SENSITIVE_AUTH_FIELDS = frozenset({"password", "token", "secret"})
+
+def _trace_id() -> str:
+    """Generate a random 128-bit trace identifier as 32 hex characters."""
+    return os.urandom(16).hex()
+
 class BaseCustomException(HTTPException):
     """
     Base exception class for all custom exceptions in the platform.
     Provides enhanced monitoring capabilities and standardized error handling.
+
+    Subclasses declare their fixed ERROR_CODE and STATUS_CODE as class attributes;
+    explicit constructor arguments take precedence.
     """
+
+    ERROR_CODE: Optional[str] = None
+    STATUS_CODE: int = 500
     
     def __init__(
         self,
         message: str,
-        error_code: str,
-        status_code: int = 500,
+        error_code: Optional[str] = None,
+        status_code: Optional[int] = None,
         metadata: Optional[Dict[str, Any]] = None
     ) -> None:
+        if status_code is None:
+            status_code = self.STATUS_CODE
         super().__init__(status_code=status_code, detail=message)
         self.message = self._sanitize_message(message)
-        self.error_code = error_code
+        self.error_code = self.ERROR_CODE if error_code is None else error_code
         self.status_code = status_code
         self.metadata = metadata or {}
-        self.timestamp = datetime.utcnow().isoformat()
-        self.trace_id = str(uuid.uuid4())
-        
-        # Set up structured logging context
-        self._setup_logging_context()
+        self.timestamp = utc_timestamp()
+        self.trace_id = _trace_id()
     
     def _sanitize_message(self, message: str) -> str:
         """Sanitize error message to prevent injection attacks."""
         return str(message).strip()
-    
-    def _setup_logging_context(self) -> None:
-        """Configure structured logging with error context."""
-        logging.error(
-            f"Exception occurred: {self.error_code}",
-            extra={
-                "error_code": self.error_code,
-                "status_code": self.status_code,
-                "trace_id": self.trace_id,
-                "timestamp": self.timestamp,
-                "metadata": self.metadata
-            }
-        )
 
 class AuthenticationError(BaseCustomException):
     """Exception for authentication and authorization failures."""
+
+    ERROR_CODE = "AUTH001"
+    STATUS_CODE = 401
     
     def __init__(
         self,
@@ -63,18 +68,20 @@ class AuthenticationError(BaseCustomException):
         self.auth_context = self._sanitize_auth_context(auth_context or {})
         super().__init__(
             message=message,
-            error_code="AUTH001",
-            status_code=401,
             metadata={"auth_context": self.auth_context}
         )
     
     def _sanitize_auth_context(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """Remove sensitive information from auth context."""
-        sensitive_fields = {"password", "token", "secret"}
-        return {k: v for k, v in context.items() if k not in sensitive_fields}
+        if SENSITIVE_AUTH_FIELDS.isdisjoint(context):
+            return context
+        return {k: v for k, v in context.items() if k not in SENSITIVE_AUTH_FIELDS}
 
 class DataValidationError(BaseCustomException):
     """Exception for data validation failures with field-level details."""
+
+    ERROR_CODE = "DATA001"
+    STATUS_CODE = 422
     
     def __init__(
         self,
@@ -84,8 +91,6 @@ class DataValidationError(BaseCustomException):
         self.validation_errors = validation_errors
         super().__init__(
             message=message,
-            error_code="DATA001",
-            status_code=422,
             metadata={"validation_errors": self._format_validation_errors()}
         )
     
@@ -98,6 +103,9 @@ class DataValidationError(BaseCustomException):
 
 class PredictionServiceError(BaseCustomException):
     """Exception for ML prediction service failures with fallback handling."""
+
+    ERROR_CODE = "PRED001"
+    STATUS_CODE = 503
     
     def __init__(
         self,
@@ -108,8 +116,6 @@ class PredictionServiceError(BaseCustomException):
         self.fallback_available = self._check_fallback_availability()
         super().__init__(
             message=message,
-            error_code="PRED001",
-            status_code=503,
             metadata={
                 "model_context": self.model_context,
                 "fallback_available": self.fallback_available
@@ -122,6 +128,9 @@ class PredictionServiceError(BaseCustomException):
 
 class IntegrationSyncError(BaseCustomException):
     """Exception for integration synchronization failures with retry logic."""
+
+    ERROR_CODE = "SYNC001"
+    STATUS_CODE = 503
     
     def __init__(
         self,
@@ -133,8 +142,6 @@ class IntegrationSyncError(BaseCustomException):
         self.retry_strategy = self._configure_retry_strategy()
         super().__init__(
             message=message,
-            error_code="SYNC001",
-            status_code=503,
             metadata={
                 "sync_context": self.sync_context,
                 "retry_strategy": self.retry_strategy
@@ -152,6 +159,9 @@ class IntegrationSyncError(BaseCustomException):
 
 class RateLimitError(BaseCustomException):
     """Exception for rate limit violations with quota tracking."""
+
+    ERROR_CODE = "RATE001"
+    STATUS_CODE = 429
     
     def __init__(
         self,
@@ -163,8 +173,6 @@ class RateLimitError(BaseCustomException):
         self.current_usage = rate_limit_context.get("current_usage", 0)
         super().__init__(
             message=message,
-            error_code="RATE001",
-            status_code=429,
             metadata={
                 "rate_limit_context": self.rate_limit_context,
                 "reset_time": self.reset_time,
@@ -178,6 +186,9 @@ class RateLimitError(BaseCustomException):
 
 class PlaybookExecutionError(BaseCustomException):
     """Exception for playbook execution failures with rollback support."""
+
+    ERROR_CODE = "PLAY001"
+    STATUS_CODE = 500
     
     def __init__(
         self,
@@ -189,8 +200,6 @@ class PlaybookExecutionError(BaseCustomException):
         self.can_rollback = bool(self.rollback_steps)
         super().__init__(
             message=message,
-            error_code="PLAY001",
-            status_code=500,
             metadata={
                 "execution_context": self.execution_context,
                 "can_rollback": self.can_rollback,
@@ -205,6 +214,9 @@ class PlaybookExecutionError(BaseCustomException):
 
 class MLModelError(BaseCustomException):
     """Exception for ML model inference failures with model diagnostics."""
+
+    ERROR_CODE = "ML001"
+    STATUS_CODE = 500
     
     def __init__(
         self,
@@ -216,8 +228,6 @@ class MLModelError(BaseCustomException):
         self.requires_retraining = self._check_retraining_requirements()
         super().__init__(
             message=message,
-            error_code="ML001",
-            status_code=500,
             metadata={
                 "model_diagnostics": self.model_diagnostics,
                 "performance_metrics": self.performance_metrics,
@@ -6,18 +6,22 @@ and Datadog APM integration.
 Dependencies:
 - logging==3.11+
 - python-json-logger==2.0.7
+- orjson==3.9.2
 - datadog==0.44.0
 """
 
+import atexit
+import functools
 import logging
 import json
-import uuid
-from datetime import datetime
-from typing import Dict, Any, Optional
-from logging.handlers import RotatingFileHandler
+import queue
+from typing import Dict, Any, Callable, Optional
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+import orjson  # orjson v3.9.2
 from pythonjsonlogger import jsonlogger  # python-json-logger v2.0.7
 from datadog.logger import DatadogLogHandler  # datadog v0.44.0
 from config.logging import LoggingSettings
+from core.exceptions import BaseCustomException, _trace_id
 
 # Global logger instance
 logger = logging.getLogger(__name__)
@@ -26,15 +30,32 @@ logger = logging.getLogger(__name__)
 MAX_LOG_SIZE = 10 * 1024 * 1024  # 10MB
 BACKUP_COUNT = 5
 
+# Context keys whose values are redacted before logging
+SENSITIVE_FIELDS = frozenset({'password', 'token', 'api_key', 'secret'})
+REDACTED_VALUE = '***REDACTED***'
+
+# Level names accepted by StructuredLogger.log mapped to stdlib level numbers
+_LOG_LEVELS = {
+    'debug': logging.DEBUG,
+    'info': logging.INFO,
+    'warning': logging.WARNING,
+    'error': logging.ERROR,
+    'critical': logging.CRITICAL
+}
+
 class StructuredLogger:
     """Enhanced logger with structured logging, security features, and performance tracking."""
 
+    __slots__ = ('_logger', '_context', '_security_context', '_trace_id', '_base')
+
     def __init__(self, name: str):
         """Initialize structured logger with context management and security features."""
         self._logger = logging.getLogger(name)
         self._context = {}
         self._security_context = {}
-        self._trace_id = str(uuid.uuid4())
+        self._trace_id = _trace_id()
+        # Merged context attached to every record; rebuilt only in set_context
+        self._base = {'trace_id': self._trace_id}
 
     def set_context(self, context: Dict[str, Any]) -> None:
         """Set context data for structured logging with security validation."""
@@ -45,52 +66,89 @@ class StructuredLogger:
         self._context.update(sanitized_context)
         self._security_context.update({
             'trace_id': self._trace_id,
-            'timestamp': datetime.utcnow().isoformat(),
             'logger_name': self._logger.name
         })
+        self._base = {**self._context, **self._security_context}
 
     def log(self, level: str, message: str, extra: Optional[Dict[str, Any]] = None) -> None:
         """Log message with structured context, security audit, and performance tracking."""
-        if extra is None:
-            extra = {}
-
-        # Combine all context data
-        log_data = {
-            **self._context,
-            **self._security_context,
-            **extra,
-            'message': message,
-            'level': level,
-            'timestamp': datetime.utcnow().isoformat(),
-            'trace_id': self._trace_id
-        }
+        level_no = _LOG_LEVELS.get(level.lower(), logging.INFO)
+        if not self._logger.isEnabledFor(level_no):
+            return
+
+        # Combine context data; the message itself travels as the record message
+        log_data = {**self._base, **extra} if extra else self._base.copy()
+        # The JSON formatter stamps each record from LogRecord.created
+        log_data['level'] = level
 
         # Add performance metrics if available
-        if 'duration_ms' in extra:
+        if extra and 'duration_ms' in extra:
             log_data['performance'] = {
                 'duration_ms': extra['duration_ms'],
                 'threshold_exceeded': extra.get('duration_ms', 0) > 1000
             }
 
         # Log with appropriate level
-        log_method = getattr(self._logger, level.lower(), self._logger.info)
-        log_method(message, extra=log_data)
+        self._logger.log(level_no, message, extra=log_data)
 
     def _sanitize_context(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """Sanitize sensitive information from context data."""
-        sensitive_fields = {'password', 'token', 'api_key', 'secret'}
+        # Most contexts hold nothing sensitive; avoid copying them at all
+        if not _has_sensitive_keys(context):
+            return context
+
         sanitized = {}
-        
-        for key, value in context.items():
-            if key.lower() in sensitive_fields:
-                sanitized[key] = '***REDACTED***'
-            elif isinstance(value, dict):
-                sanitized[key] = self._sanitize_context(value)
-            else:
-                sanitized[key] = value
-                
+        pending = [(context, sanitized)]
+        while pending:
+            source, target = pending.pop()
+            for key, value in source.items():
+                if key.lower() in SENSITIVE_FIELDS:
+                    target[key] = REDACTED_VALUE
+                elif isinstance(value, dict):
+                    target[key] = nested = {}
+                    pending.append((value, nested))
+                else:
+                    target[key] = value
+
         return sanitized
 
+def _has_sensitive_keys(context: Dict[str, Any]) -> bool:
+    """Check nested context dicts for any sensitive key without copying them."""
+    pending = [context]
+    while pending:
+        for key, value in pending.pop().items():
+            if key.lower() in SENSITIVE_FIELDS:
+                return True
+            if isinstance(value, dict):
+                pending.append(value)
+    return False
+
+class OrjsonFormatter(jsonlogger.JsonFormatter):
+    """JSON log formatter that serializes records with orjson instead of stdlib json."""
+
+    def jsonify_log_record(self, log_record: Dict[str, Any]) -> str:
+        """Serialize the log record, falling back to stdlib json for unsupported values."""
+        try:
+            return orjson.dumps(
+                log_record,
+                default=str,
+                option=orjson.OPT_NON_STR_KEYS
+            ).decode()
+        except orjson.JSONEncodeError:
+            return super().jsonify_log_record(log_record)
+
+def _attach_queue_listener(target_logger: logging.Logger, *handlers: logging.Handler) -> None:
+    """
+    Route a logger through a queue so request threads never block on handler I/O.
+    Formatting and writes happen on the listener's background thread.
+    """
+    log_queue = queue.SimpleQueue()
+    target_logger.addHandler(QueueHandler(log_queue))
+
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
 def setup_logging(settings: LoggingSettings) -> logging.Logger:
     """Initialize comprehensive logging system with security and monitoring features."""
     # Get logging configuration
@@ -101,7 +159,7 @@ def setup_logging(settings: LoggingSettings) -> logging.Logger:
     root_logger.setLevel(config['loggers']['']['level'])
 
     # JSON formatter for structured logging
-    json_formatter = jsonlogger.JsonFormatter(
+    json_formatter = OrjsonFormatter(
         fmt='%(timestamp)s %(level)s %(name)s %(trace_id)s %(message)s',
         json_ensure_ascii=False,
         timestamp=True
@@ -110,7 +168,7 @@ def setup_logging(settings: LoggingSettings) -> logging.Logger:
     # Console handler with color formatting
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(json_formatter)
-    root_logger.addHandler(console_handler)
+    root_handlers = [console_handler]
 
     # Rotating file handler
     file_handler = RotatingFileHandler(
@@ -119,7 +177,7 @@ def setup_logging(settings: LoggingSettings) -> logging.Logger:
         backupCount=BACKUP_COUNT
     )
     file_handler.setFormatter(json_formatter)
-    root_logger.addHandler(file_handler)
+    root_handlers.append(file_handler)
 
     # Configure Datadog handler for production
     if config['handlers'].get('datadog'):
@@ -128,7 +186,9 @@ def setup_logging(settings: LoggingSettings) -> logging.Logger:
             tags=config['handlers']['datadog']['tags']
         )
         datadog_handler.setFormatter(json_formatter)
-        root_logger.addHandler(datadog_handler)
+        root_handlers.append(datadog_handler)
+
+    _attach_queue_listener(root_logger, *root_handlers)
 
     # Configure audit logging
     audit_handler = RotatingFileHandler(
@@ -138,11 +198,32 @@ def setup_logging(settings: LoggingSettings) -> logging.Logger:
     )
     audit_handler.setFormatter(json_formatter)
     audit_logger = logging.getLogger('audit')
-    audit_logger.addHandler(audit_handler)
+    _attach_queue_listener(audit_logger, audit_handler)
     audit_logger.setLevel(logging.INFO)
 
     return root_logger
 
+def log_error(error_code: str) -> Callable:
+    """
+    Decorator logging unexpected errors raised by the wrapped function.
+    Platform exceptions are logged once by the API exception handlers, so they
+    are re-raised here without logging them again.
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                if not isinstance(e, BaseCustomException):
+                    logger.error(
+                        f"Error in {func.__qualname__}: {str(e)}",
+                        extra={'error_code': error_code, 'error_type': type(e).__name__}
+                    )
+                raise
+        return wrapper
+    return decorator
+
 def get_logger(module_name: str) -> StructuredLogger:
     """Returns a configured logger instance for the specified module."""
     return StructuredLogger(module_name)
\ No newline at end of file
@@ -7,9 +7,11 @@ Version: 1.0.0
 
 import os
 import base64
-from typing import Dict, Optional
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Union
 from cryptography.fernet import Fernet  # v41.0.0
-from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes  # v41.0.0
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM  # v41.0.0
 from cryptography.hazmat.primitives import padding
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC  # v41.0.0
 from cryptography.hazmat.primitives import hashes
@@ -27,6 +29,17 @@ ENCRYPTION_SCHEMES = ['bcrypt', 'argon2']
 PASSWORD_CONTEXT = CryptContext(schemes=ENCRYPTION_SCHEMES, deprecated='auto')
 KEY_DERIVATION_ITERATIONS = 100000
 ENCRYPTION_VERSION = '1'
+IV_LENGTH = 12
+TAG_LENGTH = 16
+BULK_ENCRYPTION_THRESHOLD = 64  # Smaller batches are faster without thread dispatch
+
+@functools.lru_cache(maxsize=1)
+def _bulk_executor() -> ThreadPoolExecutor:
+    """Shared worker pool for bulk field encryption; AES-GCM releases the GIL."""
+    return ThreadPoolExecutor(
+        max_workers=os.cpu_count() or 1,
+        thread_name_prefix='field-encryption'
+    )
 
 def generate_salt(length: int = 32) -> bytes:
     """
@@ -45,11 +58,8 @@ def generate_salt(length: int = 32) -> bytes:
         raise ValueError("Salt length must be at least 16 bytes")
     
     try:
-        salt = os.urandom(length)
-        # Validate entropy
-        if len(set(salt)) < length // 2:
-            raise ValueError("Generated salt has insufficient entropy")
-        return salt
+        # os.urandom is a CSPRNG; its output needs no further entropy checks
+        return os.urandom(length)
     except Exception as e:
         logger.error(f"Salt generation failed: {str(e)}")
         raise
@@ -85,13 +95,59 @@ def derive_key(password: str, salt: bytes) -> bytes:
         logger.error(f"Key derivation failed: {str(e)}")
         raise
 
-def encrypt_field(value: str, key: str) -> str:
+def _decode_key(key: Union[str, bytes]) -> bytes:
+    """Return raw key bytes from a base64 encoded key or pass raw bytes through."""
+    return base64.b64decode(key) if isinstance(key, str) else key
+
+def _encrypt_with_cipher(value: str, cipher: AESGCM) -> str:
+    """Encrypt a value with a prepared AES-GCM cipher."""
+    # Generate a random IV
+    iv = os.urandom(IV_LENGTH)
+    
+    # Add padding
+    padder = padding.PKCS7(128).padder()
+    padded_data = padder.update(value.encode()) + padder.finalize()
+    
+    # Encrypt; AESGCM appends the authentication tag to the ciphertext
+    sealed = memoryview(cipher.encrypt(iv, padded_data, None))
+    
+    # Combine IV, tag and ciphertext into one buffer without intermediate copies
+    encrypted_data = b''.join((iv, sealed[-TAG_LENGTH:], sealed[:-TAG_LENGTH]))
+    
+    # Add version and encode
+    return f"{ENCRYPTION_VERSION}:{base64.b64encode(encrypted_data).decode()}"
+
+def _decrypt_with_cipher(encrypted_value: str, cipher: AESGCM) -> str:
+    """Decrypt a versioned value with a prepared AES-GCM cipher."""
+    # Split version and data
+    version, data = encrypted_value.split(':', 1)
+    if version != ENCRYPTION_VERSION:
+        raise ValueError(f"Unsupported encryption version: {version}")
+    
+    # Decode data
+    decoded_data = memoryview(base64.b64decode(data))
+    
+    # Extract IV, tag and ciphertext as views over the decoded buffer
+    iv = bytes(decoded_data[:IV_LENGTH])
+    tag = decoded_data[IV_LENGTH:IV_LENGTH + TAG_LENGTH]
+    ciphertext = decoded_data[IV_LENGTH + TAG_LENGTH:]
+    
+    # Decrypt and verify; AESGCM expects the tag appended to the ciphertext
+    padded_data = cipher.decrypt(iv, b''.join((ciphertext, tag)), None)
+    
+    # Remove padding
+    unpadder = padding.PKCS7(128).unpadder()
+    data = unpadder.update(padded_data) + unpadder.finalize()
+    
+    return data.decode()
+
+def encrypt_field(value: str, key: Union[str, bytes]) -> str:
     """
     Encrypt a field value using AES-256-GCM.
     
     Args:
         value: Value to encrypt
-        key: Encryption key
+        key: Encryption key, base64 encoded or as raw key bytes
         
     Returns:
         str: Base64 encoded encrypted value with IV
@@ -103,41 +159,18 @@ def encrypt_field(value: str, key: str) -> str:
         raise ValueError("Value and key are required")
     
     try:
-        # Generate a random IV
-        iv = os.urandom(12)
-        
-        # Create cipher
-        cipher = Cipher(
-            algorithms.AES(base64.b64decode(key)),
-            modes.GCM(iv),
-            backend=default_backend()
-        )
-        encryptor = cipher.encryptor()
-        
-        # Add padding
-        padder = padding.PKCS7(128).padder()
-        padded_data = padder.update(value.encode()) + padder.finalize()
-        
-        # Encrypt
-        ciphertext = encryptor.update(padded_data) + encryptor.finalize()
-        
-        # Combine IV, ciphertext and tag
-        encrypted_data = iv + encryptor.tag + ciphertext
-        
-        # Add version and encode
-        versioned_data = f"{ENCRYPTION_VERSION}:{base64.b64encode(encrypted_data).decode()}"
-        return versioned_data
+        return _encrypt_with_cipher(value, AESGCM(_decode_key(key)))
     except Exception as e:
         logger.error(f"Field encryption failed: {str(e)}")
         raise
 
-def decrypt_field(encrypted_value: str, key: str) -> str:
+def decrypt_field(encrypted_value: str, key: Union[str, bytes]) -> str:
     """
     Decrypt an encrypted field value.
     
     Args:
         encrypted_value: Encrypted value to decrypt
-        key: Decryption key
+        key: Decryption key, base64 encoded or as raw key bytes
         
     Returns:
         str: Decrypted value
@@ -149,35 +182,7 @@ def decrypt_field(encrypted_value: str, key: str) -> str:
         raise ValueError("Encrypted value and key are required")
     
     try:
-        # Split version and data
-        version, data = encrypted_value.split(':', 1)
-        if version != ENCRYPTION_VERSION:
-            raise ValueError(f"Unsupported encryption version: {version}")
-        
-        # Decode data
-        decoded_data = base64.b64decode(data)
-        
-        # Extract IV, tag and ciphertext
-        iv = decoded_data[:12]
-        tag = decoded_data[12:28]
-        ciphertext = decoded_data[28:]
-        
-        # Create cipher
-        cipher = Cipher(
-            algorithms.AES(base64.b64decode(key)),
-            modes.GCM(iv, tag),
-            backend=default_backend()
-        )
-        decryptor = cipher.decryptor()
-        
-        # Decrypt
-        padded_data = decryptor.update(ciphertext) + decryptor.finalize()
-        
-        # Remove padding
-        unpadder = padding.PKCS7(128).unpadder()
-        data = unpadder.update(padded_data) + unpadder.finalize()
-        
-        return data.decode()
+        return _decrypt_with_cipher(encrypted_value, AESGCM(_decode_key(key)))
     except Exception as e:
         logger.error(f"Field decryption failed: {str(e)}")
         raise
@@ -194,10 +199,6 @@ class FieldEncryption:
             config = settings.get_encryption_config()
             
             self._encryption_key = config['key']
-            self._fernet = Fernet(base64.b64encode(derive_key(
-                self._encryption_key,
-                generate_salt()
-            )))
             
             # Initialize key versions
             self._key_versions = {
@@ -206,6 +207,16 @@ class FieldEncryption:
                 'next': None
             }
             
+            # Decode keys and build ciphers once per rotation, not per call
+            self._key_raw = _decode_key(self._encryption_key)
+            self._ciphers = {
+                'current': AESGCM(self._key_raw),
+                'previous': None
+            }
+            
+            # The configured key is already 256 bits of key material; no KDF needed
+            self._fernet = Fernet(base64.urlsafe_b64encode(self._key_raw))
+            
             logger.info("Field encryption initialized successfully")
         except Exception as e:
             logger.error(f"Field encryption initialization failed: {str(e)}")
@@ -226,7 +237,7 @@ class FieldEncryption:
                 raise ValueError("Value is required")
             
             # Encrypt using current key version
-            encrypted = encrypt_field(value, self._key_versions['current'])
+            encrypted = _encrypt_with_cipher(value, self._ciphers['current'])
             logger.info("Field encryption successful")
             return encrypted
         except Exception as e:
@@ -248,20 +259,79 @@ class FieldEncryption:
                 raise ValueError("Encrypted value is required")
             
             # Extract version and decrypt
-            version = encrypted_value.split(':', 1)[0]
-            key = self._key_versions['current']
-            
-            # Handle old versions
-            if version != ENCRYPTION_VERSION and self._key_versions['previous']:
-                key = self._key_versions['previous']
-            
-            decrypted = decrypt_field(encrypted_value, key)
+            decrypted = _decrypt_with_cipher(
+                encrypted_value,
+                self._cipher_for(encrypted_value)
+            )
             logger.info("Field decryption successful")
             return decrypted
         except Exception as e:
             logger.error(f"Field decryption failed: {str(e)}")
             raise
     
+    def encrypt_many(self, values: List[str]) -> List[str]:
+        """
+        Encrypt multiple values, spreading large batches across worker threads.
+        
+        Args:
+            values: Values to encrypt
+            
+        Returns:
+            List[str]: Encrypted values in input order
+        """
+        try:
+            if not all(values):
+                raise ValueError("Value is required")
+            
+            encrypt = functools.partial(_encrypt_with_cipher, cipher=self._ciphers['current'])
+            if len(values) < BULK_ENCRYPTION_THRESHOLD:
+                encrypted = [encrypt(value) for value in values]
+            else:
+                encrypted = list(_bulk_executor().map(encrypt, values))
+            
+            logger.info(f"Bulk field encryption successful: {len(encrypted)} values")
+            return encrypted
+        except Exception as e:
+            logger.error(f"Bulk field encryption failed: {str(e)}")
+            raise
+    
+    def decrypt_many(self, encrypted_values: List[str]) -> List[str]:
+        """
+        Decrypt multiple values, spreading large batches across worker threads.
+        
+        Args:
+            encrypted_values: Encrypted values to decrypt
+            
+        Returns:
+            List[str]: Decrypted values in input order
+        """
+        try:
+            if not all(encrypted_values):
+                raise ValueError("Encrypted value is required")
+            
+            def decrypt(encrypted_value: str) -> str:
+                return _decrypt_with_cipher(encrypted_value, self._cipher_for(encrypted_value))
+            
+            if len(encrypted_values) < BULK_ENCRYPTION_THRESHOLD:
+                decrypted = [decrypt(value) for value in encrypted_values]
+            else:
+                decrypted = list(_bulk_executor().map(decrypt, encrypted_values))
+            
+            logger.info(f"Bulk field decryption successful: {len(decrypted)} values")
+            return decrypted
+        except Exception as e:
+            logger.error(f"Bulk field decryption failed: {str(e)}")
+            raise
+    
+    def _cipher_for(self, encrypted_value: str) -> AESGCM:
+        """Select the cipher matching the version of an encrypted value."""
+        version = encrypted_value.split(':', 1)[0]
+        
+        # Handle old versions
+        if version != ENCRYPTION_VERSION and self._ciphers['previous']:
+            return self._ciphers['previous']
+        return self._ciphers['current']
+    
     def rotate_keys(self) -> bool:
         """
         Perform key rotation with secure backup.
@@ -280,14 +350,24 @@ class FieldEncryption:
             self._key_versions['current'] = new_key
             self._encryption_key = new_key
             
-            # Update Fernet instance
-            self._fernet = Fernet(base64.b64encode(derive_key(
-                self._encryption_key,
-                generate_salt()
-            )))
+            # Rotate cached ciphers alongside the key versions
+            self._ciphers['previous'] = self._ciphers['current']
+            self._key_raw = _decode_key(new_key)
+            self._ciphers['current'] = AESGCM(self._key_raw)
+            
+            # Update Fernet instance from the new random key
+            self._fernet = Fernet(base64.urlsafe_b64encode(self._key_raw))
             
             logger.info("Key rotation completed successfully")
             return True
         except Exception as e:
             logger.error(f"Key rotation failed: {str(e)}")
-            raise
\ No newline at end of file
+            raise
+
+@functools.lru_cache(maxsize=1)
+def get_field_encryption() -> FieldEncryption:
+    """
+    Shared field encryption instance, so request-scoped callers reuse one
+    settings load and one set of initialized ciphers per process.
+    """
+    return FieldEncryption()
@@ -5,15 +5,22 @@ and monitoring integration.
 
 Dependencies:
 - cachetools==5.3.0
+- ciso8601==2.3.0
+- msgspec==0.18.4
+- orjson==3.9.2
+- pydantic==2.0.0
 """
 
-import json
-import uuid
+import os
 import re
 from datetime import datetime
-from typing import Dict, Any, Optional, Union
-from cachetools import TTLCache, cached  # cachetools v5.3.0
-from functools import wraps
+from typing import Dict, Any, Callable, Optional, Tuple, Type, Union
+from cachetools import Cache, TTLCache  # cachetools v5.3.0
+import ciso8601  # ciso8601 v2.3.0
+import msgspec  # msgspec v0.18.4
+import orjson  # orjson v3.9.2
+from pydantic import BaseModel, ConfigDict, ValidationError, create_model  # pydantic v2.0.0
+from functools import lru_cache, wraps
 
 from core.exceptions import BaseCustomException
 from core.logging import log_error
@@ -23,15 +30,57 @@ from core.security import SecurityValidator
 VALIDATION_CACHE = TTLCache(maxsize=1000, ttl=300)  # 5 minute TTL
 CUSTOMER_CACHE = TTLCache(maxsize=10000, ttl=300)
 
-# Constants
-UUID_PATTERN = re.compile(r'^[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$')
-EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+# Constants (patterns are applied with fullmatch, so they carry no anchors, and are
+# ASCII-only so \d never accepts non-ASCII digits)
+UUID_PATTERN = re.compile(r'[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}', re.ASCII)
+EMAIL_PATTERN = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', re.ASCII)
+UUID_LENGTH = 36
 PHONE_PATTERNS = {
-    'US': re.compile(r'^\+1[2-9]\d{9}$'),
-    'UK': re.compile(r'^\+44[1-9]\d{9}$'),
-    'INT': re.compile(r'^\+[1-9]\d{1,14}$')
+    'US': re.compile(r'\+1[2-9]\d{9}', re.ASCII),
+    'UK': re.compile(r'\+44[1-9]\d{9}', re.ASCII),
+    'INT': re.compile(r'\+[1-9]\d{1,14}', re.ASCII)
 }
 
+# JSON payload limits checked before the content security scan
+MAX_JSON_BYTES = 10 * 1024 * 1024  # 10MB
+_JSON_DOCUMENT_START = re.compile(r'[ \t\r\n]*[{\[]')
+_JSON_DOCUMENT_START_BYTES = re.compile(rb'[ \t\r\n]*[{\[]')
+
+# Bound matchers resolved once instead of per validation call
+_uuid_fullmatch = UUID_PATTERN.fullmatch
+_email_fullmatch = EMAIL_PATTERN.fullmatch
+_PHONE_MATCHERS = {code: pattern.fullmatch for code, pattern in PHONE_PATTERNS.items()}
+_DEFAULT_PHONE_MATCH = _PHONE_MATCHERS['INT']
+
+# Required-field schemas validate types strictly and keep any additional fields
+REQUIRED_FIELDS_CONFIG = ConfigDict(strict=True, extra='allow', arbitrary_types_allowed=True)
+
+# Separates positional from keyword arguments in _cached keys
+_KWARGS_MARK = object()
+
+def _cached(cache: Cache) -> Callable:
+    """
+    Memoize a function in the given cache with minimal per-call overhead.
+    Cache accessors are bound once and a miss is detected via KeyError, avoiding
+    the key-function and sentinel indirection of cachetools.cached.
+    """
+    def decorator(func: Callable) -> Callable:
+        cache_getitem = cache.__getitem__
+        cache_setitem = cache.__setitem__
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            key = args + (_KWARGS_MARK, *sorted(kwargs.items())) if kwargs else args
+            try:
+                return cache_getitem(key)
+            except KeyError:
+                pass
+            value = func(*args, **kwargs)
+            cache_setitem(key, value)
+            return value
+        return wrapper
+    return decorator
+
 def generate_uuid() -> str:
     """
     Generates a unique identifier using UUID4.
@@ -39,7 +88,12 @@ def generate_uuid() -> str:
     Returns:
         str: UUID string in standard format
     """
-    return str(uuid.uuid4())
+    # Build the version 4 string straight from random bytes, skipping the UUID object
+    b = bytearray(os.urandom(16))
+    b[6] = (b[6] & 0x0f) | 0x40  # Version 4
+    b[8] = (b[8] & 0x3f) | 0x80  # RFC 4122 variant
+    h = b.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
 
 def format_datetime(dt: datetime) -> str:
     """
@@ -58,10 +112,14 @@ def format_datetime(dt: datetime) -> str:
         raise ValueError("Datetime object is required")
     return dt.isoformat()
 
+@lru_cache(maxsize=4096)
 def parse_datetime(dt_string: str) -> datetime:
     """
     Parses ISO format string to datetime object.
     
+    Results are memoized, since the same timestamps recur across event batches
+    and datetime objects are immutable.
+    
     Args:
         dt_string: ISO format datetime string
         
@@ -71,53 +129,115 @@ def parse_datetime(dt_string: str) -> datetime:
     Raises:
         ValueError: If dt_string is invalid
     """
+    try:
+        return ciso8601.parse_datetime(dt_string)
+    except (ValueError, TypeError):
+        pass
+    
+    # Fall back to the stdlib parser for forms ciso8601 does not accept
     try:
         return datetime.fromisoformat(dt_string)
     except (ValueError, TypeError) as e:
         raise ValueError(f"Invalid datetime string format: {e}")
 
+@lru_cache(maxsize=256)
+def _schema_for(fields_key: Tuple[Tuple[str, type], ...]) -> Type[BaseModel]:
+    """Build a Pydantic model requiring the given fields with the given types."""
+    return create_model(
+        'RequiredFieldsSchema',
+        __config__=REQUIRED_FIELDS_CONFIG,
+        **{field: (field_type, ...) for field, field_type in fields_key}
+    )
+
 @log_error(error_code='JSON001')
-def safe_json_loads(json_string: str, required_fields: Optional[Dict[str, type]] = None) -> Dict[str, Any]:
+def safe_json_loads(
+    json_string: Union[str, bytes],
+    required_fields: Optional[Dict[str, type]] = None,
+    schema: Optional[Type[msgspec.Struct]] = None
+) -> Union[Dict[str, Any], msgspec.Struct]:
     """
     Safely loads JSON string with enhanced error handling and security validation.
     
     Args:
-        json_string: JSON string to parse
+        json_string: JSON string to parse; raw request bytes are accepted without decoding
         required_fields: Dictionary of required field names and their types
+        schema: Optional msgspec Struct type to decode and validate into in one pass;
+            takes precedence over required_fields
         
     Returns:
-        dict: Parsed and validated JSON data
+        dict: Parsed and validated JSON data, or a schema instance if schema is given
         
     Raises:
         BaseCustomException: If validation fails or JSON is malformed
     """
+    # Cheap structural checks first so oversized or non-JSON input never reaches
+    # the full content scan
+    # The limit is in bytes; a str only needs encoding once it could exceed it
+    size = len(json_string)
+    if isinstance(json_string, str) and size * 4 > MAX_JSON_BYTES:
+        size = len(json_string.encode('utf-8', 'surrogatepass'))
+    if size > MAX_JSON_BYTES:
+        raise BaseCustomException(
+            message=f"JSON payload exceeds maximum size of {MAX_JSON_BYTES} bytes",
+            error_code="JSON003",
+            status_code=413
+        )
+    start_pattern = (
+        _JSON_DOCUMENT_START_BYTES if isinstance(json_string, bytes) else _JSON_DOCUMENT_START
+    )
+    if not start_pattern.match(json_string):
+        raise BaseCustomException(
+            message="Invalid JSON format: expected an object or array",
+            error_code="JSON001"
+        )
+    
     # Validate input for malicious content
     SecurityValidator.validate_content(json_string)
     
     try:
-        data = json.loads(json_string)
+        # Typed payloads decode straight into their Struct
+        if schema is not None:
+            return msgspec.json.decode(json_string, type=schema)
         
-        # Validate required fields if specified
+        # Parse and validate required fields in a single pass
         if required_fields:
-            for field, field_type in required_fields.items():
-                if field not in data:
-                    raise ValueError(f"Required field missing: {field}")
-                if not isinstance(data[field], field_type):
-                    raise TypeError(f"Invalid type for field {field}: expected {field_type.__name__}")
-        
-        return data
-    except json.JSONDecodeError as e:
+            # Sort so the same fields in any order share one cached model
+            fields_model = _schema_for(tuple(sorted(required_fields.items())))
+            return fields_model.model_validate_json(json_string).model_dump()
+        
+        return orjson.loads(json_string)
+    except msgspec.ValidationError as e:
+        raise BaseCustomException(
+            message=str(e),
+            error_code="JSON002"
+        ) from e
+    except msgspec.DecodeError as e:
         raise BaseCustomException(
             message=f"Invalid JSON format: {str(e)}",
             error_code="JSON001"
-        )
+        ) from e
+    except orjson.JSONDecodeError as e:
+        raise BaseCustomException(
+            message=f"Invalid JSON format: {str(e)}",
+            error_code="JSON001"
+        ) from e
+    except ValidationError as e:
+        if any(error['type'] == 'json_invalid' for error in e.errors()):
+            raise BaseCustomException(
+                message=f"Invalid JSON format: {str(e)}",
+                error_code="JSON001"
+            ) from e
+        raise BaseCustomException(
+            message=str(e),
+            error_code="JSON002"
+        ) from e
     except (ValueError, TypeError) as e:
         raise BaseCustomException(
             message=str(e),
             error_code="JSON002"
-        )
+        ) from e
 
-@cached(cache=CUSTOMER_CACHE)
+@_cached(CUSTOMER_CACHE)
 @log_error(error_code='CUST001')
 def validate_customer_id(customer_id: str) -> bool:
     """
@@ -133,8 +253,8 @@ def validate_customer_id(customer_id: str) -> bool:
         BaseCustomException: If validation fails
     """
     try:
-        # Validate UUID format
-        if not UUID_PATTERN.match(customer_id):
+        # Validate UUID format; the length check rejects most bad input cheaply
+        if len(customer_id) != UUID_LENGTH or not _uuid_fullmatch(customer_id):
             raise ValueError("Invalid customer ID format")
             
         # Additional validation logic would go here
@@ -147,6 +267,60 @@ def validate_customer_id(customer_id: str) -> bool:
             error_code="CUST001"
         )
 
+@_cached(VALIDATION_CACHE)
+@log_error(error_code='EMAIL001')
+def _validate_email(email: str) -> bool:
+    """
+    Validates email format and content, cached by the email address alone.
+    
+    Args:
+        email: Email address to validate
+        
+    Returns:
+        bool: Validation result
+        
+    Raises:
+        BaseCustomException: If validation fails
+    """
+    try:
+        # Basic format validation
+        if not _email_fullmatch(email):
+            raise ValueError("Invalid email format")
+        
+        # Security validation
+        SecurityValidator.validate_content(email)
+        
+        return True
+    except ValueError as e:
+        raise BaseCustomException(
+            message=str(e),
+            error_code="EMAIL001"
+        )
+
+@lru_cache(maxsize=4096)
+def _phone_is_valid(phone: str, country_code: str) -> bool:
+    """
+    Checks phone format and content, memoized by phone and country code.
+    
+    A format mismatch is returned as False so it can be cached; security
+    validation failures propagate to the caller and are not cached.
+    
+    Args:
+        phone: Phone number to validate
+        country_code: Country code for validation pattern
+        
+    Returns:
+        bool: True if the phone number is valid
+    """
+    matcher = _PHONE_MATCHERS.get(country_code, _DEFAULT_PHONE_MATCH)
+    if not matcher(phone):
+        return False
+    
+    # Security validation
+    SecurityValidator.validate_content(phone)
+    
+    return True
+
 def calculate_percentage(value: float, total: float) -> float:
     """
     Calculates percentage with safe division handling.
@@ -163,6 +337,13 @@ def calculate_percentage(value: float, total: float) -> float:
     """
     if total <= 0:
         raise ValueError("Total must be greater than zero")
+    
+    # Integer counts are rounded exactly (half to even, like round) without float math
+    if isinstance(value, int) and isinstance(total, int):
+        hundredths, remainder = divmod(value * 10000, total)
+        if 2 * remainder > total or (2 * remainder == total and hundredths & 1):
+            hundredths += 1
+        return hundredths / 100
     return round((value / total) * 100, 2)
 
 class DataValidator:
@@ -170,19 +351,24 @@ class DataValidator:
     Enhanced utility class for data validation operations with caching and security checks.
     """
     
-    def __init__(self, validation_patterns: Dict[str, str], cache_ttl: int = 300):
+    def __init__(self, validation_patterns: Dict[str, str]):
         """
-        Initialize data validator with patterns and cache.
+        Initialize data validator with patterns.
+        
+        Validation results are cached in the module-level VALIDATION_CACHE,
+        shared by all validator instances.
         
         Args:
             validation_patterns: Dictionary of validation patterns
-            cache_ttl: Cache TTL in seconds (default: 300)
         """
         self._validation_patterns = validation_patterns
-        self._validation_cache = TTLCache(maxsize=1000, ttl=cache_ttl)
+        # Compile once and bind fullmatch so each check is a single call
+        self._pattern_matchers = {
+            name: re.compile(pattern, re.ASCII).fullmatch
+            for name, pattern in validation_patterns.items()
+        }
         self._security_validator = SecurityValidator()
 
-    @cached(cache=VALIDATION_CACHE)
     def validate_email(self, email: str) -> bool:
         """
         Validates email format with enhanced security checks.
@@ -196,20 +382,24 @@ class DataValidator:
         Raises:
             BaseCustomException: If validation fails
         """
-        try:
-            # Basic format validation
-            if not EMAIL_PATTERN.match(email):
-                raise ValueError("Invalid email format")
+        # Results are shared across validator instances
+        return _validate_email(email)
+
+    def matches_pattern(self, value: str, pattern_name: str) -> bool:
+        """
+        Checks a value against one of the configured validation patterns.
+        
+        Args:
+            value: Value to check
+            pattern_name: Name of the configured pattern
             
-            # Security validation
-            self._security_validator.validate_content(email)
+        Returns:
+            bool: True if the whole value matches the pattern
             
-            return True
-        except ValueError as e:
-            raise BaseCustomException(
-                message=str(e),
-                error_code="EMAIL001"
-            )
+        Raises:
+            KeyError: If no pattern is configured under pattern_name
+        """
+        return self._pattern_matchers[pattern_name](value) is not None
 
     def validate_phone(self, phone: str, country_code: str = 'INT') -> bool:
         """
@@ -226,13 +416,9 @@ class DataValidator:
             BaseCustomException: If validation fails
         """
         try:
-            pattern = PHONE_PATTERNS.get(country_code, PHONE_PATTERNS['INT'])
-            if not pattern.match(phone):
+            if not _phone_is_valid(phone, country_code):
                 raise ValueError(f"Invalid phone format for country code {country_code}")
             
-            # Security validation
-            self._security_validator.validate_content(phone)
-            
             return True
         except ValueError as e:
             raise BaseCustomException(
@@ -33,14 +33,15 @@ class DatabaseSessionManager:
     Implements connection pooling, performance tracking, and security features.
     """
 
+    # Metrics are plain slot attributes, updated without per-call dict lookups
+    __slots__ = ('_active_sessions', '_peak_sessions', '_total_transactions', '_error_count')
+
     def __init__(self) -> None:
         """Initialize session manager with monitoring capabilities."""
-        self._metrics: Dict[str, Any] = {
-            'active_sessions': 0,
-            'peak_sessions': 0,
-            'total_transactions': 0,
-            'error_count': 0
-        }
+        self._active_sessions = 0
+        self._peak_sessions = 0
+        self._total_transactions = 0
+        self._error_count = 0
 
     def get_session(self, read_only: bool = False) -> DatabaseSession:
         """
@@ -54,21 +55,19 @@ class DatabaseSessionManager:
         """
         try:
             session = DatabaseSession(read_only=read_only)
-            self._metrics['active_sessions'] += 1
-            self._metrics['peak_sessions'] = max(
-                self._metrics['peak_sessions'],
-                self._metrics['active_sessions']
-            )
+            self._active_sessions += 1
+            if self._active_sessions > self._peak_sessions:
+                self._peak_sessions = self._active_sessions
             logger.debug(
                 "Created new database session",
                 extra={
                     'read_only': read_only,
-                    'active_sessions': self._metrics['active_sessions']
+                    'active_sessions': self._active_sessions
                 }
             )
             return session
         except Exception as e:
-            self._metrics['error_count'] += 1
+            self._error_count += 1
             logger.error(f"Failed to create database session: {str(e)}")
             raise
 
@@ -81,14 +80,14 @@ class DatabaseSessionManager:
         """
         try:
             session.__exit__(None, None, None)
-            self._metrics['active_sessions'] -= 1
-            self._metrics['total_transactions'] += 1
+            self._active_sessions -= 1
+            self._total_transactions += 1
             logger.debug(
                 "Closed database session",
-                extra={'active_sessions': self._metrics['active_sessions']}
+                extra={'active_sessions': self._active_sessions}
             )
         except Exception as e:
-            self._metrics['error_count'] += 1
+            self._error_count += 1
             logger.error(f"Failed to close database session: {str(e)}")
             raise
 
@@ -100,12 +99,12 @@ class DatabaseSessionManager:
             Dict[str, Any]: Current performance metrics
         """
         return {
-            'active_sessions': self._metrics['active_sessions'],
-            'peak_sessions': self._metrics['peak_sessions'],
-            'total_transactions': self._metrics['total_transactions'],
+            'active_sessions': self._active_sessions,
+            'peak_sessions': self._peak_sessions,
+            'total_transactions': self._total_transactions,
             'error_rate': (
-                self._metrics['error_count'] / 
-                max(1, self._metrics['total_transactions'])
+                self._error_count / 
+                max(1, self._total_transactions)
             ) * 100
         }
 
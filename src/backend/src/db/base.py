@@ -8,7 +8,9 @@ Version: SQLAlchemy 2.x
 
 import logging
 from typing import Optional
-from sqlalchemy import MetaData, create_engine
+from sqlalchemy import MetaData, create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.pool import QueuePool
 from sqlalchemy.exc import SQLAlchemyError
@@ -25,6 +27,12 @@ DB_ERROR_CODES = {
     'METADATA_ERROR': 'DB005'
 }
 
+# Statement timeout for sub-3s response requirement
+STATEMENT_TIMEOUT = '3000ms'
+
+# Session isolation applied to every connection
+ISOLATION_LEVEL = 'read committed'
+
 # Configure metadata with schema and naming conventions
 metadata = MetaData(
     schema='csai',
@@ -52,8 +60,83 @@ engine = create_engine(
     max_overflow=30,  # Allow additional connections under high load
     pool_timeout=30,  # Connection acquisition timeout
     pool_recycle=1800,  # Recycle connections every 30 minutes
+    query_cache_size=1200,  # Compiled SQL cache entries, sized for all repository statements
+    # Batched writes: executemany INSERTs are folded into multi-VALUES statements
+    # and other executemany statements (UPDATE/DELETE) into execute_batch pages
+    executemany_mode='values_plus_batch',
+    insertmanyvalues_page_size=1000,
+    executemany_batch_page_size=1000,
 )
 
+# Read-replica engine with its own, larger pool so reads neither compete with
+# writes for connections nor load the primary; pre-ping survives replica failover.
+# Without a configured replica, reads share the primary engine.
+if db_settings.replica_url:
+    _read_engine_args = db_settings.get_engine_args()
+    _read_engine_args.update(
+        pool_size=db_settings.replica_pool_size,
+        max_overflow=db_settings.replica_max_overflow,
+        pool_recycle=1800,
+        pool_pre_ping=True
+    )
+    read_engine = create_engine(
+        db_settings.replica_url,
+        query_cache_size=1200,
+        **_read_engine_args
+    )
+else:
+    read_engine = engine
+
+@event.listens_for(engine, 'connect')
+def receive_connect(dbapi_connection, connection_record):
+    """
+    Apply the statement timeout and isolation level once per physical connection,
+    in a single round-trip, rather than per request.
+    Runs in autocommit so the pool's rollback on checkin does not revert the settings.
+    """
+    existing_autocommit = dbapi_connection.autocommit
+    dbapi_connection.autocommit = True
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute(
+            f"SET statement_timeout = '{STATEMENT_TIMEOUT}'; "
+            f"SET SESSION CHARACTERISTICS AS TRANSACTION ISOLATION LEVEL {ISOLATION_LEVEL.upper()}"
+        )
+    finally:
+        cursor.close()
+        dbapi_connection.autocommit = existing_autocommit
+
+if read_engine is not engine:
+    event.listen(read_engine, 'connect', receive_connect)
+
+# Async engine for request handlers; asyncpg applies the statement timeout and
+# isolation level as startup server settings, so pooled connections need no SET at all
+_async_engine_args = db_settings.get_async_engine_args()
+_async_engine_args['connect_args']['server_settings'].update(
+    statement_timeout=STATEMENT_TIMEOUT,
+    default_transaction_isolation=ISOLATION_LEVEL
+)
+async_engine = create_async_engine(
+    db_settings.get_async_connection_url(),
+    query_cache_size=1200,  # Compiled SQL cache entries, sized for all repository statements
+    **_async_engine_args
+)
+
+if db_settings.replica_url:
+    _async_read_engine_args = {
+        **_async_engine_args,
+        'pool_size': db_settings.replica_pool_size,
+        'max_overflow': db_settings.replica_max_overflow,
+        'pool_recycle': 1800
+    }
+    async_read_engine = create_async_engine(
+        make_url(db_settings.replica_url).set(drivername='postgresql+asyncpg'),
+        query_cache_size=1200,
+        **_async_read_engine_args
+    )
+else:
+    async_read_engine = async_engine
+
 def init_models() -> None:
     """
     Initialize all database models and create tables with optimized indexing.
@@ -127,4 +210,7 @@ def get_metadata() -> Optional[MetaData]:
         )
 
 # Export core database components
-__all__ = ['Base', 'metadata', 'engine', 'init_models', 'get_metadata']
\ No newline at end of file
+__all__ = [
+    'Base', 'metadata', 'engine', 'read_engine', 'async_engine', 'async_read_engine',
+    'init_models', 'get_metadata'
+]
\ No newline at end of file
@@ -8,7 +8,8 @@ Author: Customer Success AI Platform Team
 """
 
 import logging
-from typing import Optional, Dict
+from functools import cached_property
+from typing import Optional
 
 from db.repositories.users import UserRepository
 from db.repositories.customers import CustomerRepository
@@ -26,22 +27,31 @@ class RepositoryFactory:
     """
     Factory class providing centralized access to all repository instances
     with connection pooling and performance optimization.
+
+    Repositories are created on first access and then stored on the instance,
+    so later accesses are plain attribute lookups. RiskRepository is synchronous
+    and is built from its own blocking session and Redis client; the others share
+    the AsyncSession and redis.asyncio client.
     """
 
-    def __init__(self, db_session, cache_client=None):
+    _REPOSITORY_NAMES = ('users', 'customers', 'playbooks', 'risk')
+
+    def __init__(self, db_session, cache_client=None, sync_db_session=None, sync_cache_client=None):
         """
-        Initialize repository factory with database session and optional cache client.
+        Initialize repository factory with database sessions and optional cache clients.
 
         Args:
-            db_session: SQLAlchemy database session
-            cache_client: Optional Redis cache client for performance optimization
+            db_session: SQLAlchemy AsyncSession for the asynchronous repositories
+            cache_client: Optional redis.asyncio client for performance optimization
+            sync_db_session: SQLAlchemy Session for RiskRepository
+            sync_cache_client: Synchronous Redis client for RiskRepository
         """
         self._db = db_session
         self._cache = cache_client
-        self._repositories: Dict = {}
+        self._sync_db = sync_db_session
+        self._sync_cache = sync_cache_client
         
-        # Configure session timeout for sub-3s response requirement
-        self._db.execute("SET statement_timeout = '3000ms'")
+        # Statement timeout is applied per pooled connection in db.base
         
         logger.info(
             "Repository factory initialized",
@@ -51,7 +61,7 @@ class RepositoryFactory:
             }
         )
 
-    @property
+    @cached_property
     def users(self) -> UserRepository:
         """
         Get or create UserRepository instance with connection pooling.
@@ -59,14 +69,12 @@ class RepositoryFactory:
         Returns:
             UserRepository: Repository for user data operations
         """
-        if 'users' not in self._repositories:
-            self._repositories['users'] = UserRepository(
-                db_session=self._db,
-                cache_client=self._cache
-            )
-        return self._repositories['users']
-
-    @property
+        return UserRepository(
+            db_session=self._db,
+            cache_client=self._cache
+        )
+
+    @cached_property
     def customers(self) -> CustomerRepository:
         """
         Get or create CustomerRepository instance with risk assessment integration.
@@ -74,14 +82,12 @@ class RepositoryFactory:
         Returns:
             CustomerRepository: Repository for customer data operations
         """
-        if 'customers' not in self._repositories:
-            self._repositories['customers'] = CustomerRepository(
-                db_session=self._db,
-                cache_client=self._cache
-            )
-        return self._repositories['customers']
-
-    @property
+        return CustomerRepository(
+            db_session=self._db,
+            cache_client=self._cache
+        )
+
+    @cached_property
     def playbooks(self) -> PlaybookRepository:
         """
         Get or create PlaybookRepository instance with workflow automation support.
@@ -89,44 +95,51 @@ class RepositoryFactory:
         Returns:
             PlaybookRepository: Repository for playbook operations
         """
-        if 'playbooks' not in self._repositories:
-            self._repositories['playbooks'] = PlaybookRepository(
-                db_session=self._db,
-                cache_client=self._cache
-            )
-        return self._repositories['playbooks']
-
-    @property
+        return PlaybookRepository(
+            db_session=self._db,
+            cache_client=self._cache
+        )
+
+    @cached_property
     def risk(self) -> RiskRepository:
         """
         Get or create RiskRepository instance with ML model integration.
         
         Returns:
             RiskRepository: Repository for risk assessment operations
+
+        Raises:
+            ValueError: If the factory has no synchronous session or Redis client
         """
-        if 'risk' not in self._repositories:
-            self._repositories['risk'] = RiskRepository(
-                db_session=self._db,
-                cache_client=self._cache
-            )
-        return self._repositories['risk']
-
-    def cleanup(self) -> None:
+        if self._sync_db is None or self._sync_cache is None:
+            raise ValueError("RiskRepository requires a synchronous session and Redis client")
+
+        return RiskRepository(
+            db_session=self._sync_db,
+            cache_client=self._sync_cache
+        )
+
+    async def cleanup(self) -> None:
         """
         Cleanup repository connections and cache clients.
         Should be called when shutting down the application.
         """
         try:
             # Clear all repository instances
-            self._repositories.clear()
+            for name in self._REPOSITORY_NAMES:
+                self.__dict__.pop(name, None)
             
-            # Close database session
+            # Close database sessions
             if self._db:
-                self._db.close()
+                await self._db.close()
+            if self._sync_db:
+                self._sync_db.close()
             
-            # Close cache connection if exists
+            # Close cache connections if they exist
             if self._cache:
-                self._cache.close()
+                await self._cache.close()
+            if self._sync_cache:
+                self._sync_cache.close()
                 
             logger.info("Repository factory cleanup completed successfully")
             
@@ -0,0 +1,115 @@
+"""
+Versioned MessagePack encoding of ORM column values for Redis cache entries.
+Shared by the synchronous repositories that cache whole model rows.
+
+Version: 1.0.0
+"""
+
+import uuid
+from datetime import datetime
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type
+
+import msgspec  # v0.18.4
+from sqlalchemy import DateTime, Enum, Numeric
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm.attributes import set_committed_value
+
+# Leading byte of current cache values; untagged (legacy JSON) entries decode as misses
+CACHE_FORMAT_TAG = b"\x01"
+
+_encoder = msgspec.msgpack.Encoder()
+_decoder = msgspec.msgpack.Decoder()
+
+def _to_datetime(value: Any) -> datetime:
+    """Timezone-aware values round-trip natively; naive ones come back as strings."""
+    return datetime.fromisoformat(value) if isinstance(value, str) else value
+
+@lru_cache(maxsize=None)
+def _restorers(model: Type) -> Tuple[Tuple[str, Callable[[Any], Any]], ...]:
+    """Map the model's columns whose values need converting back after decoding."""
+    restorers = []
+    for column in model.__table__.columns:
+        if isinstance(column.type, DateTime):
+            restorers.append((column.key, _to_datetime))
+        elif isinstance(column.type, UUID):
+            restorers.append((column.key, uuid.UUID))
+        elif isinstance(column.type, Enum) and column.type.enum_class:
+            restorers.append((column.key, column.type.enum_class))
+        elif isinstance(column.type, Numeric) and column.type.asdecimal:
+            restorers.append((column.key, Decimal))
+    return tuple(restorers)
+
+def _column_values(instance: Any) -> Dict[str, Any]:
+    """Collect an instance's column values keyed by attribute name."""
+    return {column.key: getattr(instance, column.key) for column in instance.__table__.columns}
+
+def _rebuild(model: Type, values: Dict[str, Any]) -> Any:
+    """Restore converted values and populate a detached instance without constructors."""
+    for key, restore in _restorers(model):
+        if values.get(key) is not None:
+            values[key] = restore(values[key])
+
+    instance = model.__mapper__.class_manager.new_instance()
+    for key, value in values.items():
+        set_committed_value(instance, key, value)
+    return instance
+
+def encode_model(instance: Any) -> bytes:
+    """
+    Serialize an instance's column values to a tagged MessagePack buffer.
+
+    Args:
+        instance: Mapped instance with all columns loaded
+
+    Returns:
+        bytes: Cache value
+    """
+    return CACHE_FORMAT_TAG + _encoder.encode(_column_values(instance))
+
+def encode_models(instances: Iterable[Any]) -> bytes:
+    """
+    Serialize a sequence of instances to one tagged MessagePack buffer.
+
+    Args:
+        instances: Mapped instances with all columns loaded
+
+    Returns:
+        bytes: Cache value
+    """
+    return CACHE_FORMAT_TAG + _encoder.encode([_column_values(instance) for instance in instances])
+
+def decode_model(model: Type, data: bytes) -> Optional[Any]:
+    """
+    Rebuild a detached instance from an encode_model buffer.
+    Values were validated when stored, so constructors and validators are not re-run.
+
+    Args:
+        model: Mapped class the buffer was produced from
+        data: Cache value
+
+    Returns:
+        Optional[Any]: Rebuilt instance, or None for entries in an older format
+    """
+    if not data.startswith(CACHE_FORMAT_TAG):
+        return None
+
+    return _rebuild(model, _decoder.decode(memoryview(data)[len(CACHE_FORMAT_TAG):]))
+
+def decode_models(model: Type, data: bytes) -> Optional[List[Any]]:
+    """
+    Rebuild detached instances from an encode_models buffer, preserving order.
+
+    Args:
+        model: Mapped class the buffer was produced from
+        data: Cache value
+
+    Returns:
+        Optional[List[Any]]: Rebuilt instances, or None for entries in an older format
+    """
+    if not data.startswith(CACHE_FORMAT_TAG):
+        return None
+
+    rows = _decoder.decode(memoryview(data)[len(CACHE_FORMAT_TAG):])
+    return [_rebuild(model, values) for values in rows]
@@ -5,40 +5,134 @@ Provides optimized query performance, caching, and security measures for custome
 Version: SQLAlchemy 2.x
 """
 
+import asyncio
+import hashlib
 import logging
-from typing import Dict, List, Optional, Union
+import os
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
 from uuid import UUID
-import json
 
-from sqlalchemy import select, update, delete, and_, or_, desc
-from sqlalchemy.orm import Session
+import msgpack  # v1.0.5
+from sqlalchemy import Integer, Select, bindparam, insert, select, update, delete, and_, or_, desc
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
 
 from models.customer import Customer
 from db.session import get_db
-from core.exceptions import BaseCustomException
+from db.repositories.loader import BatchLoader
+from db.repositories.local_cache import INVALIDATION_CHANNEL, local_cache
+from core.exceptions import BaseCustomException, DataValidationError
 
 # Configure module logger
 logger = logging.getLogger(__name__)
 
 # Constants
 CACHE_TTL = 300  # 5 minutes cache TTL
+NEGATIVE_CACHE_TTL = 30  # Unknown ids are remembered briefly
+CACHE_MISS_SENTINEL = b"\x00MISS"  # Cached in place of ids with no live row
+LIST_CACHE_TTL = 60  # List results tolerate brief staleness
+MAX_PAGE_SIZE = 500  # Larger result sets go through stream_all
+STREAM_BATCH_SIZE = 200  # Rows fetched per round-trip when streaming
+LIST_VERSION_KEY = "customers:list:version"  # Bumped on every write to retire cached lists
 MAX_RETRY_ATTEMPTS = 3
 DEFAULT_RISK_THRESHOLD = 80.0
 
+# Overlap the cache lookup with the database query on get_by_id; trades extra
+# database load on cache hits for lower latency on misses
+CACHE_DB_PREFETCH = os.getenv('CACHE_DB_PREFETCH', 'false').lower() == 'true'
+
+# Reusable id lookup, built once so only its parameter varies per call
+_GET_CUSTOMER_BY_ID = select(Customer).where(
+    and_(
+        Customer.id == bindparam('customer_id'),
+        Customer.is_deleted == False
+    )
+)
+
+@lru_cache(maxsize=32)
+def _active_customers(
+    columns: Tuple,
+    by_name: bool,
+    by_health: bool,
+    by_risk: bool,
+    paginated: bool
+) -> Select:
+    """
+    Build the active customer statement for one combination of filters.
+    Filter values and paging are bind parameters, so each combination is built once.
+    """
+    query = select(*columns) if columns else select(Customer)
+    query = query.where(Customer.is_deleted == False)
+    if by_name:
+        query = query.where(Customer.name.ilike(bindparam('name_pattern')))
+    if by_health:
+        query = query.where(Customer.health_score >= bindparam('min_health_score'))
+    if by_risk:
+        query = query.where(Customer.risk_score <= bindparam('max_risk_score'))
+    if paginated:
+        query = query.offset(bindparam('skip', type_=Integer)).limit(
+            bindparam('limit', type_=Integer)
+        )
+    return query
+
+# Cache fills in progress in this process, keyed by cache key. Repositories are
+# request-scoped, so the table is shared at module level; waiters receive the
+# leader's cache payload rather than its session-bound instance.
+_INFLIGHT_FILLS: Dict[str, asyncio.Future] = {}
+
+def customer_cache_key(customer_id: UUID) -> str:
+    """Build the cache key for a customer; UUID.hex skips the dashed canonical format."""
+    return f"customer:{customer_id.hex}"
+
+# Columns update() may assign; identity and creation audit fields are fixed
+_UPDATABLE_COLUMNS = frozenset(
+    column.key for column in Customer.__table__.columns
+) - {'id', 'created_at'}
+
+@dataclass(frozen=True)
+class CustomerSummary:
+    """Lightweight customer row for list views, loaded without ORM hydration."""
+    id: UUID
+    name: str
+    health_score: float
+    risk_score: float
+
+def _default(obj: Any) -> Any:
+    """Convert values MessagePack cannot encode natively."""
+    if isinstance(obj, UUID):
+        return str(obj)
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError(f"Cannot serialize {type(obj).__name__} for cache")
+
+def _encode(obj: Dict) -> bytes:
+    """Serialize a cache payload to MessagePack."""
+    return msgpack.packb(obj, use_bin_type=True, default=_default)
+
+def _decode(buf: bytes) -> Dict:
+    """Deserialize a MessagePack cache payload."""
+    return msgpack.unpackb(buf, raw=False)
+
 class CustomerRepository:
     """Repository implementing optimized data access patterns for customer entities with caching and security."""
 
-    def __init__(self, db_session: Session, cache_client=None):
+    def __init__(self, db_session: AsyncSession, cache_client=None):
         """
         Initialize repository with database session and cache configuration.
         
         Args:
-            db_session: SQLAlchemy session
+            db_session: SQLAlchemy async session
             cache_client: Redis cache client (optional)
         """
         self.db = db_session
         self.cache = cache_client
+        self._loader = BatchLoader(self._fetch_many)
         self._setup_logging()
 
     def _setup_logging(self):
@@ -47,43 +141,146 @@ class CustomerRepository:
 
     def _get_cache_key(self, customer_id: UUID) -> str:
         """Generate cache key for customer data."""
-        return f"customer:{str(customer_id)}"
+        return customer_cache_key(customer_id)
 
     async def get_by_id(self, customer_id: UUID) -> Optional[Customer]:
         """
         Retrieve customer by ID with caching.
         
+        Concurrent lookups within a request are coalesced into one cache MGET
+        and one database query.
+        
         Args:
             customer_id: UUID of customer to retrieve
             
         Returns:
             Optional[Customer]: Customer if found, None otherwise
         """
+        return await self._loader.load(customer_id)
+
+    async def _fetch_many(self, customer_ids: List[UUID]) -> Dict[UUID, Customer]:
+        """
+        Fetch a batch of customers, serving cache hits and querying the rest at once.
+        
+        Args:
+            customer_ids: UUIDs of customers to retrieve
+            
+        Returns:
+            Dict[UUID, Customer]: Found customers keyed by ID
+        """
+        if len(customer_ids) == 1:
+            customer_id = customer_ids[0]
+            return {customer_id: await self._fetch_by_id(customer_id)}
+
         try:
-            # Check cache first
-            if self.cache:
-                cache_key = self._get_cache_key(customer_id)
-                cached_data = await self.cache.get(cache_key)
-                if cached_data:
-                    return Customer(**json.loads(cached_data))
+            found = {}
+            misses = customer_ids
 
-            # Query database with optimized join
-            query = select(Customer).where(
-                and_(
-                    Customer.id == customer_id,
-                    Customer.is_deleted == False
+            if self.cache:
+                # Serve what the in-process tier holds, then the rest with a single MGET
+                keys = {customer_id: self._get_cache_key(customer_id) for customer_id in customer_ids}
+                remote = []
+                for customer_id, cache_key in keys.items():
+                    local = local_cache.get(cache_key)
+                    if local is None:
+                        remote.append(customer_id)
+                    elif local != CACHE_MISS_SENTINEL:
+                        found[customer_id] = Customer.from_cache(local)
+
+                misses = []
+                if remote:
+                    cached = await self.cache.mget([keys[customer_id] for customer_id in remote])
+                    for customer_id, cached_data in zip(remote, cached):
+                        if not cached_data:
+                            misses.append(customer_id)
+                            continue
+                        local_cache.set(keys[customer_id], cached_data)
+                        if cached_data != CACHE_MISS_SENTINEL:
+                            found[customer_id] = Customer.from_cache(cached_data)
+
+            if misses:
+                query = select(Customer).where(
+                    and_(
+                        Customer.id.in_(misses),
+                        Customer.is_deleted == False
+                    )
                 )
-            ).execution_options(populate_existing=True)
 
-            result = self.db.execute(query).scalar_one_or_none()
+                async with self._read_session() as session:
+                    customers = (await session.execute(query)).scalars().all()
+
+                found.update((customer.id, customer) for customer in customers)
+
+                # Cache fetched customers and unknown ids in one round-trip
+                if self.cache:
+                    pipe = self.cache.pipeline(transaction=False)
+                    for customer in customers:
+                        payload = customer.to_cache()
+                        pipe.setex(keys[customer.id], CACHE_TTL, payload)
+                        local_cache.set(keys[customer.id], payload)
+                    for customer_id in misses:
+                        if customer_id not in found:
+                            pipe.setex(keys[customer_id], NEGATIVE_CACHE_TTL, CACHE_MISS_SENTINEL)
+                            local_cache.set(keys[customer_id], CACHE_MISS_SENTINEL)
+                    await pipe.execute()
+
+            return found
 
-            # Update cache if found
-            if result and self.cache:
-                await self.cache.set(
+        except SQLAlchemyError as e:
+            self.logger.error(f"Error retrieving customers {customer_ids}: {str(e)}")
+            raise BaseCustomException(
+                message=f"Failed to retrieve customer: {str(e)}",
+                error_code="CUST001"
+            )
+
+    async def _fetch_by_id(self, customer_id: UUID) -> Optional[Customer]:
+        """Retrieve a single customer from cache or database."""
+        try:
+            params = {'customer_id': customer_id}
+
+            if self.cache:
+                # Serve from the in-process tier without a Redis round-trip
+                cache_key = self._get_cache_key(customer_id)
+                local = local_cache.get(cache_key)
+                if local is not None:
+                    return None if local == CACHE_MISS_SENTINEL else Customer.from_cache(local)
+
+            if self.cache and CACHE_DB_PREFETCH:
+                # Start the query alongside the cache lookup; a hit abandons it
+                db_task = asyncio.create_task(self._select_one_detached(params))
+                cached_data = await self.cache.get(cache_key)
+                if cached_data:
+                    db_task.cancel()
+                    local_cache.set(cache_key, cached_data)
+                    if cached_data == CACHE_MISS_SENTINEL:
+                        return None
+                    return Customer.from_cache(cached_data)
+
+                result = await db_task
+                if result:
+                    result = await self.db.merge(result, load=False)
+            else:
+                # Check cache first
+                if self.cache:
+                    cached_data = await self.cache.get(cache_key)
+                    if not cached_data:
+                        return await self._fill_single_flight(cache_key, params)
+                    local_cache.set(cache_key, cached_data)
+                    if cached_data == CACHE_MISS_SENTINEL:
+                        return None
+                    return Customer.from_cache(cached_data)
+
+                result = (await self.db.execute(_GET_CUSTOMER_BY_ID, params)).scalar_one_or_none()
+
+            # Update cache, remembering unknown ids briefly
+            if self.cache:
+                payload = result.to_cache() if result else CACHE_MISS_SENTINEL
+                await self.cache.setex(
                     cache_key,
-                    json.dumps(result.to_dict()),
-                    expire=CACHE_TTL
+                    CACHE_TTL if result else NEGATIVE_CACHE_TTL,
+                    payload
                 )
+                local_cache.set(cache_key, payload)
 
             return result
 
@@ -94,6 +291,99 @@ class CustomerRepository:
                 error_code="CUST001"
             )
 
+    async def _fill_single_flight(self, cache_key: str, params: Dict) -> Optional[Customer]:
+        """
+        Load a customer after a cache miss, sharing one query among concurrent misses.
+
+        The first caller for a key queries and refills the cache; callers arriving
+        while that fill is running wait for its payload instead of querying again.
+
+        Args:
+            cache_key: Cache key that missed
+            params: Bind parameters for the id lookup
+
+        Returns:
+            Optional[Customer]: Customer if found, None otherwise
+        """
+        pending = _INFLIGHT_FILLS.get(cache_key)
+        if pending is not None:
+            payload = await asyncio.shield(pending)
+            return Customer.from_cache(payload) if payload else None
+
+        pending = _INFLIGHT_FILLS[cache_key] = asyncio.get_running_loop().create_future()
+        try:
+            async with self._read_session() as session:
+                result = (await session.execute(_GET_CUSTOMER_BY_ID, params)).scalar_one_or_none()
+            payload = result.to_cache() if result else None
+            if payload:
+                await self.cache.setex(cache_key, CACHE_TTL, payload)
+            else:
+                await self.cache.setex(cache_key, NEGATIVE_CACHE_TTL, CACHE_MISS_SENTINEL)
+            local_cache.set(cache_key, payload or CACHE_MISS_SENTINEL)
+            pending.set_result(payload)
+            return result
+        except Exception as e:
+            pending.set_exception(e)
+            # Waiters re-raise it; mark it retrieved in case there are none
+            pending.exception()
+            raise
+        finally:
+            if not pending.done():
+                pending.cancel()
+            _INFLIGHT_FILLS.pop(cache_key, None)
+
+    def _read_session(self) -> AsyncSession:
+        """
+        Open a short-lived session for a read ahead of cache writes.
+        Its pooled connection is returned when the block exits, not held by
+        self.db across the awaited cache round-trips that follow.
+        """
+        return AsyncSession(self.db.bind)
+
+    async def _select_one_detached(self, params: Dict) -> Optional[Customer]:
+        """
+        Run the id lookup on a short-lived session of its own.
+        Lets the query overlap the cache lookup without concurrent use of self.db.
+        """
+        async with self._read_session() as session:
+            return (await session.execute(_GET_CUSTOMER_BY_ID, params)).scalar_one_or_none()
+
+    async def _write_cache(self, customer_id: UUID, customer: Optional[Customer] = None) -> None:
+        """
+        Apply the cache mutations for one customer write in a single round-trip.
+        
+        Args:
+            customer_id: UUID of the written customer
+            customer: Customer to store; its entry is dropped when omitted
+        """
+        pipe = self.cache.pipeline(transaction=False)
+        cache_key = self._get_cache_key(customer_id)
+        if customer is not None:
+            pipe.setex(cache_key, CACHE_TTL, customer.to_cache())
+        else:
+            pipe.delete(cache_key)
+        pipe.incr(LIST_VERSION_KEY)
+        # Drop in-process copies here and, through the channel, in every worker
+        pipe.publish(INVALIDATION_CHANNEL, cache_key)
+        local_cache.invalidate(cache_key)
+        await pipe.execute()
+
+    async def _list_cache_key(self, *parts: Any) -> str:
+        """Build a list result cache key scoped to the current list generation."""
+        version = await self.cache.get(LIST_VERSION_KEY)
+        digest = hashlib.blake2b(
+            msgpack.packb((version, *parts), use_bin_type=True),
+            digest_size=16
+        ).hexdigest()
+        return f"customers:list:{digest}"
+
+    async def _load_many(self, customer_ids: List[str]) -> List[Customer]:
+        """Load customers listed in a cached result, skipping any removed since."""
+        customers = await asyncio.gather(
+            *(self._loader.load(UUID(customer_id)) for customer_id in customer_ids)
+        )
+        return [customer for customer in customers if customer is not None]
+
     async def get_all(
         self,
         skip: int = 0,
@@ -110,34 +400,41 @@ class CustomerRepository:
             
         Returns:
             List[Customer]: Filtered and paginated customer list
+            
+        Raises:
+            DataValidationError: If limit exceeds MAX_PAGE_SIZE
         """
+        if limit > MAX_PAGE_SIZE:
+            raise DataValidationError(
+                message=f"Page size exceeds maximum of {MAX_PAGE_SIZE}; use stream_all",
+                validation_errors={'limit': [f"must be at most {MAX_PAGE_SIZE}"]}
+            )
+
         try:
-            # Build base query
-            query = select(Customer).where(Customer.is_deleted == False)
-
-            # Apply filters
-            if filters:
-                filter_conditions = []
-                if filters.get("name"):
-                    filter_conditions.append(
-                        Customer.name.ilike(f"%{filters['name']}%")
-                    )
-                if filters.get("min_health_score"):
-                    filter_conditions.append(
-                        Customer.health_score >= filters["min_health_score"]
-                    )
-                if filters.get("max_risk_score"):
-                    filter_conditions.append(
-                        Customer.risk_score <= filters["max_risk_score"]
-                    )
-                if filter_conditions:
-                    query = query.where(and_(*filter_conditions))
+            # Serve repeated pages from the list cache
+            list_key = None
+            if self.cache:
+                list_key = await self._list_cache_key(
+                    'all', skip, limit, sorted((filters or {}).items())
+                )
+                cached_data = await self.cache.get(list_key)
+                if cached_data:
+                    return await self._load_many(_decode(cached_data)['ids'])
 
             # Apply pagination
-            query = query.offset(skip).limit(limit)
+            query, params = self._filtered_query(filters, paginated=True)
+            params.update(skip=skip, limit=limit)
 
             # Execute optimized query
-            result = self.db.execute(query).scalars().all()
+            async with self._read_session() as session:
+                result = (await session.execute(query, params)).scalars().all()
+
+            if list_key:
+                await self.cache.setex(
+                    list_key,
+                    LIST_CACHE_TTL,
+                    _encode({'ids': [customer.id for customer in result]})
+                )
             return result
 
         except SQLAlchemyError as e:
@@ -147,6 +444,101 @@ class CustomerRepository:
                 error_code="CUST002"
             )
 
+    async def stream_all(self, filters: Dict = None) -> AsyncIterator[Customer]:
+        """
+        Stream all matching customers without materializing the result set.
+        
+        Args:
+            filters: Dictionary of filter conditions
+            
+        Yields:
+            Customer: Matching customers, fetched in batches of STREAM_BATCH_SIZE
+        """
+        query, params = self._filtered_query(filters)
+        try:
+            result = await self.db.stream(
+                query,
+                params,
+                execution_options={'yield_per': STREAM_BATCH_SIZE}
+            )
+            async for customer in result.scalars():
+                yield customer
+
+        except SQLAlchemyError as e:
+            self.logger.error(f"Error streaming customers: {str(e)}")
+            raise BaseCustomException(
+                message=f"Failed to retrieve customers: {str(e)}",
+                error_code="CUST002"
+            )
+
+    async def get_summaries(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Dict = None
+    ) -> List[CustomerSummary]:
+        """
+        Retrieve customer summaries for list views, selecting only summary columns.
+        
+        Args:
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+            filters: Dictionary of filter conditions
+            
+        Returns:
+            List[CustomerSummary]: Filtered and paginated customer summaries
+        """
+        try:
+            query, params = self._filtered_query(
+                filters,
+                Customer.id,
+                Customer.name,
+                Customer.health_score,
+                Customer.risk_score,
+                paginated=True
+            )
+            params.update(skip=skip, limit=limit)
+
+            async with self._read_session() as session:
+                rows = (await session.execute(query, params)).all()
+            return [CustomerSummary(*row) for row in rows]
+
+        except SQLAlchemyError as e:
+            self.logger.error(f"Error retrieving customer summaries: {str(e)}")
+            raise BaseCustomException(
+                message=f"Failed to retrieve customers: {str(e)}",
+                error_code="CUST002"
+            )
+
+    def _filtered_query(
+        self,
+        filters: Optional[Dict],
+        *columns,
+        paginated: bool = False
+    ) -> Tuple[Select, Dict]:
+        """
+        Resolve the active customer statement and bind parameters for the given filters.
+        Selects the given columns, or whole Customer entities when none are given.
+        Paginated statements additionally expect 'skip' and 'limit' parameters.
+        """
+        filters = filters or {}
+        params = {}
+        if filters.get("name"):
+            params['name_pattern'] = f"%{filters['name']}%"
+        if filters.get("min_health_score"):
+            params['min_health_score'] = filters["min_health_score"]
+        if filters.get("max_risk_score"):
+            params['max_risk_score'] = filters["max_risk_score"]
+
+        query = _active_customers(
+            columns,
+            'name_pattern' in params,
+            'min_health_score' in params,
+            'max_risk_score' in params,
+            paginated
+        )
+        return query, params
+
     async def get_at_risk(
         self,
         risk_threshold: float = DEFAULT_RISK_THRESHOLD
@@ -161,6 +553,14 @@ class CustomerRepository:
             List[Customer]: List of at-risk customers
         """
         try:
+            # Serve repeated lookups from the list cache
+            list_key = None
+            if self.cache:
+                list_key = await self._list_cache_key('at_risk', risk_threshold)
+                cached_data = await self.cache.get(list_key)
+                if cached_data:
+                    return await self._load_many(_decode(cached_data)['ids'])
+
             query = select(Customer).where(
                 and_(
                     Customer.is_deleted == False,
@@ -168,7 +568,15 @@ class CustomerRepository:
                 )
             ).order_by(desc(Customer.risk_score))
 
-            result = self.db.execute(query).scalars().all()
+            async with self._read_session() as session:
+                result = (await session.execute(query)).scalars().all()
+
+            if list_key:
+                await self.cache.setex(
+                    list_key,
+                    LIST_CACHE_TTL,
+                    _encode({'ids': [customer.id for customer in result]})
+                )
             return result
 
         except SQLAlchemyError as e:
@@ -192,30 +600,83 @@ class CustomerRepository:
             # Create customer instance
             customer = Customer(**customer_data)
             
-            # Add to database
+            # Add to database; detach after the flush so commit does not expire
+            # the inserted state and no refresh SELECT is needed
             self.db.add(customer)
-            self.db.commit()
-            self.db.refresh(customer)
+            await self.db.flush()
+            self.db.expunge(customer)
+            await self.db.commit()
 
             # Update cache
             if self.cache:
-                cache_key = self._get_cache_key(customer.id)
-                await self.cache.set(
-                    cache_key,
-                    json.dumps(customer.to_dict()),
-                    expire=CACHE_TTL
-                )
+                await self._write_cache(customer.id, customer)
 
             return customer
 
         except SQLAlchemyError as e:
-            self.db.rollback()
+            await self.db.rollback()
             self.logger.error(f"Error creating customer: {str(e)}")
             raise BaseCustomException(
                 message=f"Failed to create customer: {str(e)}",
                 error_code="CUST004"
             )
 
+    async def create_many(self, rows: List[Dict]) -> List[Customer]:
+        """
+        Create customers in bulk with batched INSERT ... RETURNING statements.
+        
+        Args:
+            rows: Dictionaries containing customer data
+            
+        Returns:
+            List[Customer]: Created customers, detached from the session
+        """
+        if not rows:
+            return []
+
+        # Run model construction and validators before touching the database
+        customers = [Customer(**row) for row in rows]
+        values = [
+            {
+                column.key: getattr(customer, column.key)
+                for column in Customer.__table__.columns
+                if getattr(customer, column.key) is not None
+            }
+            for customer in customers
+        ]
+
+        try:
+            created = (
+                await self.db.scalars(insert(Customer).returning(Customer), values)
+            ).all()
+
+            # Detach so commit does not expire the values RETURNING loaded
+            for customer in created:
+                self.db.expunge(customer)
+            await self.db.commit()
+
+            # Prime the cache for the whole batch in one round-trip
+            if self.cache:
+                pipe = self.cache.pipeline(transaction=False)
+                for customer in created:
+                    cache_key = self._get_cache_key(customer.id)
+                    pipe.setex(cache_key, CACHE_TTL, customer.to_cache())
+                    # Workers may hold a not-found entry for the new id
+                    pipe.publish(INVALIDATION_CHANNEL, cache_key)
+                    local_cache.invalidate(cache_key)
+                pipe.incr(LIST_VERSION_KEY)
+                await pipe.execute()
+
+            return created
+
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            self.logger.error(f"Error creating {len(rows)} customers: {str(e)}")
+            raise BaseCustomException(
+                message=f"Failed to create customers: {str(e)}",
+                error_code="CUST004"
+            )
+
     async def update(
         self,
         customer_id: UUID,
@@ -240,28 +701,27 @@ class CustomerRepository:
                 )
             ).with_for_update()
 
-            customer = self.db.execute(query).scalar_one_or_none()
+            customer = (await self.db.execute(query)).scalar_one_or_none()
             if not customer:
                 return None
 
             # Apply updates
-            for key, value in update_data.items():
-                if hasattr(customer, key):
-                    setattr(customer, key, value)
+            for key in update_data.keys() & _UPDATABLE_COLUMNS:
+                setattr(customer, key, update_data[key])
 
-            # Commit changes
-            self.db.commit()
-            self.db.refresh(customer)
+            # Flush, then detach so commit keeps the updated state without a refresh
+            await self.db.flush()
+            self.db.expunge(customer)
+            await self.db.commit()
 
             # Invalidate cache
             if self.cache:
-                cache_key = self._get_cache_key(customer_id)
-                await self.cache.delete(cache_key)
+                await self._write_cache(customer_id)
 
             return customer
 
         except SQLAlchemyError as e:
-            self.db.rollback()
+            await self.db.rollback()
             self.logger.error(f"Error updating customer {customer_id}: {str(e)}")
             raise BaseCustomException(
                 message=f"Failed to update customer: {str(e)}",
@@ -287,18 +747,17 @@ class CustomerRepository:
                 )
             ).values(is_deleted=True)
 
-            result = self.db.execute(query)
-            self.db.commit()
+            result = await self.db.execute(query)
+            await self.db.commit()
 
             # Remove from cache
             if self.cache:
-                cache_key = self._get_cache_key(customer_id)
-                await self.cache.delete(cache_key)
+                await self._write_cache(customer_id)
 
             return result.rowcount > 0
 
         except SQLAlchemyError as e:
-            self.db.rollback()
+            await self.db.rollback()
             self.logger.error(f"Error deleting customer {customer_id}: {str(e)}")
             raise BaseCustomException(
                 message=f"Failed to delete customer: {str(e)}",
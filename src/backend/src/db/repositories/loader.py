@@ -0,0 +1,66 @@
+"""
+Request-scoped batch loading for repository lookups by id.
+Coalesces concurrent single-id lookups into one batched cache and database fetch.
+
+Version: 1.0.0
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional
+
+class BatchLoader:
+    """
+    DataLoader-style coalescing of lookups issued within the same event loop tick.
+
+    Every load() call made before the loop next runs its ready callbacks joins one
+    batch, and the batch function is called once with all distinct keys. Loaders
+    hold per-request state and must not be shared across requests.
+    """
+
+    def __init__(self, batch_fn: Callable[[List[Hashable]], Awaitable[Dict[Hashable, Any]]]):
+        """
+        Initialize loader with the batch fetch function.
+
+        Args:
+            batch_fn: Coroutine function mapping a list of keys to a dict of found values
+        """
+        self._batch_fn = batch_fn
+        self._pending: Dict[Hashable, asyncio.Future] = {}
+
+    async def load(self, key: Hashable) -> Optional[Any]:
+        """
+        Load a value by key, batched with other loads in the same tick.
+
+        Args:
+            key: Key to load
+
+        Returns:
+            Optional[Any]: Loaded value, or None if the batch did not find it
+        """
+        future = self._pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            if not self._pending:
+                # First key of a new batch; dispatch after the current tick
+                loop.call_soon(self._dispatch)
+            future = self._pending[key] = loop.create_future()
+        return await asyncio.shield(future)
+
+    def _dispatch(self) -> None:
+        """Hand the pending batch to a task and start collecting a new one."""
+        batch, self._pending = self._pending, {}
+        asyncio.ensure_future(self._resolve(batch))
+
+    async def _resolve(self, batch: Dict[Hashable, asyncio.Future]) -> None:
+        """Run the batch function and settle every future in the batch."""
+        try:
+            results = await self._batch_fn(list(batch))
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for key, future in batch.items():
+            if not future.done():
+                future.set_result(results.get(key))
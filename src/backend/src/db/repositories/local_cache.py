@@ -0,0 +1,82 @@
+"""
+Per-process cache tier in front of Redis for hot repository lookups by id.
+Keeps serialized payloads for a short TTL and drops them when any worker
+publishes an invalidation.
+
+Version: 1.0.0
+"""
+
+import asyncio
+import logging
+from typing import Optional
+
+from cachetools import TTLCache  # v5.3.0
+from redis.exceptions import RedisError
+
+# Configure module logger
+logger = logging.getLogger(__name__)
+
+# Channel every worker publishes changed cache keys on
+INVALIDATION_CHANNEL = "cache:invalidate"
+
+LOCAL_CACHE_SIZE = 10_000  # Entries held per process
+LOCAL_CACHE_TTL = 30  # Upper bound on staleness if an invalidation is missed
+RESUBSCRIBE_DELAY = 1.0  # Seconds between reconnection attempts
+
+class LocalCache:
+    """
+    Short-lived in-process copies of Redis entries, keyed by cache key.
+
+    Values are the serialized payloads stored in Redis, never ORM instances, so no
+    session-bound state is shared between requests. Writers publish the keys they
+    change on INVALIDATION_CHANNEL and listen() drops the local copies.
+    """
+
+    def __init__(self, maxsize: int = LOCAL_CACHE_SIZE, ttl: float = LOCAL_CACHE_TTL):
+        """
+        Initialize the local tier.
+
+        Args:
+            maxsize: Maximum number of entries kept
+            ttl: Seconds an entry may be served before it expires
+        """
+        self._entries = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the local payload for a cache key, if present and fresh."""
+        return self._entries.get(key)
+
+    def set(self, key: str, payload: bytes) -> None:
+        """Keep a payload just read from or written to Redis."""
+        self._entries[key] = payload
+
+    def invalidate(self, key: str) -> None:
+        """Drop the local payload for a cache key."""
+        self._entries.pop(key, None)
+
+    async def listen(self, redis_client) -> None:
+        """
+        Drop entries as invalidations are published; run as one task per process.
+
+        While disconnected, invalidations may be missed, so the tier is cleared
+        before resubscribing.
+
+        Args:
+            redis_client: Async Redis client to subscribe with
+        """
+        while True:
+            pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(INVALIDATION_CHANNEL)
+                async for message in pubsub.listen():
+                    key = message['data']
+                    self.invalidate(key.decode() if isinstance(key, bytes) else key)
+            except RedisError as e:
+                logger.warning(f"Cache invalidation subscription lost: {str(e)}")
+                self._entries.clear()
+                await asyncio.sleep(RESUBSCRIBE_DELAY)
+            finally:
+                await pubsub.close()
+
+# Shared by the repositories, which are created per request
+local_cache = LocalCache()
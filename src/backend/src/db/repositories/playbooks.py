@@ -6,18 +6,27 @@ Version: SQLAlchemy 2.x
 Redis 4.x
 """
 
+import asyncio
+import hashlib
 import logging
+import os
 import time
 import uuid
-from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
 
-from sqlalchemy import select, update
-from sqlalchemy.orm import Session
+import msgpack  # v1.0.5
+from sqlalchemy import bindparam, func, select, update
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
 import redis  # v4.x
 
 from models.playbook import Playbook, PlaybookExecution, PlaybookStatus, PlaybookTriggerType
 from db.session import get_db
+from db.repositories.loader import BatchLoader
+from db.repositories.local_cache import INVALIDATION_CHANNEL, local_cache
 from core.exceptions import BaseCustomException
 
 # Configure module logger
@@ -25,8 +34,36 @@ logger = logging.getLogger(__name__)
 
 # Cache configuration
 CACHE_TTL = 300  # 5 minutes cache TTL
+NEGATIVE_CACHE_TTL = 30  # Unknown ids are remembered briefly
+CACHE_MISS_SENTINEL = b"\x00MISS"  # Cached in place of ids with no live row
+LIST_CACHE_TTL = 60  # List pages tolerate brief staleness
+LIST_VERSION_KEY = "playbooks:list:version"  # Bumped on every write to retire cached pages
 SLOW_QUERY_THRESHOLD = 1.0  # 1 second threshold for slow queries
 
+# Overlap the cache lookup with the database query on get_playbook; trades extra
+# database load on cache hits for lower latency on misses
+CACHE_DB_PREFETCH = os.getenv('CACHE_DB_PREFETCH', 'false').lower() == 'true'
+
+# Reusable id lookup, built once so only its parameter varies per call
+_GET_PLAYBOOK_BY_ID = select(Playbook).where(
+    Playbook.id == bindparam('playbook_id'),
+    Playbook.is_deleted == False
+)
+
+# Cache fills in progress in this process, keyed by cache key. Repositories are
+# request-scoped, so the table is shared at module level; waiters receive the
+# leader's cache payload rather than its session-bound instance.
+_INFLIGHT_FILLS: Dict[str, asyncio.Future] = {}
+
+@dataclass(frozen=True)
+class PlaybookSummary:
+    """Lightweight playbook row for list views, loaded without ORM hydration."""
+    id: uuid.UUID
+    name: str
+    status: PlaybookStatus
+    trigger_type: PlaybookTriggerType
+    updated_at: datetime
+
 class PlaybookRepository:
     """
     Repository class implementing database operations for playbook management 
@@ -42,10 +79,12 @@ class PlaybookRepository:
             'cache_misses': 0,
             'slow_queries': 0
         }
+        self._loader = BatchLoader(self._fetch_many)
 
     def _get_cache_key(self, playbook_id: uuid.UUID) -> str:
         """Generate cache key for playbook."""
-        return f"playbook:{str(playbook_id)}"
+        # UUID.hex skips the dashed canonical format
+        return f"playbook:{playbook_id.hex}"
 
     def _log_performance(self, operation: str, duration: float) -> None:
         """Log performance metrics for monitoring."""
@@ -100,14 +139,15 @@ class PlaybookRepository:
             playbook.validate_steps(steps)
             playbook.validate_triggers(trigger_conditions)
             
-            # Add to database
+            # Add to database; detach after the flush so commit does not expire
+            # the inserted state and no refresh SELECT is needed
             self._db.add(playbook)
+            await self._db.flush()
+            self._db.expunge(playbook)
             await self._db.commit()
-            await self._db.refresh(playbook)
             
             # Invalidate cache
-            cache_key = self._get_cache_key(playbook.id)
-            await self._cache.delete(cache_key)
+            await self._invalidate_cache(playbook.id)
             
             duration = time.time() - start_time
             self._log_performance('create_playbook', duration)
@@ -134,6 +174,9 @@ class PlaybookRepository:
         """
         Retrieves playbook by ID with caching.
         
+        Concurrent lookups within a request are coalesced into one cache MGET
+        and one database query.
+        
         Args:
             playbook_id: UUID of playbook to retrieve
             
@@ -143,32 +186,140 @@ class PlaybookRepository:
         Raises:
             BaseCustomException: On database errors
         """
+        return await self._loader.load(playbook_id)
+
+    async def _fetch_many(self, playbook_ids: List[uuid.UUID]) -> Dict[uuid.UUID, Playbook]:
+        """
+        Fetches a batch of playbooks, serving cache hits and querying the rest at once.
+        
+        Args:
+            playbook_ids: UUIDs of playbooks to retrieve
+            
+        Returns:
+            Found playbooks keyed by ID
+            
+        Raises:
+            BaseCustomException: On database errors
+        """
+        if len(playbook_ids) == 1:
+            playbook_id = playbook_ids[0]
+            return {playbook_id: await self._fetch_playbook(playbook_id)}
+        
+        start_time = time.time()
+        
+        try:
+            found = {}
+            misses = []
+            
+            # Serve what the in-process tier holds, then the rest with a single MGET
+            keys = {playbook_id: self._get_cache_key(playbook_id) for playbook_id in playbook_ids}
+            remote = []
+            for playbook_id, cache_key in keys.items():
+                local = local_cache.get(cache_key)
+                if local is None:
+                    remote.append(playbook_id)
+                elif local != CACHE_MISS_SENTINEL:
+                    found[playbook_id] = Playbook.from_cache(local)
+            
+            if remote:
+                cached = await self._cache.mget([keys[playbook_id] for playbook_id in remote])
+                for playbook_id, cached_playbook in zip(remote, cached):
+                    if not cached_playbook:
+                        misses.append(playbook_id)
+                        continue
+                    local_cache.set(keys[playbook_id], cached_playbook)
+                    if cached_playbook != CACHE_MISS_SENTINEL:
+                        found[playbook_id] = Playbook.from_cache(cached_playbook)
+            
+            self._metrics['cache_hits'] += len(found)
+            self._metrics['cache_misses'] += len(misses)
+            
+            if misses:
+                query = select(Playbook).where(
+                    Playbook.id.in_(misses),
+                    Playbook.is_deleted == False
+                )
+                async with self._read_session() as session:
+                    playbooks = (await session.execute(query)).scalars().all()
+                
+                found.update((playbook.id, playbook) for playbook in playbooks)
+                
+                # Cache fetched playbooks and unknown ids in one round-trip
+                pipe = self._cache.pipeline(transaction=False)
+                for playbook in playbooks:
+                    payload = playbook.to_cache()
+                    pipe.setex(keys[playbook.id], CACHE_TTL, payload)
+                    local_cache.set(keys[playbook.id], payload)
+                for playbook_id in misses:
+                    if playbook_id not in found:
+                        pipe.setex(keys[playbook_id], NEGATIVE_CACHE_TTL, CACHE_MISS_SENTINEL)
+                        local_cache.set(keys[playbook_id], CACHE_MISS_SENTINEL)
+                await pipe.execute()
+            
+            duration = time.time() - start_time
+            self._log_performance('get_playbooks', duration)
+            
+            return found
+            
+        except SQLAlchemyError as e:
+            logger.error(f"Failed to retrieve playbooks {playbook_ids}: {str(e)}")
+            raise BaseCustomException(
+                message=f"Failed to retrieve playbook: {str(e)}",
+                error_code="PLAY002"
+            )
+
+    async def _fetch_playbook(self, playbook_id: uuid.UUID) -> Optional[Playbook]:
+        """Retrieves a single playbook from cache or database."""
         start_time = time.time()
         cache_key = self._get_cache_key(playbook_id)
         
         try:
+            params = {'playbook_id': playbook_id}
+            
+            # Serve from the in-process tier without a Redis round-trip
+            local = local_cache.get(cache_key)
+            if local is not None:
+                self._metrics['cache_hits'] += 1
+                return None if local == CACHE_MISS_SENTINEL else Playbook.from_cache(local)
+            
+            # Start the query alongside the cache lookup; a hit abandons it
+            db_task = (
+                asyncio.create_task(self._select_one_detached(params))
+                if CACHE_DB_PREFETCH else None
+            )
+            
             # Check cache first
             cached_playbook = await self._cache.get(cache_key)
             if cached_playbook:
                 self._metrics['cache_hits'] += 1
+                if db_task:
+                    db_task.cancel()
+                local_cache.set(cache_key, cached_playbook)
+                if cached_playbook == CACHE_MISS_SENTINEL:
+                    return None
                 return Playbook.from_cache(cached_playbook)
                 
             self._metrics['cache_misses'] += 1
             
             # Query database
-            query = select(Playbook).where(
-                Playbook.id == playbook_id,
-                Playbook.is_deleted == False
-            )
-            playbook = (await self._db.execute(query)).scalar_one_or_none()
+            if db_task:
+                playbook = await db_task
+                if playbook:
+                    playbook = await self._db.merge(playbook, load=False)
+            else:
+                playbook = await self._fill_single_flight(cache_key, params)
+                self._log_performance('get_playbook', time.time() - start_time)
+                return playbook
             
             if playbook:
                 # Update cache
-                await self._cache.setex(
-                    cache_key,
-                    CACHE_TTL,
-                    playbook.to_cache()
-                )
+                payload = playbook.to_cache()
+                await self._cache.setex(cache_key, CACHE_TTL, payload)
+            else:
+                # Remember the unknown id briefly
+                payload = CACHE_MISS_SENTINEL
+                await self._cache.setex(cache_key, NEGATIVE_CACHE_TTL, payload)
+            local_cache.set(cache_key, payload)
             
             duration = time.time() - start_time
             self._log_performance('get_playbook', duration)
@@ -182,6 +333,83 @@ class PlaybookRepository:
                 error_code="PLAY002"
             )
 
+    async def _fill_single_flight(self, cache_key: str, params: Dict) -> Optional[Playbook]:
+        """
+        Load a playbook after a cache miss, sharing one query among concurrent misses.
+
+        The first caller for a key queries and refills the cache; callers arriving
+        while that fill is running wait for its payload instead of querying again.
+
+        Args:
+            cache_key: Cache key that missed
+            params: Bind parameters for the id lookup
+
+        Returns:
+            Optional[Playbook]: Playbook if found, None otherwise
+        """
+        pending = _INFLIGHT_FILLS.get(cache_key)
+        if pending is not None:
+            payload = await asyncio.shield(pending)
+            return Playbook.from_cache(payload) if payload else None
+
+        pending = _INFLIGHT_FILLS[cache_key] = asyncio.get_running_loop().create_future()
+        try:
+            async with self._read_session() as session:
+                playbook = (await session.execute(_GET_PLAYBOOK_BY_ID, params)).scalar_one_or_none()
+            payload = playbook.to_cache() if playbook else None
+            if payload:
+                await self._cache.setex(cache_key, CACHE_TTL, payload)
+            else:
+                await self._cache.setex(cache_key, NEGATIVE_CACHE_TTL, CACHE_MISS_SENTINEL)
+            local_cache.set(cache_key, payload or CACHE_MISS_SENTINEL)
+            pending.set_result(payload)
+            return playbook
+        except Exception as e:
+            pending.set_exception(e)
+            # Waiters re-raise it; mark it retrieved in case there are none
+            pending.exception()
+            raise
+        finally:
+            if not pending.done():
+                pending.cancel()
+            _INFLIGHT_FILLS.pop(cache_key, None)
+
+    def _read_session(self) -> AsyncSession:
+        """
+        Open a short-lived session for a read ahead of cache writes.
+        Its pooled connection is returned when the block exits, not held by
+        self._db across the awaited cache round-trips that follow.
+        """
+        return AsyncSession(self._db.bind)
+
+    async def _select_one_detached(self, params: Dict) -> Optional[Playbook]:
+        """
+        Run the id lookup on a short-lived session of its own.
+        Lets the query overlap the cache lookup without concurrent use of self._db.
+        """
+        async with self._read_session() as session:
+            return (await session.execute(_GET_PLAYBOOK_BY_ID, params)).scalar_one_or_none()
+
+    async def _invalidate_cache(self, playbook_id: uuid.UUID) -> None:
+        """Apply the cache invalidations for one playbook write in a single round-trip."""
+        cache_key = self._get_cache_key(playbook_id)
+        pipe = self._cache.pipeline(transaction=False)
+        pipe.delete(cache_key)
+        pipe.incr(LIST_VERSION_KEY)
+        # Drop in-process copies here and, through the channel, in every worker
+        pipe.publish(INVALIDATION_CHANNEL, cache_key)
+        local_cache.invalidate(cache_key)
+        await pipe.execute()
+
+    async def _list_cache_key(self, *parts: Any) -> str:
+        """Build a list page cache key scoped to the current list generation."""
+        version = await self._cache.get(LIST_VERSION_KEY)
+        digest = hashlib.blake2b(
+            msgpack.packb((version, *parts), use_bin_type=True),
+            digest_size=16
+        ).hexdigest()
+        return f"playbooks:list:{digest}"
+
     async def update_playbook(
         self,
         playbook_id: uuid.UUID,
@@ -203,27 +431,59 @@ class PlaybookRepository:
         start_time = time.time()
         
         try:
-            # Get existing playbook
-            playbook = await self.get_playbook(playbook_id)
-            if not playbook:
-                return None
+            if 'status' in updates or not updates:
+                # Status transitions are validated against the loaded current status;
+                # load it on the writing session, as cached and read-session copies are detached
+                playbook = (
+                    await self._db.execute(_GET_PLAYBOOK_BY_ID, {'playbook_id': playbook_id})
+                ).scalar_one_or_none()
+                if not playbook:
+                    return None
+                    
+                # Validate updates
+                if 'steps' in updates:
+                    playbook.validate_steps(updates['steps'])
+                if 'trigger_conditions' in updates:
+                    playbook.validate_triggers(updates['trigger_conditions'])
+                    
+                # Apply updates
+                for key, value in updates.items():
+                    setattr(playbook, key, value)
+                    
+                # Flush, then detach so commit keeps the updated state without a refresh
+                await self._db.flush()
+                self._db.expunge(playbook)
+                await self._db.commit()
+            else:
+                # Steps validation needs no stored state; check on a transient instance
+                if 'steps' in updates:
+                    Playbook.__mapper__.class_manager.new_instance().validate_steps(updates['steps'])
                 
-            # Validate updates
-            if 'steps' in updates:
-                playbook.validate_steps(updates['steps'])
-            if 'trigger_conditions' in updates:
-                playbook.validate_triggers(updates['trigger_conditions'])
+                # Update and read back the row in a single statement
+                stmt = (
+                    update(Playbook)
+                    .where(Playbook.id == playbook_id, Playbook.is_deleted == False)
+                    .values(**updates)
+                    .returning(Playbook)
+                )
+                playbook = (await self._db.execute(stmt)).scalar_one_or_none()
+                if not playbook:
+                    return None
                 
-            # Apply updates
-            for key, value in updates.items():
-                setattr(playbook, key, value)
+                # Trigger conditions are checked against the row's trigger type before commit
+                if 'trigger_conditions' in updates:
+                    try:
+                        playbook.validate_triggers(updates['trigger_conditions'])
+                    except ValueError:
+                        await self._db.rollback()
+                        raise
                 
-            await self._db.commit()
-            await self._db.refresh(playbook)
+                # Detach so commit does not expire the values RETURNING loaded
+                self._db.expunge(playbook)
+                await self._db.commit()
             
             # Invalidate cache
-            cache_key = self._get_cache_key(playbook_id)
-            await self._cache.delete(cache_key)
+            await self._invalidate_cache(playbook_id)
             
             duration = time.time() - start_time
             self._log_performance('update_playbook', duration)
@@ -267,8 +527,7 @@ class PlaybookRepository:
             await self._db.commit()
             
             # Invalidate cache
-            cache_key = self._get_cache_key(playbook_id)
-            await self._cache.delete(cache_key)
+            await self._invalidate_cache(playbook_id)
             
             duration = time.time() - start_time
             self._log_performance('delete_playbook', duration)
@@ -288,7 +547,8 @@ class PlaybookRepository:
         status: Optional[PlaybookStatus] = None,
         trigger_type: Optional[PlaybookTriggerType] = None,
         page: int = 1,
-        page_size: int = 50
+        page_size: int = 50,
+        include_executions: bool = False
     ) -> Tuple[List[Playbook], int]:
         """
         Lists playbooks with optional filtering and pagination.
@@ -298,6 +558,8 @@ class PlaybookRepository:
             trigger_type: Optional trigger type filter
             page: Page number
             page_size: Items per page
+            include_executions: Eager-load each playbook's executions (id, status,
+                started_at) in one extra query; such pages bypass the list cache
             
         Returns:
             Tuple of (playbooks list, total count)
@@ -308,8 +570,29 @@ class PlaybookRepository:
         start_time = time.time()
         
         try:
-            # Build query
-            query = select(Playbook).where(Playbook.is_deleted == False)
+            # Serve repeated pages from the list cache; cached playbooks carry no executions
+            list_key = None
+            cached_page = None
+            if not include_executions:
+                list_key = await self._list_cache_key(
+                    status.value if status else None,
+                    trigger_type.value if trigger_type else None,
+                    page,
+                    page_size
+                )
+                cached_page = await self._cache.get(list_key)
+            if cached_page:
+                envelope = msgpack.unpackb(cached_page, raw=False)
+                playbooks = await asyncio.gather(
+                    *(self._loader.load(uuid.UUID(playbook_id)) for playbook_id in envelope['ids'])
+                )
+                return [playbook for playbook in playbooks if playbook is not None], envelope['total']
+            
+            # Build query; the window count carries the filtered total on every row
+            query = select(
+                Playbook,
+                func.count().over().label('total')
+            ).where(Playbook.is_deleted == False)
             
             if status:
                 query = query.where(Playbook.status == status)
@@ -320,29 +603,132 @@ class PlaybookRepository:
             offset = (page - 1) * page_size
             query = query.offset(offset).limit(page_size)
             
+            if include_executions:
+                # One IN query for the page's executions, limited to summary columns
+                query = query.options(
+                    selectinload(Playbook.executions).load_only(
+                        PlaybookExecution.id,
+                        PlaybookExecution.status,
+                        PlaybookExecution.started_at
+                    )
+                )
+            
             # Execute query
-            result = await self._db.execute(query)
-            playbooks = result.scalars().all()
+            async with self._read_session() as session:
+                rows = (await session.execute(query)).all()
+            playbooks = [row[0] for row in rows]
+            
+            if rows:
+                total = rows[0][1]
+            elif offset:
+                # A page past the end has no rows to carry the total; count separately
+                count_query = select(func.count()).select_from(Playbook).where(
+                    Playbook.is_deleted == False
+                )
+                if status:
+                    count_query = count_query.where(Playbook.status == status)
+                if trigger_type:
+                    count_query = count_query.where(Playbook.trigger_type == trigger_type)
+                    
+                async with self._read_session() as session:
+                    total = await session.scalar(count_query)
+            else:
+                total = 0
+            
+            if list_key:
+                await self._cache.setex(
+                    list_key,
+                    LIST_CACHE_TTL,
+                    msgpack.packb(
+                        {'ids': [str(playbook.id) for playbook in playbooks], 'total': total},
+                        use_bin_type=True
+                    )
+                )
             
-            # Get total count
-            count_query = select(func.count()).select_from(Playbook).where(
-                Playbook.is_deleted == False
+            duration = time.time() - start_time
+            self._log_performance('list_playbooks', duration)
+            
+            return playbooks, total
+            
+        except SQLAlchemyError as e:
+            logger.error(f"Failed to list playbooks: {str(e)}")
+            raise BaseCustomException(
+                message=f"Failed to list playbooks: {str(e)}",
+                error_code="PLAY005"
             )
+
+    async def list_playbook_summaries(
+        self,
+        status: Optional[PlaybookStatus] = None,
+        trigger_type: Optional[PlaybookTriggerType] = None,
+        page: int = 1,
+        page_size: int = 50
+    ) -> Tuple[List[PlaybookSummary], int]:
+        """
+        Lists playbook summaries, selecting only the columns list views render.
+        
+        Args:
+            status: Optional status filter
+            trigger_type: Optional trigger type filter
+            page: Page number
+            page_size: Items per page
+            
+        Returns:
+            Tuple of (playbook summaries list, total count)
+            
+        Raises:
+            BaseCustomException: On database errors
+        """
+        start_time = time.time()
+        
+        try:
+            query = select(
+                Playbook.id,
+                Playbook.name,
+                Playbook.status,
+                Playbook.trigger_type,
+                Playbook.updated_at,
+                func.count().over().label('total')
+            ).where(Playbook.is_deleted == False)
+            
             if status:
-                count_query = count_query.where(Playbook.status == status)
+                query = query.where(Playbook.status == status)
             if trigger_type:
-                count_query = count_query.where(Playbook.trigger_type == trigger_type)
+                query = query.where(Playbook.trigger_type == trigger_type)
                 
-            total = await self._db.scalar(count_query)
+            # Add pagination
+            offset = (page - 1) * page_size
+            query = query.offset(offset).limit(page_size)
+            
+            async with self._read_session() as session:
+                rows = (await session.execute(query)).all()
+            summaries = [PlaybookSummary(*row[:-1]) for row in rows]
+            
+            if rows:
+                total = rows[0][-1]
+            elif offset:
+                # A page past the end has no rows to carry the total; count separately
+                count_query = select(func.count()).select_from(Playbook).where(
+                    Playbook.is_deleted == False
+                )
+                if status:
+                    count_query = count_query.where(Playbook.status == status)
+                if trigger_type:
+                    count_query = count_query.where(Playbook.trigger_type == trigger_type)
+                    
+                async with self._read_session() as session:
+                    total = await session.scalar(count_query)
+            else:
+                total = 0
             
             duration = time.time() - start_time
-            self._log_performance('list_playbooks', duration)
+            self._log_performance('list_playbook_summaries', duration)
             
-            return playbooks, total
+            return summaries, total
             
         except SQLAlchemyError as e:
-            logger.error(f"Failed to list playbooks: {str(e)}")
+            logger.error(f"Failed to list playbook summaries: {str(e)}")
             raise BaseCustomException(
                 message=f"Failed to list playbooks: {str(e)}",
                 error_code="PLAY005"
-            )
\ No newline at end of file
+            )
@@ -8,18 +8,20 @@ Redis 4.x
 """
 
 import logging
+import time
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 from uuid import UUID
-import json
 
-from sqlalchemy import select, and_, desc
+import msgspec  # v0.18.4
+from sqlalchemy import select, update, and_, desc, bindparam, Integer
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 from redis import Redis
 from redis.exceptions import RedisError
+from prometheus_client import Counter
 
-from models.risk import RiskProfile
+from models.risk import RiskProfile, RiskProfileCache
 from core.exceptions import BaseCustomException
 from db.session import get_db
 
@@ -28,8 +30,47 @@ logger = logging.getLogger(__name__)
 
 # Constants
 CACHE_TTL = 300  # 5 minutes cache TTL
+NEGATIVE_CACHE_TTL = 30  # Customers without a profile are remembered briefly
+CACHE_MISS_SENTINEL = b"\x00MISS"  # Cached in place of customers with no live profile
 MAX_RETRIES = 3
 BATCH_SIZE = 100  # Batch size for bulk operations
+HIGH_RISK_LIMIT = 1000  # Default cap on profiles returned by get_high_risk_customers
+CACHE_KEY_PREFIX = b"risk_profile:"  # Followed by the raw 16-byte customer UUID
+LOADING_TOKEN = b"\x00LOADING"  # Held in place of a profile while one worker loads it
+LOAD_LOCK_TTL = 5  # Seconds before an abandoned load lock expires
+LOAD_WAIT_INTERVAL = 0.02  # Seconds between checks while another worker loads
+LOAD_WAIT_ATTEMPTS = 25  # Checks before loading without the lock
+
+# Returns the cached value, or claims the key with a loading token and returns nil
+# so exactly one caller per miss goes to the database
+GET_OR_LOCK = """
+local value = redis.call('GET', KEYS[1])
+if value then
+    return value
+end
+redis.call('SET', KEYS[1], ARGV[1], 'NX', 'EX', ARGV[2])
+return false
+"""
+
+# Leading byte of RiskProfileCache values; entries from the generic row codec
+# carry a different tag and decode as misses
+PROFILE_CACHE_TAG = b"\x02"
+
+_profile_encoder = msgspec.msgpack.Encoder()
+_profile_decoder = msgspec.msgpack.Decoder(RiskProfileCache)
+
+# Performance monitoring metrics
+RISK_OPERATIONS = Counter(
+    'risk_repository_operations_total',
+    'Total number of risk repository cache and database operations',
+    ['operation', 'result']
+)
+
+# Label children bound once so hot paths skip the per-call label lookup
+_CACHE_HITS = RISK_OPERATIONS.labels(operation='cache', result='hit')
+_CACHE_MISSES = RISK_OPERATIONS.labels(operation='cache', result='miss')
+_DB_QUERIES = RISK_OPERATIONS.labels(operation='db', result='query')
+_ERRORS = RISK_OPERATIONS.labels(operation='any', result='error')
 
 # Error codes
 REPO_ERROR_CODES = {
@@ -38,10 +79,41 @@ REPO_ERROR_CODES = {
     'VALIDATION_ERROR': 'RISK003'
 }
 
+# Reusable statements, built once so only their parameters vary per call
+_GET_RISK_BY_CUSTOMER = select(RiskProfile).where(
+    and_(
+        RiskProfile.customer_id == bindparam('customer_id'),
+        RiskProfile.is_deleted == False
+    )
+).order_by(desc(RiskProfile.created_at)).limit(1)
+
+_GET_RISK_BY_CUSTOMERS = select(RiskProfile).where(
+    and_(
+        RiskProfile.customer_id.in_(bindparam('customer_ids', expanding=True)),
+        RiskProfile.is_deleted == False
+    )
+).order_by(desc(RiskProfile.created_at))
+
+_GET_HIGH_RISK = (
+    select(RiskProfile)
+    .where(
+        and_(
+            RiskProfile.score >= bindparam('threshold'),
+            RiskProfile.is_deleted == False
+        )
+    )
+    .order_by(desc(RiskProfile.score))
+    .limit(bindparam('limit', type_=Integer))
+)
+
 class RiskRepository:
     """
     Repository class for managing risk assessment data operations with caching
     and error handling capabilities.
+
+    Uses a synchronous session and Redis client and may sleep while another worker
+    loads a profile, so async callers must run its methods in a worker thread
+    (asyncio.to_thread) rather than on the event loop.
     """
 
     def __init__(self, db_session: Session, cache_client: Redis):
@@ -54,20 +126,23 @@ class RiskRepository:
         """
         self._session = db_session
         self._cache = cache_client
-        self._setup_logging()
+        self._get_or_lock = cache_client.register_script(GET_OR_LOCK)
+
+    def _get_cache_key(self, customer_id: UUID) -> bytes:
+        """Generate cache key for risk profile from the raw UUID bytes."""
+        return CACHE_KEY_PREFIX + customer_id.bytes
 
-    def _setup_logging(self) -> None:
-        """Configure enhanced logging with metrics tracking."""
-        self._metrics = {
-            'cache_hits': 0,
-            'cache_misses': 0,
-            'db_queries': 0,
-            'errors': 0
-        }
+    def _encode_profile(self, profile: RiskProfile) -> bytes:
+        """Serialize a risk profile to its cache value."""
+        return PROFILE_CACHE_TAG + _profile_encoder.encode(profile.to_cache_struct())
 
-    def _get_cache_key(self, customer_id: UUID) -> str:
-        """Generate cache key for risk profile."""
-        return f"risk_profile:{str(customer_id)}"
+    def _decode_profile(self, data: bytes) -> Optional[RiskProfile]:
+        """Rebuild a risk profile from its cache value; entries in another format yield None."""
+        if not data.startswith(PROFILE_CACHE_TAG):
+            return None
+        return RiskProfile.from_cache_struct(
+            _profile_decoder.decode(memoryview(data)[len(PROFILE_CACHE_TAG):])
+        )
 
     def _cache_profile(self, profile: RiskProfile) -> None:
         """
@@ -78,20 +153,45 @@ class RiskRepository:
         """
         try:
             cache_key = self._get_cache_key(profile.customer_id)
-            profile_data = profile.to_dict()
             self._cache.setex(
                 name=cache_key,
                 time=CACHE_TTL,
-                value=json.dumps(profile_data)
+                value=self._encode_profile(profile)
             )
         except RedisError as e:
             logger.error(f"Cache operation failed: {str(e)}")
-            self._metrics['errors'] += 1
+            _ERRORS.inc()
+
+    def _cache_profiles(self, profiles: List[RiskProfile]) -> None:
+        """
+        Cache many risk profiles through a single pipeline.
+
+        Args:
+            profiles: Risk profiles to cache
+        """
+        if not profiles:
+            return
+        try:
+            with self._cache.pipeline(transaction=False) as pipe:
+                for profile in profiles:
+                    pipe.setex(
+                        self._get_cache_key(profile.customer_id),
+                        CACHE_TTL,
+                        self._encode_profile(profile)
+                    )
+                pipe.execute()
+        except RedisError as e:
+            logger.error(f"Cache operation failed: {str(e)}")
+            _ERRORS.inc()
 
     def get_risk_profile(self, customer_id: UUID) -> Optional[RiskProfile]:
         """
         Retrieve risk profile by customer ID with caching.
 
+        Blocking: while another worker holds the load lock this sleeps for up to
+        LOAD_WAIT_ATTEMPTS * LOAD_WAIT_INTERVAL seconds. Call it from sync handlers
+        or through asyncio.to_thread, never directly on the event loop.
+
         Args:
             customer_id: UUID of customer
 
@@ -101,42 +201,146 @@ class RiskRepository:
         Raises:
             BaseCustomException: On database or cache errors
         """
+        cache_key = self._get_cache_key(customer_id)
+        holds_lock = False
         try:
-            # Check cache first
-            cache_key = self._get_cache_key(customer_id)
-            cached_data = self._cache.get(cache_key)
-
-            if cached_data:
-                self._metrics['cache_hits'] += 1
-                profile_data = json.loads(cached_data)
-                return RiskProfile(**profile_data)
+            # Check cache first, claiming the load on a miss; while another worker
+            # holds the claim, wait briefly for its result instead of querying too
+            for _ in range(LOAD_WAIT_ATTEMPTS):
+                cached_data = self._get_or_lock(
+                    keys=[cache_key],
+                    args=[LOADING_TOKEN, LOAD_LOCK_TTL]
+                )
+                if cached_data != LOADING_TOKEN:
+                    holds_lock = cached_data is None
+                    break
+                time.sleep(LOAD_WAIT_INTERVAL)
+            else:
+                cached_data = None
+
+            if cached_data == CACHE_MISS_SENTINEL:
+                _CACHE_HITS.inc()
+                return None
+
+            # Entries in an older format decode to None and are refilled below
+            profile = self._decode_profile(cached_data) if cached_data else None
+            if profile:
+                _CACHE_HITS.inc()
+                return profile
 
-            self._metrics['cache_misses'] += 1
+            _CACHE_MISSES.inc()
 
             # Query database
-            query = select(RiskProfile).where(
-                and_(
-                    RiskProfile.customer_id == customer_id,
-                    RiskProfile.is_deleted == False
-                )
-            ).order_by(desc(RiskProfile.created_at))
-
-            self._metrics['db_queries'] += 1
-            profile = self._session.execute(query).scalars().first()
+            _DB_QUERIES.inc()
+            profile = self._session.execute(
+                _GET_RISK_BY_CUSTOMER, {'customer_id': customer_id}
+            ).scalar_one_or_none()
 
+            # Either write replaces the loading token
             if profile:
                 self._cache_profile(profile)
+            else:
+                self._cache.setex(cache_key, NEGATIVE_CACHE_TTL, CACHE_MISS_SENTINEL)
 
             return profile
 
         except (SQLAlchemyError, RedisError) as e:
-            self._metrics['errors'] += 1
+            _ERRORS.inc()
             logger.error(f"Error retrieving risk profile: {str(e)}")
+            if holds_lock:
+                self._release_load_lock(cache_key)
             raise BaseCustomException(
                 message=f"Failed to retrieve risk profile: {str(e)}",
                 error_code=REPO_ERROR_CODES['DB_ERROR']
             )
 
+    def _release_load_lock(self, cache_key: bytes) -> None:
+        """Drop an unfinished load's token so waiters fall through to the database."""
+        try:
+            with self._cache.pipeline() as pipe:
+                pipe.watch(cache_key)
+                if pipe.get(cache_key) == LOADING_TOKEN:
+                    pipe.multi()
+                    pipe.delete(cache_key)
+                    pipe.execute()
+        except RedisError as e:
+            logger.error(f"Cache operation failed: {str(e)}")
+            _ERRORS.inc()
+
+    def get_risk_profiles(self, customer_ids: List[UUID]) -> List[Optional[RiskProfile]]:
+        """
+        Retrieve the risk profiles of many customers with one MGET and at most one query.
+
+        Args:
+            customer_ids: UUIDs of customers
+
+        Returns:
+            List[Optional[RiskProfile]]: Profiles in input order, None where a customer has none
+
+        Raises:
+            BaseCustomException: On database or cache errors
+        """
+        if not customer_ids:
+            return []
+
+        try:
+            found: Dict[UUID, RiskProfile] = {}
+            misses = []
+
+            # Serve cached profiles and remembered absences with a single MGET
+            cached = self._cache.mget([self._get_cache_key(customer_id) for customer_id in customer_ids])
+            for customer_id, cached_data in zip(customer_ids, cached):
+                if cached_data == CACHE_MISS_SENTINEL:
+                    continue
+                # Entries in an older format decode to None and are refilled below
+                profile = self._decode_profile(cached_data) if cached_data else None
+                if profile:
+                    found[customer_id] = profile
+                else:
+                    misses.append(customer_id)
+
+            _CACHE_HITS.inc(len(customer_ids) - len(misses))
+            _CACHE_MISSES.inc(len(misses))
+
+            if misses:
+                _DB_QUERIES.inc()
+                profiles = self._session.execute(
+                    _GET_RISK_BY_CUSTOMERS, {'customer_ids': misses}
+                ).scalars().all()
+
+                # Rows arrive newest first; keep each customer's latest profile
+                loaded: Dict[UUID, RiskProfile] = {}
+                for profile in profiles:
+                    loaded.setdefault(profile.customer_id, profile)
+                found.update(loaded)
+
+                # Cache loaded profiles and customers without one in one round-trip
+                with self._cache.pipeline(transaction=False) as pipe:
+                    for customer_id in misses:
+                        if customer_id in loaded:
+                            pipe.setex(
+                                self._get_cache_key(customer_id),
+                                CACHE_TTL,
+                                self._encode_profile(loaded[customer_id])
+                            )
+                        else:
+                            pipe.setex(
+                                self._get_cache_key(customer_id),
+                                NEGATIVE_CACHE_TTL,
+                                CACHE_MISS_SENTINEL
+                            )
+                    pipe.execute()
+
+            return [found.get(customer_id) for customer_id in customer_ids]
+
+        except (SQLAlchemyError, RedisError) as e:
+            _ERRORS.inc()
+            logger.error(f"Error retrieving risk profiles: {str(e)}")
+            raise BaseCustomException(
+                message=f"Failed to retrieve risk profiles: {str(e)}",
+                error_code=REPO_ERROR_CODES['DB_ERROR']
+            )
+
     def create_risk_profile(
         self,
         customer_id: UUID,
@@ -172,7 +376,7 @@ class RiskRepository:
             # Persist to database
             self._session.add(profile)
             self._session.commit()
-            self._metrics['db_queries'] += 1
+            _DB_QUERIES.inc()
 
             # Update cache
             self._cache_profile(profile)
@@ -193,7 +397,7 @@ class RiskRepository:
                 error_code=REPO_ERROR_CODES['VALIDATION_ERROR']
             )
         except SQLAlchemyError as e:
-            self._metrics['errors'] += 1
+            _ERRORS.inc()
             self._session.rollback()
             logger.error(f"Failed to create risk profile: {str(e)}")
             raise BaseCustomException(
@@ -226,23 +430,40 @@ class RiskRepository:
             if not 0 <= new_score <= 100:
                 raise ValueError("Risk score must be between 0 and 100")
 
-            # Get current profile
-            profile = self.get_risk_profile(customer_id)
+            # Update the customer's latest profile and read it back in one statement
+            latest_id = (
+                select(RiskProfile.id)
+                .where(
+                    and_(
+                        RiskProfile.customer_id == customer_id,
+                        RiskProfile.is_deleted == False
+                    )
+                )
+                .order_by(desc(RiskProfile.created_at))
+                .limit(1)
+                .scalar_subquery()
+            )
+            stmt = (
+                update(RiskProfile)
+                .where(RiskProfile.id == latest_id)
+                .values(
+                    score=new_score,
+                    factors=new_factors,
+                    updated_at=datetime.utcnow()
+                )
+                .returning(RiskProfile)
+            )
+            _DB_QUERIES.inc()
+            profile = self._session.execute(stmt).scalar_one_or_none()
             if not profile:
+                self._session.rollback()
                 raise ValueError("Risk profile not found")
 
-            # Update profile
-            profile.score = new_score
-            profile.factors = new_factors
-            profile.updated_at = datetime.utcnow()
-
-            # Persist changes
+            # Detach so commit does not expire the values RETURNING loaded
+            self._session.expunge(profile)
             self._session.commit()
-            self._metrics['db_queries'] += 1
 
-            # Invalidate and update cache
-            cache_key = self._get_cache_key(customer_id)
-            self._cache.delete(cache_key)
+            # SETEX overwrites the previous entry, so no DELETE is needed first
             self._cache_profile(profile)
 
             logger.info(
@@ -261,7 +482,7 @@ class RiskRepository:
                 error_code=REPO_ERROR_CODES['VALIDATION_ERROR']
             )
         except SQLAlchemyError as e:
-            self._metrics['errors'] += 1
+            _ERRORS.inc()
             self._session.rollback()
             logger.error(f"Failed to update risk profile: {str(e)}")
             raise BaseCustomException(
@@ -269,12 +490,17 @@ class RiskRepository:
                 error_code=REPO_ERROR_CODES['DB_ERROR']
             )
 
-    def get_high_risk_customers(self, threshold: float = 75.0) -> List[RiskProfile]:
+    def get_high_risk_customers(
+        self,
+        threshold: float = 75.0,
+        limit: int = HIGH_RISK_LIMIT
+    ) -> List[RiskProfile]:
         """
-        Retrieve high-risk profiles with optimization.
+        Retrieve high-risk profiles, streamed from the database in batches.
 
         Args:
             threshold: Risk score threshold (default: 75.0)
+            limit: Maximum number of profiles to return (default: HIGH_RISK_LIMIT)
 
         Returns:
             List[RiskProfile]: List of high-risk profiles
@@ -287,25 +513,18 @@ class RiskRepository:
             if not 0 <= threshold <= 100:
                 raise ValueError("Threshold must be between 0 and 100")
 
-            # Build optimized query
-            query = (
-                select(RiskProfile)
-                .where(
-                    and_(
-                        RiskProfile.score >= threshold,
-                        RiskProfile.is_deleted == False
-                    )
-                )
-                .order_by(desc(RiskProfile.score))
-            )
-
-            # Execute query with pagination
-            self._metrics['db_queries'] += 1
-            profiles = self._session.execute(query).scalars().all()
+            # Stream rows with a server-side cursor, caching each batch in one round-trip
+            _DB_QUERIES.inc()
+            result = self._session.execute(
+                _GET_HIGH_RISK,
+                {'threshold': threshold, 'limit': limit},
+                execution_options={'yield_per': BATCH_SIZE}
+            ).scalars()
 
-            # Cache results
-            for profile in profiles:
-                self._cache_profile(profile)
+            profiles = []
+            for batch in result.partitions():
+                self._cache_profiles(batch)
+                profiles.extend(batch)
 
             logger.info(
                 "Retrieved high-risk profiles",
@@ -318,7 +537,7 @@ class RiskRepository:
             return profiles
 
         except SQLAlchemyError as e:
-            self._metrics['errors'] += 1
+            _ERRORS.inc()
             logger.error(f"Failed to retrieve high-risk profiles: {str(e)}")
             raise BaseCustomException(
                 message=f"Failed to retrieve high-risk profiles: {str(e)}",
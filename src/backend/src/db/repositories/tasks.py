@@ -8,10 +8,13 @@ Redis 4.x
 
 import logging
 from datetime import datetime
-from typing import Dict, List, Optional, Union
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Union
 from uuid import UUID
 
-from sqlalchemy import select, and_, or_, desc
+import msgspec  # v0.18.4
+import xxhash  # v3.4.1
+from sqlalchemy import select, insert, and_, or_, desc, bindparam, Integer, Select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 from redis import Redis
@@ -19,6 +22,7 @@ from prometheus_client import Counter, Histogram
 
 from models.task import Task, TaskStatus, TaskPriority, TaskType
 from db.session import get_db
+from db.repositories.cache_codec import decode_models, encode_models
 from core.exceptions import BaseCustomException
 
 # Configure module logger
@@ -36,11 +40,60 @@ TASK_OPERATION_DURATION = Histogram(
     ['operation_type']
 )
 
+# Label children bound once so hot paths skip the per-call label lookup
+_CREATE_OPS = TASK_OPERATIONS.labels(operation_type='create')
+_CREATE_DURATION = TASK_OPERATION_DURATION.labels(operation_type='create')
+_BULK_CREATE_OPS = TASK_OPERATIONS.labels(operation_type='bulk_create')
+_BULK_CREATE_DURATION = TASK_OPERATION_DURATION.labels(operation_type='bulk_create')
+_GET_FILTERED_OPS = TASK_OPERATIONS.labels(operation_type='get_filtered')
+_GET_FILTERED_DURATION = TASK_OPERATION_DURATION.labels(operation_type='get_filtered')
+
 # Cache configuration
 CACHE_TTL = 300  # 5 minutes
 CACHE_KEY_PREFIX = "task:"
+CUSTOMER_INDEX_PREFIX = "task_keys:"  # Set of cached query keys per customer
 MAX_BULK_SIZE = 1000
 
+# Deletes every key listed in the given index sets, then the sets themselves,
+# in one server-side call; DEL is chunked to stay within Lua's unpack limit
+INVALIDATE_INDEXED_KEYS = """
+local deleted = 0
+for _, index in ipairs(KEYS) do
+    local members = redis.call('SMEMBERS', index)
+    for i = 1, #members, 500 do
+        deleted = deleted + redis.call('DEL', unpack(members, i, math.min(i + 499, #members)))
+    end
+    redis.call('DEL', index)
+end
+return deleted
+"""
+
+# Filter keys accepted by get_tasks_by_filter, paired with the predicate each adds
+_TASK_FILTERS = (
+    ('customer_id', Task.customer_id == bindparam('customer_id')),
+    ('status', Task.status == bindparam('status')),
+    ('priority', Task.priority == bindparam('priority')),
+    ('assignee_id', Task.assignee_id == bindparam('assignee_id')),
+    ('due_date_start', Task.due_date >= bindparam('due_date_start')),
+    ('due_date_end', Task.due_date <= bindparam('due_date_end')),
+)
+
+@lru_cache(maxsize=256)
+def _filtered_tasks(filter_keys: Tuple[str, ...], sort_field: str, descending: bool) -> Select:
+    """
+    Build the task statement for one combination of filters and sort order.
+    Filter values and paging are bind parameters, so each combination is built once.
+    """
+    query = select(Task)
+    for key, predicate in _TASK_FILTERS:
+        if key in filter_keys:
+            query = query.where(predicate)
+    sort_column = getattr(Task, sort_field)
+    query = query.order_by(desc(sort_column) if descending else sort_column)
+    return query.limit(bindparam('limit', type_=Integer)).offset(
+        bindparam('offset', type_=Integer)
+    )
+
 class TaskRepository:
     """
     Enhanced repository class for managing task-related database operations
@@ -58,6 +111,7 @@ class TaskRepository:
         self.db = db_session
         self.cache = cache_client
         self.logger = logging.getLogger(__name__)
+        self._invalidate_script = cache_client.register_script(INVALIDATE_INDEXED_KEYS)
 
     def create_task(
         self,
@@ -89,7 +143,7 @@ class TaskRepository:
         Raises:
             BaseCustomException: On validation or database errors
         """
-        with TASK_OPERATION_DURATION.labels(operation_type='create').time():
+        with _CREATE_DURATION.time():
             try:
                 # Validate inputs
                 if not title or not description:
@@ -107,16 +161,18 @@ class TaskRepository:
                     metadata=metadata or {}
                 )
 
-                # Add to database
+                # Add to database; every default is client-side, so the flushed
+                # state is complete and detaching keeps it loaded without a refresh
                 self.db.add(task)
+                self.db.flush()
+                self.db.expunge(task)
                 self.db.commit()
-                self.db.refresh(task)
 
                 # Invalidate relevant caches
                 self._invalidate_task_caches(customer_id)
 
                 # Record metrics
-                TASK_OPERATIONS.labels(operation_type='create').inc()
+                _CREATE_OPS.inc()
 
                 return task
 
@@ -128,28 +184,28 @@ class TaskRepository:
                     error_code="TASK001"
                 )
 
-    def bulk_create_tasks(self, task_data: List[Dict]) -> List[Task]:
+    def bulk_create_tasks(self, task_data: List[Dict]) -> List[Dict]:
         """
-        Efficiently creates multiple tasks in batch with validation.
+        Efficiently creates multiple tasks with a single multi-row INSERT.
+        Rows are not loaded as ORM instances; ids are generated client-side.
 
         Args:
             task_data: List of task creation parameters
 
         Returns:
-            List[Task]: Created task instances
+            List[Dict]: Inserted column values, including each task's id
 
         Raises:
             BaseCustomException: On validation or database errors
         """
-        with TASK_OPERATION_DURATION.labels(operation_type='bulk_create').time():
+        with _BULK_CREATE_DURATION.time():
             try:
                 # Validate batch size
                 if len(task_data) > MAX_BULK_SIZE:
                     raise ValueError(f"Batch size exceeds maximum of {MAX_BULK_SIZE}")
 
-                created_tasks = []
-                for data in task_data:
-                    task = Task(
+                created_tasks = [
+                    Task.insert_row(
                         title=data['title'],
                         description=data['description'],
                         customer_id=data['customer_id'],
@@ -159,19 +215,20 @@ class TaskRepository:
                         due_date=data.get('due_date', datetime.utcnow()),
                         metadata=data.get('metadata', {})
                     )
-                    created_tasks.append(task)
+                    for data in task_data
+                ]
+                customer_ids = {task['customer_id'] for task in created_tasks}
 
-                # Bulk insert tasks
-                self.db.bulk_save_objects(created_tasks)
+                # Bulk insert tasks as one executemany, skipping ORM instantiation
+                if created_tasks:
+                    self.db.execute(insert(Task), created_tasks)
                 self.db.commit()
 
-                # Invalidate caches
-                customer_ids = {task.customer_id for task in created_tasks}
-                for customer_id in customer_ids:
-                    self._invalidate_task_caches(customer_id)
+                # Invalidate caches for every affected customer at once
+                self._invalidate_task_caches(*customer_ids)
 
                 # Record metrics
-                TASK_OPERATIONS.labels(operation_type='bulk_create').inc(len(created_tasks))
+                _BULK_CREATE_OPS.inc(len(created_tasks))
 
                 return created_tasks
 
@@ -203,56 +260,45 @@ class TaskRepository:
         Raises:
             BaseCustomException: On query errors
         """
-        with TASK_OPERATION_DURATION.labels(operation_type='get_filtered').time():
+        with _GET_FILTERED_DURATION.time():
             try:
                 # Generate cache key
                 cache_key = self._generate_cache_key(filters, limit, offset)
                 
-                # Check cache
+                # Check cache; entries in an older format decode as misses
                 cached_result = self.cache.get(cache_key)
-                if cached_result:
-                    return cached_result
-
-                # Build base query
-                query = select(Task)
-
-                # Apply filters
-                if filters.get('customer_id'):
-                    query = query.filter(Task.customer_id == filters['customer_id'])
-                if filters.get('status'):
-                    query = query.filter(Task.status == filters['status'])
-                if filters.get('priority'):
-                    query = query.filter(Task.priority == filters['priority'])
-                if filters.get('assignee_id'):
-                    query = query.filter(Task.assignee_id == filters['assignee_id'])
-                if filters.get('due_date_start'):
-                    query = query.filter(Task.due_date >= filters['due_date_start'])
-                if filters.get('due_date_end'):
-                    query = query.filter(Task.due_date <= filters['due_date_end'])
-
-                # Apply sorting
-                sort_field = filters.get('sort_by', 'due_date')
-                sort_order = filters.get('sort_order', 'desc')
-                if sort_order == 'desc':
-                    query = query.order_by(desc(getattr(Task, sort_field)))
-                else:
-                    query = query.order_by(getattr(Task, sort_field))
-
-                # Apply pagination
-                query = query.limit(limit).offset(offset)
+                if cached_result is not None:
+                    tasks = decode_models(Task, cached_result)
+                    if tasks is not None:
+                        return tasks
+
+                # Bind the provided filters to the statement for this combination
+                params = {key: filters[key] for key, _ in _TASK_FILTERS if filters.get(key)}
+                query = _filtered_tasks(
+                    tuple(params),
+                    filters.get('sort_by', 'due_date'),
+                    filters.get('sort_order', 'desc') == 'desc'
+                )
+                params.update(limit=limit, offset=offset)
 
                 # Execute query with timeout
-                result = self.db.execute(query).scalars().all()
-
-                # Cache results
-                self.cache.setex(
-                    cache_key,
-                    CACHE_TTL,
-                    result
-                )
+                result = self.db.execute(query, params).scalars().all()
+
+                # Cache results, indexing the key under its customer for invalidation
+                with self.cache.pipeline(transaction=False) as pipe:
+                    pipe.setex(
+                        cache_key,
+                        CACHE_TTL,
+                        encode_models(result)
+                    )
+                    if filters.get('customer_id'):
+                        index_key = self._customer_index_key(filters['customer_id'])
+                        pipe.sadd(index_key, cache_key)
+                        pipe.expire(index_key, CACHE_TTL)
+                    pipe.execute()
 
                 # Record metrics
-                TASK_OPERATIONS.labels(operation_type='get_filtered').inc()
+                _GET_FILTERED_OPS.inc()
 
                 return result
 
@@ -264,15 +310,19 @@ class TaskRepository:
                 )
 
     def _generate_cache_key(self, filters: Dict, limit: int, offset: int) -> str:
-        """Generates a unique cache key for task queries."""
-        key_parts = [CACHE_KEY_PREFIX]
-        for k, v in sorted(filters.items()):
-            key_parts.append(f"{k}:{v}")
-        key_parts.extend([f"limit:{limit}", f"offset:{offset}"])
-        return ":".join(key_parts)
-
-    def _invalidate_task_caches(self, customer_id: UUID) -> None:
-        """Invalidates all task-related caches for a customer."""
-        pattern = f"{CACHE_KEY_PREFIX}*customer_id:{customer_id}*"
-        for key in self.cache.scan_iter(pattern):
-            self.cache.delete(key)
\ No newline at end of file
+        """Generates a fixed-length cache key for task queries from an xxh3 digest of the filters."""
+        encoded = msgspec.msgpack.encode(
+            {'f': sorted(filters.items()), 'l': limit, 'o': offset}
+        )
+        return f"{CACHE_KEY_PREFIX}query:{xxhash.xxh3_128_hexdigest(encoded)}"
+
+    def _customer_index_key(self, customer_id: UUID) -> str:
+        """Generates the key of the set indexing a customer's cached task queries."""
+        return f"{CUSTOMER_INDEX_PREFIX}{customer_id}"
+
+    def _invalidate_task_caches(self, *customer_ids: UUID) -> None:
+        """Invalidates all task-related caches for the given customers in one round-trip."""
+        if customer_ids:
+            self._invalidate_script(
+                keys=[self._customer_index_key(customer_id) for customer_id in customer_ids]
+            )
\ No newline at end of file
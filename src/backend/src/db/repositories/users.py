@@ -10,15 +10,16 @@ import uuid
 from typing import Optional, Dict, List
 from datetime import datetime
 
-from sqlalchemy import select, update, and_
-from sqlalchemy.orm import Session
+from sqlalchemy import select, update, and_, bindparam
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
-from redis import Redis
+import msgspec  # v0.18.4
+from redis.asyncio import Redis
 
-from models.user import User as UserModel
+from models.user import User as UserModel, UserCache, validate_roles
 from db.session import get_db
 from db.base import Base
-from core.security import FieldEncryption
+from core.security import get_field_encryption
 from core.exceptions import BaseCustomException
 
 # Configure logging
@@ -26,7 +27,7 @@ logger = logging.getLogger(__name__)
 
 # Cache configuration
 CACHE_TTL = 300  # 5 minutes
-CACHE_KEY_PREFIX = "user:"
+CACHE_KEY_PREFIX = b"user:"
 
 # Error codes
 USER_ERROR_CODES = {
@@ -37,38 +38,72 @@ USER_ERROR_CODES = {
     'VALIDATION_ERROR': 'USER005'
 }
 
+# Leading byte of UserCache values; entries from the generic row codec
+# carry a different tag and decode as misses
+USER_CACHE_TAG = b"\x02"
+
+_user_encoder = msgspec.msgpack.Encoder()
+_user_decoder = msgspec.msgpack.Decoder(UserCache)
+
+def user_cache_key(user_id: uuid.UUID) -> bytes:
+    """Build the cache key for a user from the raw UUID bytes, skipping string formatting."""
+    return CACHE_KEY_PREFIX + user_id.bytes
+
+def encode_user(user: UserModel) -> bytes:
+    """Serialize a user to its cache value."""
+    return USER_CACHE_TAG + _user_encoder.encode(user.to_cache_struct())
+
+def decode_user(data: bytes) -> Optional[UserModel]:
+    """Rebuild a detached user from its cache value; entries in another format yield None."""
+    if not data.startswith(USER_CACHE_TAG):
+        return None
+    return UserModel.from_cache_struct(_user_decoder.decode(memoryview(data)[len(USER_CACHE_TAG):]))
+
+# Reusable id lookup, built once so only its parameter varies per call
+_GET_USER_BY_ID = select(UserModel).where(
+    and_(
+        UserModel.id == bindparam('user_id'),
+        UserModel.is_deleted == False
+    )
+).execution_options(
+    timeout=3  # 3s timeout per spec
+)
+
+# Columns update() may assign; identity and creation audit fields are fixed
+_UPDATABLE_COLUMNS = frozenset(
+    column.key for column in UserModel.__table__.columns
+) - {'id', 'created_at'}
+
 class UserRepository:
     """
     Repository class for user data access operations with enhanced security,
     caching, and performance optimization.
     """
 
-    def __init__(self, db_session: Session, cache_client: Optional[Redis] = None):
+    def __init__(self, db_session: AsyncSession, cache_client: Optional[Redis] = None):
         """
         Initialize user repository with database session and cache client.
 
         Args:
-            db_session: SQLAlchemy database session
-            cache_client: Redis cache client (optional)
+            db_session: SQLAlchemy async session
+            cache_client: Async Redis cache client (optional)
         """
         self.db = db_session
         self.cache = cache_client
-        self.field_encryption = FieldEncryption()
-        
-        # Configure query optimization settings
-        self.db.execute("SET LOCAL statement_timeout = '3000ms'")  # 3s timeout per spec
-        
+        self.field_encryption = get_field_encryption()
+
+        # The 3s statement timeout is applied once per pooled connection in db.base
         logger.info("UserRepository initialized with caching and encryption")
 
-    def _get_cache_key(self, user_id: uuid.UUID) -> str:
+    def _get_cache_key(self, user_id: uuid.UUID) -> bytes:
         """Generate cache key for user data."""
-        return f"{CACHE_KEY_PREFIX}{str(user_id)}"
+        return user_cache_key(user_id)
 
-    def _invalidate_cache(self, user_id: uuid.UUID) -> None:
+    async def _invalidate_cache(self, user_id: uuid.UUID) -> None:
         """Invalidate user cache entries."""
         if self.cache:
             cache_key = self._get_cache_key(user_id)
-            self.cache.delete(cache_key)
+            await self.cache.delete(cache_key)
             logger.debug(f"Cache invalidated for user {user_id}")
 
     async def get_by_id(self, user_id: uuid.UUID) -> Optional[UserModel]:
@@ -88,30 +123,23 @@ class UserRepository:
             # Check cache first
             if self.cache:
                 cache_key = self._get_cache_key(user_id)
-                cached_user = self.cache.get(cache_key)
-                if cached_user:
+                cached_user = await self.cache.get(cache_key)
+                # Entries in an older format decode to None and are refilled below
+                user = decode_user(cached_user) if cached_user else None
+                if user:
                     logger.debug(f"Cache hit for user {user_id}")
-                    return UserModel.parse_raw(cached_user)
+                    return user
 
-            # Query database with optimized join
-            query = select(UserModel).where(
-                and_(
-                    UserModel.id == user_id,
-                    UserModel.is_deleted == False
-                )
-            ).execution_options(
-                timeout=3  # 3s timeout per spec
-            )
-            
-            user = self.db.execute(query).scalar_one_or_none()
+            # Query database
+            user = (await self.db.execute(_GET_USER_BY_ID, {'user_id': user_id})).scalar_one_or_none()
 
             # Update cache if user found
             if user and self.cache:
                 cache_key = self._get_cache_key(user_id)
-                self.cache.setex(
+                await self.cache.setex(
                     cache_key,
                     CACHE_TTL,
-                    user.json()
+                    encode_user(user)
                 )
                 logger.debug(f"Cache updated for user {user_id}")
 
@@ -160,15 +188,12 @@ class UserRepository:
             if preferences:
                 user.update_preferences(preferences)
 
-            # Begin transaction
-            self.db.begin()
-
-            # Save to database
+            # Save to database; the session begins its transaction on first use
             self.db.add(user)
-            self.db.flush()
+            await self.db.flush()
 
             # Commit transaction
-            self.db.commit()
+            await self.db.commit()
 
             logger.info(
                 f"User created successfully",
@@ -181,7 +206,7 @@ class UserRepository:
             return user
 
         except SQLAlchemyError as e:
-            self.db.rollback()
+            await self.db.rollback()
             logger.error(f"Database error in create: {str(e)}")
             raise BaseCustomException(
                 message=f"Failed to create user: {str(e)}",
@@ -207,42 +232,44 @@ class UserRepository:
             BaseCustomException: On validation or database errors
         """
         try:
-            # Begin transaction with row lock
-            self.db.begin()
-
-            # Get user with pessimistic lock
-            query = select(UserModel).where(
-                and_(
-                    UserModel.id == user_id,
-                    UserModel.is_deleted == False
-                )
-            ).with_for_update()
-            
-            user = self.db.execute(query).scalar_one_or_none()
-
-            if not user:
-                self.db.rollback()
-                return None
-
             # Encrypt sensitive fields if present
             if 'email' in update_data:
                 update_data['email'] = self.field_encryption.encrypt(
                     update_data['email'].lower()
                 )
 
-            # Update user fields
-            for key, value in update_data.items():
-                if hasattr(user, key):
-                    setattr(user, key, value)
+            values = {
+                key: value for key, value in update_data.items()
+                if key in _UPDATABLE_COLUMNS
+            }
+
+            # A Core UPDATE skips ORM hooks: run the @validates('roles') check and
+            # stamp updated_at as the before_update listener would
+            if 'roles' in values:
+                validate_roles(values['roles'])
+            values['updated_at'] = datetime.utcnow()
+
+            # Update and read back the row in a single statement. Postgres holds the
+            # row lock for the statement itself, and no stored value is read back
+            # into Python first, so no SELECT ... FOR UPDATE is needed
+            stmt = (
+                update(UserModel)
+                .where(UserModel.id == user_id, UserModel.is_deleted == False)
+                .values(**values)
+                .returning(UserModel)
+            )
+            user = (await self.db.execute(stmt)).scalar_one_or_none()
 
-            # Save changes
-            self.db.flush()
+            if not user:
+                await self.db.rollback()
+                return None
 
-            # Commit transaction
-            self.db.commit()
+            # Detach so commit does not expire the values RETURNING loaded
+            self.db.expunge(user)
+            await self.db.commit()
 
             # Invalidate cache
-            self._invalidate_cache(user_id)
+            await self._invalidate_cache(user_id)
 
             logger.info(
                 f"User updated successfully",
@@ -255,7 +282,7 @@ class UserRepository:
             return user
 
         except SQLAlchemyError as e:
-            self.db.rollback()
+            await self.db.rollback()
             logger.error(f"Database error in update: {str(e)}")
             raise BaseCustomException(
                 message=f"Failed to update user: {str(e)}",
@@ -276,11 +303,8 @@ class UserRepository:
             BaseCustomException: On database errors
         """
         try:
-            # Begin transaction
-            self.db.begin()
-
             # Update user with soft delete
-            result = self.db.execute(
+            result = await self.db.execute(
                 update(UserModel)
                 .where(UserModel.id == user_id)
                 .values(
@@ -290,14 +314,14 @@ class UserRepository:
             )
 
             if result.rowcount == 0:
-                self.db.rollback()
+                await self.db.rollback()
                 return False
 
             # Commit transaction
-            self.db.commit()
+            await self.db.commit()
 
             # Invalidate cache
-            self._invalidate_cache(user_id)
+            await self._invalidate_cache(user_id)
 
             logger.info(
                 f"User deleted successfully",
@@ -307,7 +331,7 @@ class UserRepository:
             return True
 
         except SQLAlchemyError as e:
-            self.db.rollback()
+            await self.db.rollback()
             logger.error(f"Database error in delete: {str(e)}")
             raise BaseCustomException(
                 message=f"Failed to delete user: {str(e)}",
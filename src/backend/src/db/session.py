@@ -1,19 +1,22 @@
 """
 Database session management module for the Customer Success AI Platform.
-Provides thread-safe session handling with support for multi-AZ deployments,
-connection pooling, and comprehensive error handling.
+Provides async sessions for request handlers and thread-safe synchronous sessions
+for legacy callers, with support for multi-AZ deployments, connection pooling,
+and comprehensive error handling.
 
 Version: SQLAlchemy 2.x
 """
 
 import logging
-import contextlib
-from typing import Generator, Optional
+from contextvars import ContextVar
+from typing import AsyncGenerator, Optional
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession, async_scoped_session, async_sessionmaker
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy import event
+from sqlalchemy import event, text
 
-from .base import Base, engine
+from .base import Base, engine, read_engine, async_engine, async_read_engine
+from config.settings import DEBUG
 from core.exceptions import BaseCustomException
 
 # Configure module logger
@@ -25,43 +28,77 @@ DB_ERROR_CODES = {
     'TRANSACTION_ERROR': 'DB007'
 }
 
-# Configure session factory with optimized settings
+# Configure session factory with optimized settings.
+# Writes are batched by the engine: passing a list of parameter dicts to
+# Session.execute (e.g. execute(insert(Model), rows)) sends multi-VALUES pages of
+# up to 1000 rows, and ORM flushes of many new objects are batched the same way.
+# Callers should submit rows together rather than one statement per row.
+# Pooling is configured on the engine; committed attributes stay loaded so
+# reading them after commit does not issue a fresh SELECT.
 SessionLocal = sessionmaker(
     autocommit=False,
     autoflush=False,
     bind=engine,
-    # Enhanced connection pooling settings
-    pool_size=20,
-    max_overflow=10,
-    pool_timeout=30,
-    pool_recycle=1800
+    expire_on_commit=False
 )
 
-@contextlib.contextmanager
-def get_db() -> Generator[Session, None, None]:
+# Read-only session factory bound to the replica engine
+ReadSessionLocal = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    bind=read_engine,
+    expire_on_commit=False
+)
+
+# Async session factory for request handlers. Attributes stay loaded after commit,
+# since an expired attribute would need implicit IO that AsyncSession cannot do.
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    autoflush=False,
+    expire_on_commit=False
+)
+AsyncReadSessionLocal = async_sessionmaker(
+    bind=async_read_engine,
+    autoflush=False,
+    expire_on_commit=False
+)
+
+# Request id installed by DatabaseSessionMiddleware; None outside a request
+current_request_id: ContextVar[Optional[str]] = ContextVar('current_request_id', default=None)
+
+# One AsyncSession per request id, shared by every get_db call within the request
+# and closed by DatabaseSessionMiddleware through ScopedAsyncSession.remove() once
+# the response has been sent and every get_db teardown has run
+ScopedAsyncSession = async_scoped_session(AsyncSessionLocal, scopefunc=current_request_id.get)
+
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
-    Creates a new database session with automatic cleanup and error handling.
-    Implements connection pooling and transaction management for optimal performance.
+    Provides the request's async database session with automatic cleanup and error handling.
+    Written as an async generator so FastAPI's Depends drives it like an async context
+    manager. Within a request every call yields the same request-scoped session, which
+    DatabaseSessionMiddleware closes; outside a request a private session is created
+    and closed here. A session is never shared across requests or event loops.
     
     Yields:
-        Session: Database session with configured transaction isolation
+        AsyncSession: Database session with configured transaction isolation
     
     Raises:
         BaseCustomException: On session or transaction errors
     """
-    session = SessionLocal()
+    scoped = current_request_id.get() is not None
+    session = ScopedAsyncSession() if scoped else AsyncSessionLocal()
+    debug = logger.isEnabledFor(logging.DEBUG)
     try:
-        logger.debug("Creating new database session", extra={"session_id": id(session)})
-        
-        # Configure session for optimal performance
-        session.execute("SET SESSION CHARACTERISTICS AS TRANSACTION ISOLATION LEVEL READ COMMITTED")
-        session.execute("SET statement_timeout = '3000ms'")  # 3s timeout per spec
+        if debug:
+            logger.debug("Creating new database session", extra={"session_id": id(session)})
         
+        # Isolation level and statement timeout are connection startup settings
         yield session
         
         # Commit transaction if no exceptions occurred
-        session.commit()
-        logger.debug("Session committed successfully", extra={"session_id": id(session)})
+        await session.commit()
+        if debug:
+            logger.debug("Session committed successfully", extra={"session_id": id(session)})
         
     except SQLAlchemyError as e:
         logger.error(
@@ -71,18 +108,21 @@ def get_db() -> Generator[Session, None, None]:
                 "error_details": str(e)
             }
         )
-        session.rollback()
+        await session.rollback()
         raise BaseCustomException(
             message=f"Database session error: {str(e)}",
             error_code=DB_ERROR_CODES['SESSION_ERROR']
         )
     finally:
-        logger.debug("Closing database session", extra={"session_id": id(session)})
-        session.close()
+        if not scoped:
+            if debug:
+                logger.debug("Closing database session", extra={"session_id": id(session)})
+            await session.close()
 
 def get_read_session() -> Session:
     """
-    Creates a read-only database session optimized for queries.
+    Creates a synchronous read-only database session optimized for queries.
+    Kept for legacy synchronous callers; async code uses DatabaseSession(read_only=True).
     Configures session for replica reads in multi-AZ deployments.
     
     Returns:
@@ -92,14 +132,10 @@ def get_read_session() -> Session:
         BaseCustomException: On session initialization errors
     """
     try:
-        session = SessionLocal()
+        session = ReadSessionLocal()
         
-        # Configure read-only transaction
-        session.execute("SET TRANSACTION READ ONLY")
-        session.execute("SET statement_timeout = '3000ms'")
-        
-        # Enable replica reads if available
-        session.execute("SET SESSION CHARACTERISTICS AS TRANSACTION ISOLATION LEVEL READ COMMITTED")
+        # Read-only applies per transaction; timeout and isolation are set per connection
+        session.execute(text("SET TRANSACTION READ ONLY"))
         
         return session
         
@@ -112,8 +148,10 @@ def get_read_session() -> Session:
 
 class DatabaseSession:
     """
-    Thread-safe database session context manager with comprehensive lifecycle management.
+    Database session context manager with comprehensive lifecycle management.
     Supports both read-write and read-only sessions with proper transaction isolation.
+    Use ``async with`` for an AsyncSession; plain ``with`` yields a synchronous
+    Session for legacy callers.
     """
     
     def __init__(self, read_only: bool = False):
@@ -124,6 +162,7 @@ class DatabaseSession:
             read_only (bool): Whether to create a read-only session
         """
         self._session: Optional[Session] = None
+        self._async_session: Optional[AsyncSession] = None
         self._read_only = read_only
         self._metrics = {
             'created_at': None,
@@ -147,16 +186,44 @@ class DatabaseSession:
                 extra={"read_only": self._read_only}
             )
             
-            # Create appropriate session type
+            # Create appropriate session type; get_read_session marks the transaction
+            # read-only, and timeout and isolation are set per connection
             self._session = get_read_session() if self._read_only else SessionLocal()
             
-            # Configure session parameters
-            if self._read_only:
-                self._session.execute("SET TRANSACTION READ ONLY")
+            return self._session
             
-            self._session.execute("SET statement_timeout = '3000ms'")
+        except SQLAlchemyError as e:
+            logger.error(f"Session context initialization failed: {str(e)}")
+            raise BaseCustomException(
+                message=f"Session context initialization failed: {str(e)}",
+                error_code=DB_ERROR_CODES['SESSION_ERROR']
+            )
+
+    async def __aenter__(self) -> AsyncSession:
+        """
+        Enter async session context with proper initialization and monitoring.
+        
+        Returns:
+            AsyncSession: Configured async database session
+        
+        Raises:
+            BaseCustomException: On session initialization errors
+        """
+        try:
+            logger.debug(
+                "Entering async database session context",
+                extra={"read_only": self._read_only}
+            )
             
-            return self._session
+            self._async_session = (
+                AsyncReadSessionLocal() if self._read_only else AsyncSessionLocal()
+            )
+            
+            # Configure session parameters; the statement timeout is set at connect
+            if self._read_only:
+                await self._async_session.execute(text("SET TRANSACTION READ ONLY"))
+            
+            return self._async_session
             
         except SQLAlchemyError as e:
             logger.error(f"Session context initialization failed: {str(e)}")
@@ -165,6 +232,44 @@ class DatabaseSession:
                 error_code=DB_ERROR_CODES['SESSION_ERROR']
             )
 
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """
+        Exit async session context with proper cleanup and error handling.
+        
+        Args:
+            exc_type: Exception type if an error occurred
+            exc_val: Exception value if an error occurred
+            exc_tb: Exception traceback if an error occurred
+        """
+        if not self._async_session:
+            return
+            
+        try:
+            if exc_type is not None:
+                logger.error(
+                    f"Error in session context: {str(exc_val)}",
+                    extra={"error_type": exc_type.__name__}
+                )
+                await self._async_session.rollback()
+                self._metrics['error_count'] += 1
+            elif not self._read_only:
+                await self._async_session.commit()
+                self._metrics['transaction_count'] += 1
+                
+        except SQLAlchemyError as e:
+            logger.error(f"Session cleanup error: {str(e)}")
+            await self._async_session.rollback()
+            raise BaseCustomException(
+                message=f"Session cleanup failed: {str(e)}",
+                error_code=DB_ERROR_CODES['TRANSACTION_ERROR']
+            )
+        finally:
+            await self._async_session.close()
+            logger.debug(
+                "Session context cleanup completed",
+                extra=self._metrics
+            )
+
     def __exit__(self, exc_type, exc_val, exc_tb):
         """
         Exit session context with proper cleanup and error handling.
@@ -203,18 +308,22 @@ class DatabaseSession:
                 extra=self._metrics
             )
 
-# Register session lifecycle event handlers
-@event.listens_for(Session, 'after_begin')
 def receive_after_begin(session, transaction, connection):
     """Log transaction begin events for monitoring."""
     logger.debug("Transaction began", extra={"session_id": id(session)})
 
-@event.listens_for(Session, 'after_commit')
 def receive_after_commit(session):
     """Log successful transaction commits."""
     logger.debug("Transaction committed", extra={"session_id": id(session)})
 
-@event.listens_for(Session, 'after_rollback')
 def receive_after_rollback(session):
     """Log transaction rollbacks for monitoring."""
-    logger.debug("Transaction rolled back", extra={"session_id": id(session)})
\ No newline at end of file
+    logger.debug("Transaction rolled back", extra={"session_id": id(session)})
+
+# Register session lifecycle event handlers only for DEBUG deployments; class-wide
+# listeners otherwise run on every transaction boundary for nothing. Gated on the
+# DEBUG setting because logging levels are configured after this module is imported
+if DEBUG:
+    event.listen(Session, 'after_begin', receive_after_begin)
+    event.listen(Session, 'after_commit', receive_after_commit)
+    event.listen(Session, 'after_rollback', receive_after_rollback)
\ No newline at end of file
@@ -10,13 +10,18 @@ Dependencies:
 - ratelimit==2.2.1
 """
 
+import functools
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError, as_completed
+from typing import Any, Callable, Dict
+
 from datadog import statsd
 from cryptography.fernet import Fernet
 from connection_pool import ConnectionPool
 from ratelimit import RateLimitDecorator
 
-from .aws.s3 import S3Client
+from .aws.s3 import S3Client, get_s3_client
 from .aws.sagemaker import SageMakerClient
 from .crm.salesforce import SalesforceClient
 
@@ -30,6 +35,9 @@ __version__ = '1.0.0'
 CONNECTION_POOL_SIZE = 50
 RATE_LIMIT_THRESHOLD = 1000
 
+# Health check settings
+HEALTH_CHECK_TIMEOUT = 2.0  # Seconds allowed for all probes together
+
 # Initialize encryption for sensitive data
 encryption_key = Fernet.generate_key()
 cipher_suite = Fernet(encryption_key)
@@ -89,49 +97,80 @@ def init_monitoring():
 # Initialize monitoring on module import
 init_monitoring()
 
+# Integration clients reused across health checks, built on first probe
+@functools.lru_cache(maxsize=None)
+def _health_client(client_class: Callable[[], Any]) -> Any:
+    """Return the shared client instance used to probe an integration."""
+    return client_class()
+
+# Health probes by service; each performs one round-trip to the integration
+_HEALTH_PROBES: Dict[str, Callable[[], Any]] = {
+    's3': lambda: next(get_s3_client().list_files('test-bucket', prefix='health-check'), None),
+    'sagemaker': lambda: _health_client(SageMakerClient).health_check(),
+    'salesforce': lambda: _health_client(SalesforceClient).authenticate()
+}
+
+# Probes are pure I/O, so they run concurrently and the check takes the slowest latency
+_health_executor = ThreadPoolExecutor(
+    max_workers=len(_HEALTH_PROBES),
+    thread_name_prefix='integration-health'
+)
+
+def _run_probe(probe: Callable[[], Any]) -> float:
+    """Run a health probe and return its latency in milliseconds."""
+    start = time.perf_counter_ns()
+    probe()
+    return (time.perf_counter_ns() - start) / 1_000_000
+
 # Monitor integration health
 def check_integration_health():
-    """Check health of all integration clients."""
+    """Check health of all integration clients concurrently."""
     health_status = {
-        's3': {'status': 'unknown', 'latency': 0},
-        'sagemaker': {'status': 'unknown', 'latency': 0},
-        'salesforce': {'status': 'unknown', 'latency': 0}
+        service: {'status': 'unknown', 'latency': 0}
+        for service in _HEALTH_PROBES
+    }
+    
+    futures = {
+        _health_executor.submit(_run_probe, probe): service
+        for service, probe in _HEALTH_PROBES.items()
     }
     
     try:
-        # Check S3 health
-        s3_client = S3Client()
-        s3_client.list_files('test-bucket', prefix='health-check')
-        health_status['s3'] = {'status': 'healthy', 'latency': 0}
-        
-        # Check SageMaker health
-        sagemaker_client = SageMakerClient()
-        sagemaker_client.health_check()
-        health_status['sagemaker'] = {'status': 'healthy', 'latency': 0}
-        
-        # Check Salesforce health
-        salesforce_client = SalesforceClient()
-        salesforce_client.authenticate()
-        health_status['salesforce'] = {'status': 'healthy', 'latency': 0}
-        
-        # Report metrics
-        for service, status in health_status.items():
-            statsd.gauge(
-                f'integrations.health.{service}',
-                1 if status['status'] == 'healthy' else 0
-            )
-            
-        logger.info(
-            "Integration health check completed",
-            extra={'health_status': health_status}
-        )
-        
-    except Exception as e:
+        for future in as_completed(futures, timeout=HEALTH_CHECK_TIMEOUT):
+            service = futures[future]
+            try:
+                health_status[service] = {'status': 'healthy', 'latency': future.result()}
+            except Exception as e:
+                health_status[service] = {'status': 'unhealthy', 'latency': 0}
+                logger.error(
+                    f"Health check failed for {service}: {str(e)}",
+                    extra={'service': service, 'error': str(e)}
+                )
+    except TimeoutError:
+        # Probes still running are reported as timed out; their threads finish in the background
+        for future, service in futures.items():
+            if not future.done():
+                health_status[service] = {
+                    'status': 'timeout',
+                    'latency': HEALTH_CHECK_TIMEOUT * 1000
+                }
         logger.error(
-            f"Health check failed: {str(e)}",
-            extra={'error': str(e)}
+            "Health check timed out",
+            extra={'timeout': HEALTH_CHECK_TIMEOUT}
+        )
+    
+    # Report metrics
+    for service, status in health_status.items():
+        statsd.gauge(
+            f'integrations.health.{service}',
+            1 if status['status'] == 'healthy' else 0
         )
         
+    logger.info(
+        "Integration health check completed",
+        extra={'health_status': health_status}
+    )
+        
     return health_status
 
 # Monitor connection pool metrics
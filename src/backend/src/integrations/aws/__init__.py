@@ -11,7 +11,7 @@ Dependencies:
 
 import logging
 from typing import Dict, Tuple, Optional
-from .s3 import S3Client
+from .s3 import S3Client, get_s3_client
 from .sagemaker import SageMakerClient
 
 # Configure structured logging
@@ -58,8 +58,8 @@ def initialize_aws_clients(config: Optional[Dict] = None) -> Tuple[S3Client, Sag
             }
         )
 
-        # Initialize S3 client with enterprise configuration
-        s3_client = S3Client(retry_config=client_config)
+        # Reuse the shared S3 client unless overrides require a dedicated one
+        s3_client = get_s3_client() if config is None else S3Client(retry_config=client_config)
         
         # Validate S3 client encryption and performance settings
         s3_client.validate_encryption()
@@ -95,6 +95,7 @@ def initialize_aws_clients(config: Optional[Dict] = None) -> Tuple[S3Client, Sag
 # Export commonly used client operations
 __all__ = [
     'S3Client',
+    'get_s3_client',
     'SageMakerClient',
     'initialize_aws_clients'
 ]
@@ -12,7 +12,8 @@ Dependencies:
 import os
 import logging
 import mimetypes
-from typing import Dict, List, Optional, Any
+import threading
+from typing import Dict, Iterator, Optional, Any, Tuple
 import boto3
 from botocore.exceptions import ClientError
 from config.aws import s3_config, get_boto3_session, get_kms_key
@@ -25,6 +26,10 @@ logger = logging.getLogger(__name__)
 DEFAULT_EXPIRATION = 3600  # Default presigned URL expiration in seconds
 MAX_RETRIES = 3  # Maximum number of retry attempts for S3 operations
 
+# Shared client with the default retry policy, built on first use by get_s3_client
+_default_client: Optional['S3Client'] = None
+_default_client_lock = threading.Lock()
+
 class S3Client:
     """
     High-level S3 client for managing object storage operations with enhanced security
@@ -247,17 +252,19 @@ class S3Client:
         bucket_name: str,
         prefix: Optional[str] = None,
         filters: Optional[Dict[str, Any]] = None
-    ) -> List[Dict[str, Any]]:
+    ) -> Iterator[Dict[str, Any]]:
         """
-        Lists files in an S3 bucket/prefix with pagination and filtering.
+        Lazily lists files in an S3 bucket/prefix, fetching pages of 1000 objects.
+        Pages are requested as the iterator is consumed, so listing errors surface
+        during iteration.
 
         Args:
             bucket_name: S3 bucket name
             prefix: Optional key prefix filter
             filters: Optional additional filters
 
-        Returns:
-            List[Dict[str, Any]]: List of object metadata
+        Yields:
+            Dict[str, Any]: Object metadata; last_modified is a datetime
 
         Raises:
             IntegrationSyncError: If listing fails
@@ -266,37 +273,39 @@ class S3Client:
             paginator = self._client.get_paginator('list_objects_v2')
             list_args = {
                 'Bucket': bucket_name,
-                'PaginationConfig': {'MaxItems': 1000}
+                'PaginationConfig': {'PageSize': 1000}
             }
 
             if prefix:
                 list_args['Prefix'] = prefix
 
-            objects = []
+            # Filter criteria are unpacked once rather than per object
+            filter_items = tuple(filters.items()) if filters else ()
+
+            count = 0
             for page in paginator.paginate(**list_args):
-                if 'Contents' in page:
-                    for obj in page['Contents']:
-                        # Apply custom filters if provided
-                        if filters and not self._apply_filters(obj, filters):
-                            continue
-                        
-                        objects.append({
-                            'key': obj['Key'],
-                            'size': obj['Size'],
-                            'last_modified': obj['LastModified'].isoformat(),
-                            'etag': obj['ETag'],
-                            'storage_class': obj['StorageClass']
-                        })
+                for obj in page.get('Contents', ()):
+                    # Apply custom filters if provided
+                    if filter_items and not self._apply_filters(obj, filter_items):
+                        continue
+
+                    count += 1
+                    yield {
+                        'key': obj['Key'],
+                        'size': obj['Size'],
+                        'last_modified': obj['LastModified'],
+                        'etag': obj['ETag'],
+                        'storage_class': obj['StorageClass']
+                    }
 
             logger.info(
                 "Files listed successfully",
                 extra={
                     "bucket": bucket_name,
                     "prefix": prefix,
-                    "count": len(objects)
+                    "count": count
                 }
             )
-            return objects
 
         except ClientError as e:
             raise IntegrationSyncError(
@@ -361,18 +370,34 @@ class S3Client:
                 }
             )
 
-    def _apply_filters(self, obj: Dict[str, Any], filters: Dict[str, Any]) -> bool:
+    def _apply_filters(self, obj: Dict[str, Any], filter_items: Tuple[Tuple[str, Any], ...]) -> bool:
         """
         Applies custom filters to S3 objects.
 
         Args:
             obj: Object metadata
-            filters: Filter criteria
+            filter_items: Filter criteria as (key, value) pairs
 
         Returns:
             bool: Whether object matches filters
         """
-        for key, value in filters.items():
+        for key, value in filter_items:
             if key in obj and obj[key] != value:
                 return False
-        return True
\ No newline at end of file
+        return True
+
+def get_s3_client() -> S3Client:
+    """
+    Returns the shared S3 client with the default retry policy.
+    boto3 clients are thread-safe, and building one loads botocore service models,
+    so callers share a single instance instead of constructing their own.
+
+    Returns:
+        S3Client: Process-wide S3 client
+    """
+    global _default_client
+    if _default_client is None:
+        with _default_client_lock:
+            if _default_client is None:
+                _default_client = S3Client()
+    return _default_client
@@ -7,11 +7,14 @@ Version: SQLAlchemy 2.x
 
 from datetime import datetime
 from decimal import Decimal
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
+from uuid import UUID
 import json
 
-from sqlalchemy import Column, DateTime, String, Float, JSON, event
+import msgpack  # v1.0.5
+from sqlalchemy import DDL, Column, DateTime, String, Float, Index, JSON, event, text
 from sqlalchemy.orm import relationship, declarative_mixin, validates
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy.dialects.postgresql import JSONB
 
 from models.base import BaseModel
@@ -32,6 +35,26 @@ RISK_SCORE_THRESHOLDS = {
 
 CACHE_TTL = 300  # 5 minutes cache TTL
 
+# Timestamp columns restored from ISO strings when loading from cache
+_CACHE_DATETIME_COLUMNS = (
+    'created_at',
+    'updated_at',
+    'contract_start',
+    'contract_end',
+    'last_health_calculation',
+    'last_risk_update'
+)
+
+def _cache_default(obj: Any) -> Any:
+    """Convert column values MessagePack cannot encode natively."""
+    if isinstance(obj, UUID):
+        return str(obj)
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError(f"Cannot serialize {type(obj).__name__} for cache")
+
 @declarative_mixin
 class Customer(BaseModel):
     """
@@ -110,6 +133,24 @@ class Customer(BaseModel):
         comment="Last risk score update timestamp"
     )
 
+    # Indexes aligned with repository list and at-risk queries
+    __table_args__ = (
+        # At-risk lookups filter active customers by risk and order by it
+        Index(
+            'ix_customer_risk_active',
+            'risk_score',
+            postgresql_where=text('is_deleted = false')
+        ),
+        Index('ix_customer_health_risk', 'health_score', 'risk_score'),
+        # Trigram index lets name ILIKE '%...%' filters avoid a full scan
+        Index(
+            'ix_customer_name_trgm',
+            'name',
+            postgresql_using='gin',
+            postgresql_ops={'name': 'gin_trgm_ops'}
+        ),
+    )
+
     def __init__(
         self,
         name: str,
@@ -265,6 +306,41 @@ class Customer(BaseModel):
 
         return result
 
+    def to_cache(self) -> bytes:
+        """
+        Serialize customer column values to a MessagePack buffer for caching.
+        The buffer is kept on the instance until a column is set or the row reloaded.
+        """
+        payload = self.__dict__.get('_cache_payload')
+        if payload is None:
+            payload = msgpack.packb(
+                {column.key: getattr(self, column.key) for column in self.__table__.columns},
+                use_bin_type=True,
+                default=_cache_default
+            )
+            self.__dict__['_cache_payload'] = payload
+        return payload
+
+    @classmethod
+    def from_cache(cls, data: bytes) -> 'Customer':
+        """
+        Rebuild a detached customer from a to_cache buffer.
+        Values were validated when stored, so validators are not re-run.
+        """
+        values = msgpack.unpackb(data, raw=False)
+        values['id'] = UUID(values['id'])
+        values['mrr'] = Decimal(values['mrr'])
+        for key in _CACHE_DATETIME_COLUMNS:
+            if values.get(key) is not None:
+                values[key] = datetime.fromisoformat(values[key])
+
+        customer = cls.__mapper__.class_manager.new_instance()
+        for key, value in values.items():
+            set_committed_value(customer, key, value)
+        # The buffer it came from is still an exact serialization
+        customer.__dict__['_cache_payload'] = data
+        return customer
+
     def _calculate_usage_score(self, metrics: Dict) -> float:
         """Calculate usage component of health score."""
         if not metrics:
@@ -333,4 +409,20 @@ class Customer(BaseModel):
 def update_risk_profile(mapper, connection, target):
     """Update risk profile before any update."""
     if hasattr(target, 'risk_score') and target.risk_score > 0:
-        target.last_risk_update = datetime.utcnow()
\ No newline at end of file
+        target.last_risk_update = datetime.utcnow()
+
+def _drop_cache_payload(target, *args) -> None:
+    """Discard a memoized to_cache buffer once column values may have changed."""
+    target.__dict__.pop('_cache_payload', None)
+
+for _column in Customer.__table__.columns:
+    event.listen(getattr(Customer, _column.key), 'set', _drop_cache_payload)
+event.listen(Customer, 'refresh', _drop_cache_payload)
+event.listen(Customer, 'expire', _drop_cache_payload)
+
+# The trigram name index requires the pg_trgm extension
+event.listen(
+    BaseModel.metadata,
+    'before_create',
+    DDL('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+)
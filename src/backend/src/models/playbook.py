@@ -7,15 +7,27 @@ Version: SQLAlchemy 2.x
 
 from datetime import datetime
 import enum
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
 import uuid
 
-from sqlalchemy import Column, String, JSON, ForeignKey, Enum, Index
+import msgpack  # v1.0.5
+from sqlalchemy import Column, String, JSON, ForeignKey, Enum, Index, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.orm import validates
+from sqlalchemy.orm import relationship, validates
+from sqlalchemy.orm.attributes import set_committed_value
 
 from models.base import BaseModel
 
+def _cache_default(obj: Any) -> Any:
+    """Convert column values MessagePack cannot encode natively."""
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, enum.Enum):
+        return obj.value
+    raise TypeError(f"Cannot serialize {type(obj).__name__} for cache")
+
 class PlaybookStatus(enum.Enum):
     """Enumeration of possible playbook statuses with transition rules."""
     draft = "draft"
@@ -78,12 +90,21 @@ class Playbook(BaseModel):
         }
     )
 
-    # Create composite index for common queries
+    # Executions are loaded only when a query asks for them with selectinload;
+    # lazy access raises rather than issuing one query per playbook
+    executions = relationship(
+        "PlaybookExecution",
+        lazy="raise",
+        viewonly=True
+    )
+
+    # Create composite index for common queries; listings only read active playbooks
     __table_args__ = (
         Index(
-            'ix_playbook_status_trigger',
+            'ix_playbook_status_trigger_active',
             'status',
-            'trigger_type'
+            'trigger_type',
+            postgresql_where=text('is_deleted = false')
         ),
     )
 
@@ -147,6 +168,32 @@ class Playbook(BaseModel):
             if not isinstance(interval, int) or interval < rules['min_interval_minutes']:
                 raise ValueError(f"Interval must be at least {rules['min_interval_minutes']} minutes")
 
+    def to_cache(self) -> bytes:
+        """Serialize playbook column values to a MessagePack buffer for caching."""
+        return msgpack.packb(
+            {column.key: getattr(self, column.key) for column in self.__table__.columns},
+            use_bin_type=True,
+            default=_cache_default
+        )
+
+    @classmethod
+    def from_cache(cls, data: bytes) -> 'Playbook':
+        """
+        Rebuild a detached playbook from a to_cache buffer.
+        Values were validated when stored, so validators are not re-run.
+        """
+        values = msgpack.unpackb(data, raw=False)
+        values['id'] = uuid.UUID(values['id'])
+        values['created_at'] = datetime.fromisoformat(values['created_at'])
+        values['updated_at'] = datetime.fromisoformat(values['updated_at'])
+        values['trigger_type'] = PlaybookTriggerType(values['trigger_type'])
+        values['status'] = PlaybookStatus(values['status'])
+
+        playbook = cls.__mapper__.class_manager.new_instance()
+        for key, value in values.items():
+            set_committed_value(playbook, key, value)
+        return playbook
+
 class PlaybookExecution(BaseModel):
     """SQLAlchemy model for tracking playbook execution with detailed metrics."""
     __tablename__ = "playbook_execution"
@@ -8,9 +8,12 @@ Version: SQLAlchemy 2.x
 from datetime import datetime
 import json
 from typing import Dict, Optional, List, Any
+import uuid
 
-from sqlalchemy import Column, Float, Integer, ForeignKey, JSON, event
+import msgspec  # v0.18.4
+from sqlalchemy import Column, Float, Integer, ForeignKey, JSON, Index, event, text
 from sqlalchemy.orm import relationship, declarative_mixin
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 
 from models.base import BaseModel
@@ -32,6 +35,22 @@ RISK_SCORE_THRESHOLDS = {
     'CRITICAL': 90
 }
 
+class RiskProfileCache(msgspec.Struct, array_like=True):
+    """Typed cache representation of a risk profile row; decoding restores UUIDs and datetimes natively."""
+    id: uuid.UUID
+    customer_id: uuid.UUID
+    score: float
+    severity_level: int
+    factors: Dict[str, Any]
+    recommendations: List[Dict[str, Any]]
+    assessed_at: datetime
+    created_at: datetime
+    updated_at: datetime
+    is_deleted: bool
+    audit_log: List[Any]
+    partition_key: Optional[str]
+    cache_hints: Optional[Dict[str, Any]]
+
 @declarative_mixin
 class RiskProfile(BaseModel):
     """
@@ -87,6 +106,24 @@ class RiskProfile(BaseModel):
         comment="Timestamp of risk assessment"
     )
 
+    # High-risk listings read live profiles by descending score; a partial index
+    # skips soft-deleted rows and serves the ORDER BY with a backward scan
+    __table_args__ = (
+        Index(
+            'ix_riskprofile_high_score',
+            'score',
+            postgresql_where=text('is_deleted = false')
+        ),
+        # A customer keeps its profile history, so the latest live profile is read
+        # as the last entry of this index rather than by sorting the customer's rows
+        Index(
+            'ix_riskprofile_customer_latest',
+            'customer_id',
+            'created_at',
+            postgresql_where=text('is_deleted = false')
+        ),
+    )
+
     # Relationship to customer model
     customer = relationship(
         "Customer",
@@ -167,6 +204,23 @@ class RiskProfile(BaseModel):
         recommendations.sort(key=lambda x: x['impact'], reverse=True)
         return recommendations
 
+    def to_cache_struct(self) -> RiskProfileCache:
+        """Capture column values in the typed cache representation."""
+        return RiskProfileCache(
+            **{field: getattr(self, field) for field in RiskProfileCache.__struct_fields__}
+        )
+
+    @classmethod
+    def from_cache_struct(cls, struct: RiskProfileCache) -> 'RiskProfile':
+        """
+        Rebuild a detached risk profile from its cache representation.
+        Values were validated when stored, so __init__ is not re-run.
+        """
+        profile = cls.__mapper__.class_manager.new_instance()
+        for field in RiskProfileCache.__struct_fields__:
+            set_committed_value(profile, field, getattr(struct, field))
+        return profile
+
     def update_customer_risk(self) -> None:
         """
         Updates associated customer's risk score with change tracking.
@@ -7,7 +7,8 @@ Version: SQLAlchemy 2.x
 
 from datetime import datetime
 import enum
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
+import uuid
 from sqlalchemy import Column, String, DateTime, ForeignKey, Enum, JSON, event
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship, validates
@@ -172,6 +173,55 @@ class Task(BaseModel):
             }
         }]
 
+    @staticmethod
+    def insert_row(
+        title: str,
+        description: str,
+        customer_id: UUID,
+        assignee_id: UUID,
+        task_type: TaskType,
+        priority: TaskPriority,
+        due_date: datetime,
+        metadata: Dict = None
+    ) -> Dict[str, Any]:
+        """
+        Build the column values __init__ would set, for bulk Core inserts.
+        The primary key is generated here so callers can use it without a refresh.
+        """
+        if due_date <= datetime.utcnow():
+            raise ValueError("Due date must be in the future")
+
+        return {
+            "id": uuid.uuid4(),
+            "title": title,
+            "description": description,
+            "customer_id": customer_id,
+            "assignee_id": assignee_id,
+            "task_type": task_type,
+            "priority": priority,
+            "due_date": due_date,
+            "metadata": metadata or {},
+            "status": TaskStatus.pending,
+            "performance_metrics": {
+                "duration_ms": 0,
+                "overdue_time_ms": 0,
+                "status_changes": [],
+                "completion_rate": 0
+            },
+            "audit_trail": [{
+                "timestamp": datetime.utcnow().isoformat(),
+                "action": "created",
+                "details": {
+                    "title": title,
+                    "customer_id": str(customer_id),
+                    "assignee_id": str(assignee_id),
+                    "task_type": task_type.value,
+                    "priority": priority.value,
+                    "due_date": due_date.isoformat()
+                }
+            }]
+        }
+
     @validates('status', 'priority', 'task_type')
     def validate_enums(self, key: str, value: enum.Enum) -> enum.Enum:
         """Validate enum fields with status transition rules."""
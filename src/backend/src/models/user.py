@@ -11,9 +11,11 @@ import logging
 from typing import List, Optional, Dict, Any
 import uuid
 
+import msgspec  # v0.18.4
 from sqlalchemy import Column, String, Boolean, JSON, Integer, DateTime, Index
 from sqlalchemy.dialects.postgresql import ARRAY, UUID
 from sqlalchemy.orm import validates
+from sqlalchemy.orm.attributes import set_committed_value
 from passlib.hash import argon2
 
 from models.base import BaseModel
@@ -35,6 +37,48 @@ ROLE_CS_REP = "cs_rep"
 MAX_AUTH_ATTEMPTS = 5
 AUTH_LOCKOUT_DURATION = 300  # 5 minutes in seconds
 
+def validate_roles(roles: List[str]) -> List[str]:
+    """
+    Validate role assignments.
+    Shared by the @validates hook and bulk UPDATE statements, which bypass ORM hooks.
+    """
+    valid_roles = {ROLE_ADMIN, ROLE_CS_MANAGER, ROLE_CS_REP}
+    if not all(role in valid_roles for role in roles):
+        raise ValueError("Invalid role assignment")
+    return roles
+
+# Columns never written to the shared user cache
+CACHE_EXCLUDED_FIELDS = frozenset({
+    'hashed_password',
+    'mfa_secret',
+    'mfa_backup_codes',
+    'security_questions',
+    'session_data'
+})
+
+class UserCache(msgspec.Struct, array_like=True, frozen=True):
+    """
+    Typed cache representation of a user row; decoding restores UUIDs and datetimes natively.
+    Holds no CACHE_EXCLUDED_FIELDS column, so credentials and MFA secrets stay out of Redis.
+    """
+    id: uuid.UUID
+    email: str
+    full_name: str
+    roles: List[str]
+    is_active: bool
+    is_superuser: bool
+    mfa_enabled: bool
+    blitzy_sso_id: Optional[str]
+    failed_login_attempts: int
+    lockout_until: Optional[datetime]
+    last_password_change: datetime
+    created_at: datetime
+    updated_at: datetime
+    is_deleted: bool
+    audit_log: List[Any]
+    partition_key: Optional[str]
+    cache_hints: Optional[Dict[str, Any]]
+
 class User(BaseModel):
     """
     Enhanced SQLAlchemy model for user management with advanced security features.
@@ -195,13 +239,28 @@ class User(BaseModel):
             
         return False
 
+    def to_cache_struct(self) -> UserCache:
+        """Capture column values in the typed cache representation."""
+        return UserCache(
+            **{field: getattr(self, field) for field in UserCache.__struct_fields__}
+        )
+
+    @classmethod
+    def from_cache_struct(cls, struct: UserCache) -> 'User':
+        """
+        Rebuild a detached user from its cache representation.
+        Values were validated when stored, so __init__ and validators are not re-run.
+        Uncached columns are left unloaded; callers needing credentials read the database.
+        """
+        user = cls.__mapper__.class_manager.new_instance()
+        for field in UserCache.__struct_fields__:
+            set_committed_value(user, field, getattr(struct, field))
+        return user
+
     @validates('roles')
     def validate_roles(self, roles: List[str]) -> List[str]:
         """Validate role assignments."""
-        valid_roles = {ROLE_ADMIN, ROLE_CS_MANAGER, ROLE_CS_REP}
-        if not all(role in valid_roles for role in roles):
-            raise ValueError("Invalid role assignment")
-        return roles
+        return validate_roles(roles)
 
     def is_locked_out(self) -> bool:
         """Check if account is currently locked out."""
@@ -10,11 +10,14 @@ Dependencies:
 import logging
 from typing import Dict, List, Optional, Any
 from uuid import UUID
-import json
 from datetime import datetime
 
 from models.customer import Customer
-from db.repositories.customers import CustomerRepository
+from db.repositories.customers import (
+    CACHE_MISS_SENTINEL,
+    CustomerRepository,
+    customer_cache_key
+)
 from services.risk import RiskService
 from core.exceptions import BaseCustomException
 
@@ -75,12 +78,16 @@ class CustomerService:
             start_time = datetime.utcnow()
 
             # Check cache first
-            cache_key = f"customer:{str(customer_id)}"
+            cache_key = customer_cache_key(customer_id)
             cached_data = await self._cache.get(cache_key)
             
             if cached_data:
                 self._performance_metrics['cache']['hits'] += 1
-                customer = Customer(**json.loads(cached_data))
+                # The repository caches a sentinel for ids with no customer
+                customer = (
+                    None if cached_data == CACHE_MISS_SENTINEL
+                    else Customer.from_cache(cached_data)
+                )
             else:
                 self._performance_metrics['cache']['misses'] += 1
                 customer = await self._repository.get_by_id(customer_id)
@@ -89,7 +96,7 @@ class CustomerService:
                     # Cache customer data
                     await self._cache.set(
                         cache_key,
-                        json.dumps(customer.to_dict()),
+                        customer.to_cache(),
                         expire=CACHE_TTL_SECONDS
                     )
 
@@ -145,10 +152,10 @@ class CustomerService:
             )
 
             # Cache new customer
-            cache_key = f"customer:{str(customer.id)}"
+            cache_key = customer_cache_key(customer.id)
             await self._cache.set(
                 cache_key,
-                json.dumps(customer.to_dict()),
+                customer.to_cache(),
                 expire=CACHE_TTL_SECONDS
             )
 
@@ -202,11 +209,11 @@ class CustomerService:
                     )
 
                 # Invalidate and update cache
-                cache_key = f"customer:{str(customer_id)}"
+                cache_key = customer_cache_key(customer_id)
                 await self._cache.delete(cache_key)
                 await self._cache.set(
                     cache_key,
-                    json.dumps(customer.to_dict()),
+                    customer.to_cache(),
                     expire=CACHE_TTL_SECONDS
                 )
 
@@ -245,7 +252,7 @@ class CustomerService:
 
             if success:
                 # Clear cache
-                cache_key = f"customer:{str(customer_id)}"
+                cache_key = customer_cache_key(customer_id)
                 await self._cache.delete(cache_key)
 
             # Track performance
@@ -8,6 +8,7 @@ Dependencies:
 - numpy==1.24+
 """
 
+import asyncio
 import logging
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple, Any
@@ -71,7 +72,8 @@ class MetricsService:
 
         try:
             # Get customer risk profile
-            risk_profile = await self._risk_repo.get_risk_profile(customer_id)
+            # The repository blocks on I/O and lock waits; keep it off the event loop
+            risk_profile = await asyncio.to_thread(self._risk_repo.get_risk_profile, customer_id)
             if not risk_profile:
                 raise ValueError(f"No risk profile found for customer {customer_id}")
 
@@ -199,9 +201,11 @@ class MetricsService:
                 "recommendations": []
             }
 
-            for customer_id in customer_ids:
+            # One MGET and at most one query for every profile, off the event loop
+            risk_profiles = await asyncio.to_thread(self._risk_repo.get_risk_profiles, customer_ids)
+
+            for customer_id, risk_profile in zip(customer_ids, risk_profiles):
                 customer = await self._customer_repo.get_by_id(customer_id)
-                risk_profile = await self._risk_repo.get_risk_profile(customer_id)
                 
                 if customer and risk_profile:
                     # Calculate revenue at risk
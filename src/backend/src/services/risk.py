@@ -9,6 +9,7 @@ Dependencies:
 - sagemaker==2.x
 """
 
+import asyncio
 import logging
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
@@ -203,7 +204,8 @@ class RiskService:
             self._performance_metrics['cache']['misses'] += 1
 
             # Get from repository
-            profile = await self._risk_repository.get_risk_profile(customer_id)
+            # The repository blocks on I/O and lock waits; keep it off the event loop
+            profile = await asyncio.to_thread(self._risk_repository.get_risk_profile, customer_id)
             if not profile:
                 return None
 
@@ -162,7 +162,7 @@ class TaskService:
             )
 
     @track_timing("task.bulk_create", sla_monitoring=True)
-    async def bulk_create_tasks(self, task_requests: List[Dict]) -> List[Task]:
+    async def bulk_create_tasks(self, task_requests: List[Dict]) -> List[Dict]:
         """
         Creates multiple tasks efficiently with batch processing.
 
@@ -170,7 +170,7 @@ class TaskService:
             task_requests: List of task creation parameters
 
         Returns:
-            List[Task]: Created task instances
+            List[Dict]: Inserted task column values, including ids
 
         Raises:
             BaseCustomException: On validation or creation errors
@@ -191,12 +191,12 @@ class TaskService:
             notification_requests = [
                 {
                     "type": "task_created",
-                    "recipient": str(task.assignee_id),
-                    "subject": f"New Task Assigned: {task.title}",
+                    "recipient": str(task['assignee_id']),
+                    "subject": f"New Task Assigned: {task['title']}",
                     "content": {
-                        "task_id": str(task.id),
-                        "title": task.title,
-                        "priority": task.priority.value
+                        "task_id": str(task['id']),
+                        "title": task['title'],
+                        "priority": task['priority'].value
                     }
                 }
                 for task in tasks
@@ -10,15 +10,15 @@ import logging
 from typing import Dict, List, Optional
 import uuid
 from datetime import datetime
-from redis import Redis  # v4.5+
+from redis.asyncio import Redis  # v4.5+
 from fastapi import HTTPException, status
 from pydantic import BaseModel, EmailStr  # v2.x
 from cryptography.fernet import Fernet  # v41.0+
 
 from models.user import User
-from db.repositories.users import UserRepository
+from db.repositories.users import UserRepository, decode_user, encode_user, user_cache_key
 from services.auth import AuthService
-from core.security import FieldEncryption
+from core.security import get_field_encryption
 from core.exceptions import (
     AuthenticationError,
     DataValidationError,
@@ -60,12 +60,12 @@ class UserService:
         Args:
             user_repository: Repository for user data operations
             auth_service: Service for authentication operations
-            cache_client: Redis client for caching
+            cache_client: Async Redis client for caching, shared with UserRepository
         """
         self.user_repository = user_repository
         self.auth_service = auth_service
         self.cache_client = cache_client
-        self.field_encryption = FieldEncryption()
+        self.field_encryption = get_field_encryption()
 
         logger.info("UserService initialized successfully")
 
@@ -102,7 +102,7 @@ class UserService:
 
             # Check if email already exists
             cache_key = f"user_email:{email.lower()}"
-            if self.cache_client.exists(cache_key):
+            if await self.cache_client.exists(cache_key):
                 raise DataValidationError(
                     message="Email already registered",
                     validation_errors={"email": ["Email already in use"]}
@@ -126,7 +126,7 @@ class UserService:
             created_user = await self.user_repository.create(user)
 
             # Cache user data
-            self._cache_user(created_user)
+            await self._cache_user(created_user)
 
             # Log user creation
             logger.info(
@@ -193,7 +193,7 @@ class UserService:
             )
 
             # Invalidate cache
-            self._invalidate_user_cache(user_id)
+            await self._invalidate_user_cache(user_id)
 
             # Log MFA setup
             logger.info(
@@ -220,37 +220,40 @@ class UserService:
     async def _get_user(self, user_id: uuid.UUID) -> Optional[User]:
         """Get user from cache or database."""
         # Try cache first
-        cache_key = f"user:{str(user_id)}"
-        cached_user = self.cache_client.get(cache_key)
+        cache_key = user_cache_key(user_id)
+        cached_user = await self.cache_client.get(cache_key)
         
-        if cached_user:
-            return User.parse_raw(cached_user)
+        # Shares the repository's entry format; older entries decode to None
+        user = decode_user(cached_user) if cached_user else None
+        if user:
+            return user
 
         # Get from database
         user = await self.user_repository.get_by_id(user_id)
         if user:
-            self._cache_user(user)
+            await self._cache_user(user)
         
         return user
 
-    def _cache_user(self, user: User) -> None:
-        """Cache user data with encryption."""
-        cache_key = f"user:{str(user.id)}"
-        self.cache_client.setex(
+    async def _cache_user(self, user: User) -> None:
+        """Cache user data without credentials or MFA secrets."""
+        cache_key = user_cache_key(user.id)
+        # encode_user writes only UserCache fields, excluding CACHE_EXCLUDED_FIELDS
+        await self.cache_client.setex(
             cache_key,
             CACHE_TTL,
-            user.json(exclude={'hashed_password', 'mfa_secret'})
+            encode_user(user)
         )
 
         # Cache email lookup
         email_key = f"user_email:{user.email}"
-        self.cache_client.setex(
+        await self.cache_client.setex(
             email_key,
             CACHE_TTL,
             str(user.id)
         )
 
-    def _invalidate_user_cache(self, user_id: uuid.UUID) -> None:
+    async def _invalidate_user_cache(self, user_id: uuid.UUID) -> None:
         """Invalidate user cache entries."""
-        cache_key = f"user:{str(user_id)}"
-        self.cache_client.delete(cache_key)
\ No newline at end of file
+        cache_key = user_cache_key(user_id)
+        await self.cache_client.delete(cache_key)
\ No newline at end of file
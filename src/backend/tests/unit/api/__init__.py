@@ -0,0 +1,4 @@
+"""
+Unit tests for the API application factory: startup hooks and middleware
+registration, exercised against mocked cache clients.
+"""
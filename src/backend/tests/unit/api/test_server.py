@@ -0,0 +1,57 @@
+"""
+Unit tests for the FastAPI application factory.
+Validates that startup runs the local cache invalidation listener on the
+application's Redis client, that shutdown stops it, and that the request-scoped
+session and cache batching middleware wrap the rest of the stack.
+
+Dependencies:
+- pytest==7.x
+- fastapi==0.100+
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+from fastapi.testclient import TestClient
+
+from api.middleware import (
+    AuthenticationMiddleware,
+    CacheBatchMiddleware,
+    DatabaseSessionMiddleware,
+    TelemetryMiddleware
+)
+from api.server import create_application
+
+@pytest.fixture
+def cache_manager():
+    """CacheManager mock installed on applications built within the test."""
+    manager = Mock()
+    with patch('api.server.CacheSettings'), \
+            patch('api.server.CacheManager', return_value=manager):
+        yield manager
+
+@pytest.mark.unit
+def test_startup_runs_local_cache_listener(cache_manager):
+    """Test startup subscribes the local cache tier on the application's client."""
+    listen = AsyncMock()
+    with patch('api.server.local_cache', Mock(listen=listen)):
+        app = create_application()
+        with TestClient(app):
+            listen.assert_called_once_with(cache_manager._client)
+            assert isinstance(app.state.local_cache_listener, asyncio.Task)
+            app.state.local_cache_listener = listener = Mock()
+
+    # Shutdown stops the listener
+    listener.cancel.assert_called_once()
+
+@pytest.mark.unit
+def test_request_scoped_middleware_wraps_auth_and_telemetry(cache_manager):
+    """Test session and cache batching layers sit outside the BaseHTTPMiddleware stack."""
+    app = create_application()
+    stack = [middleware.cls for middleware in app.user_middleware]
+
+    # Outermost first: cache batching, then the request database session
+    assert stack[:2] == [CacheBatchMiddleware, DatabaseSessionMiddleware]
+    assert stack.index(AuthenticationMiddleware) > 1
+    assert stack.index(TelemetryMiddleware) > 1
+    assert app.user_middleware[0].options['cache_manager'] is cache_manager
@@ -0,0 +1,45 @@
+"""
+Shared fixtures for core unit tests.
+Provides a CacheManager built over a mocked connection pool and Redis client.
+
+Dependencies:
+- pytest==7.x
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+from core.cache import CacheManager
+
+# TTL returned by the mocked cache settings
+TEST_TTL = 300
+
+@pytest.fixture
+def cache_pipeline():
+    """Empty request pipeline mock returned by the Redis client."""
+    pipe = MagicMock(execute=AsyncMock())
+    pipe.__len__.return_value = 0
+    return pipe
+
+@pytest.fixture
+def cache_client(cache_pipeline):
+    """redis.asyncio client mock the CacheManager is built over."""
+    client = AsyncMock()
+    client.pipeline = Mock(return_value=cache_pipeline)
+    return client
+
+@pytest.fixture
+def connection_pool():
+    """Patched ConnectionPool class, for inspecting the pool configuration."""
+    with patch('core.cache.ConnectionPool') as pool:
+        yield pool
+
+@pytest.fixture
+def cache_manager(connection_pool, cache_client):
+    """CacheManager over the mocked connection pool and Redis client."""
+    settings = Mock(cluster_mode=False)
+    settings.get_connection_url.return_value = "redis://localhost:6379/0"
+    settings.get_ttl.return_value = TEST_TTL
+
+    with patch('core.cache.redis.Redis', return_value=cache_client):
+        return CacheManager(settings)
@@ -13,7 +13,7 @@ from freezegun import freeze_time
 import fakeredis
 import uuid
 
-from core.auth import BlitzyAuthManager
+from core.auth import BlitzyAuthManager, TOKEN_EXPIRE_MINUTES
 from config.security import SecuritySettings
 from core.exceptions import AuthenticationError, RateLimitError
 
@@ -166,6 +166,18 @@ class TestBlitzyAuthManager:
             session = self.fake_redis.get(f"session:{session_id}")
             assert session is None
 
+    def test_create_session_writes_session_key(self):
+        """Test the session is stored on the synchronous client with the token TTL."""
+        user = Mock(id=uuid.uuid4())
+
+        session_id = self.auth_manager._create_session(user, 'test_token')
+
+        key = f"session:{session_id}"
+        session = self.fake_redis.get(key)
+        assert session is not None
+        assert json.loads(session)['user_id'] == str(user.id)
+        assert self.fake_redis.ttl(key) == TOKEN_EXPIRE_MINUTES * 60
+
     @pytest.mark.asyncio
     async def test_rate_limiting(self):
         """Test rate limiting functionality for authentication attempts."""
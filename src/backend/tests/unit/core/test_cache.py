@@ -0,0 +1,100 @@
+"""
+Unit tests for CacheManager request-scoped write batching.
+Validates pipelined writes, immediate deletes, binary-safe client configuration
+and flushing after the full ASGI send cycle.
+
+Dependencies:
+- pytest==7.x
+- pytest-asyncio==0.21+
+"""
+
+import json
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from core.cache import CACHE_KEY_PREFIX, current_pipeline
+from api.middleware import CacheBatchMiddleware
+
+# Test constants
+TEST_KEY = "prediction:42"
+TEST_VALUE = {"score": 0.85}
+
+@pytest.mark.unit
+def test_client_keeps_binary_values(cache_manager, connection_pool):
+    """Test the pool does not decode responses, so msgpack payloads survive reads."""
+    assert connection_pool.from_url.call_args.kwargs['decode_responses'] is False
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_decodes_bytes_values(cache_manager, cache_client):
+    """Test JSON entries read back as bytes are still decoded."""
+    cache_client.get.return_value = json.dumps(TEST_VALUE).encode()
+
+    assert await cache_manager.get(TEST_KEY) == TEST_VALUE
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_set_is_queued_on_request_pipeline(cache_manager, cache_client, cache_pipeline):
+    """Test writes inside a request are queued and sent at the next flush point."""
+    token = current_pipeline.set(cache_pipeline)
+    try:
+        assert await cache_manager.set(TEST_KEY, TEST_VALUE, 'prediction')
+        cache_client.setex.assert_not_awaited()
+        cache_pipeline.setex.assert_called_once()
+
+        cache_pipeline.__len__.return_value = 1
+        cache_client.get.return_value = None
+        await cache_manager.get(TEST_KEY)
+        cache_pipeline.execute.assert_awaited_once()
+    finally:
+        current_pipeline.reset(token)
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_delete_runs_immediately_after_queued_writes(
+    cache_manager, cache_client, cache_pipeline
+):
+    """Test deletes are not deferred and follow any writes already queued."""
+    order = []
+    cache_pipeline.execute.side_effect = lambda: order.append('flush')
+    cache_client.delete.side_effect = lambda key: order.append('delete') or 1
+    token = current_pipeline.set(cache_pipeline)
+    try:
+        await cache_manager.set(TEST_KEY, TEST_VALUE, 'prediction')
+        cache_pipeline.__len__.return_value = 1
+
+        assert await cache_manager.delete(TEST_KEY)
+    finally:
+        current_pipeline.reset(token)
+
+    assert order == ['flush', 'delete']
+    cache_client.delete.assert_awaited_once_with(f"{CACHE_KEY_PREFIX}:{TEST_KEY}")
+    cache_pipeline.delete.assert_not_called()
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_middleware_flushes_after_send_cycle():
+    """Test writes queued after the response body, e.g. by background tasks, are flushed."""
+    manager = Mock(pipeline=Mock(return_value=Mock()))
+    events = []
+    manager.flush = AsyncMock(side_effect=lambda: events.append('flush'))
+
+    async def app(scope, receive, send):
+        assert current_pipeline.get() is manager.pipeline.return_value
+        await send({'type': 'http.response.start', 'status': 200, 'headers': []})
+        await send({'type': 'http.response.body', 'body': b''})
+        events.append('background')
+
+    async def send(message):
+        events.append(message['type'])
+
+    middleware = CacheBatchMiddleware(cache_manager=manager, app=app)
+    await middleware({'type': 'http', 'path': '/'}, AsyncMock(), send)
+
+    assert events == [
+        'http.response.start',
+        'http.response.body',
+        'background',
+        'flush'
+    ]
+    assert current_pipeline.get() is None
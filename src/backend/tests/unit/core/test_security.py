@@ -183,4 +183,28 @@ def test_field_encryption_class():
     # Test invalid version handling
     invalid_version = "999:invaliddata"
     with pytest.raises(ValueError, match="Unsupported encryption version"):
-        field_encryption.decrypt(invalid_version)
\ No newline at end of file
+        field_encryption.decrypt(invalid_version)
+
+
+@pytest.mark.unit
+def test_field_encryption_bulk():
+    """Test bulk encryption and decryption across sequential and threaded batches."""
+    field_encryption = FieldEncryption()
+
+    # Small batches are processed inline, large ones on the worker pool
+    for batch_size in (3, 200):
+        values = [f"{TEST_FIELD_VALUE}_{i}" for i in range(batch_size)]
+        encrypted = field_encryption.encrypt_many(values)
+        assert len(encrypted) == batch_size
+        assert all(":" in value for value in encrypted)
+
+        # Bulk results interoperate with single-value decryption
+        assert field_encryption.decrypt(encrypted[-1]) == values[-1]
+        assert field_encryption.decrypt_many(encrypted) == values
+
+    # Test empty value handling
+    with pytest.raises(ValueError, match="Value is required"):
+        field_encryption.encrypt_many([TEST_FIELD_VALUE, ""])
+
+    with pytest.raises(ValueError, match="Encrypted value is required"):
+        field_encryption.decrypt_many([""])
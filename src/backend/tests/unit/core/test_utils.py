@@ -0,0 +1,58 @@
+"""
+Unit tests for safe_json_loads input checks.
+Validates the byte-size limit for str and bytes input and the rejection of
+documents that are not a JSON object or array.
+
+Dependencies:
+- pytest==7.x
+"""
+
+import pytest
+from unittest.mock import patch
+
+from core.exceptions import BaseCustomException
+from core.utils import safe_json_loads
+
+# Small limit so payloads stay readable
+TEST_MAX_BYTES = 16
+
+@pytest.mark.unit
+@pytest.mark.parametrize('payload', [
+    b'{"name": "' + b'x' * TEST_MAX_BYTES + b'"}',
+    '{"name": "' + 'x' * TEST_MAX_BYTES + '"}'
+])
+def test_oversized_payload_is_rejected_with_413(payload):
+    """Test payloads over the limit are rejected before parsing."""
+    with patch('core.utils.MAX_JSON_BYTES', TEST_MAX_BYTES), \
+            pytest.raises(BaseCustomException) as exc_info:
+        safe_json_loads(payload)
+
+    assert exc_info.value.status_code == 413
+    assert exc_info.value.error_code == "JSON003"
+
+@pytest.mark.unit
+def test_str_limit_counts_encoded_bytes():
+    """Test multi-byte characters count as bytes, not characters, against the limit."""
+    payload = '{"n": "' + 'é' * 5 + '"}'
+    assert len(payload) <= TEST_MAX_BYTES < len(payload.encode())
+
+    with patch('core.utils.MAX_JSON_BYTES', TEST_MAX_BYTES), \
+            pytest.raises(BaseCustomException) as exc_info:
+        safe_json_loads(payload)
+
+    assert exc_info.value.status_code == 413
+
+@pytest.mark.unit
+@pytest.mark.parametrize('payload', ['"text"', '42', b'null', '  true', b''])
+def test_non_object_or_array_is_rejected(payload):
+    """Test documents not starting with an object or array are rejected as JSON001."""
+    with pytest.raises(BaseCustomException) as exc_info:
+        safe_json_loads(payload)
+
+    assert exc_info.value.error_code == "JSON001"
+
+@pytest.mark.unit
+@pytest.mark.parametrize('payload', ['  {"a": 1}', b'\n[1, 2]'])
+def test_leading_whitespace_before_document_is_accepted(payload):
+    """Test whitespace before the opening bracket passes the structural check."""
+    assert safe_json_loads(payload) in ({"a": 1}, [1, 2])
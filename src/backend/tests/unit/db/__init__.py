@@ -0,0 +1,4 @@
+"""
+Unit tests for the data access layer: repository caching, statement shapes
+and session lifecycle, exercised against mocked sessions and Redis clients.
+"""
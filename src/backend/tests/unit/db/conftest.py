@@ -0,0 +1,110 @@
+"""
+Shared fixtures for data access layer unit tests.
+Provides mocked sessions and Redis clients and the repositories built over them.
+
+Dependencies:
+- pytest==7.x
+"""
+
+import contextlib
+import pytest
+from unittest.mock import AsyncMock, MagicMock, Mock
+
+from db.repositories.customers import CustomerRepository
+from db.repositories.risk import RiskRepository
+from db.repositories.tasks import TaskRepository
+
+class FakeIndexedCache:
+    """In-memory stand-in for the keys and sets the task invalidation script touches."""
+
+    def __init__(self):
+        self.values = {}
+        self.sets = {}
+
+    def run_invalidate(self, keys):
+        """Apply INVALIDATE_INDEXED_KEYS semantics to the in-memory store."""
+        deleted = 0
+        for index in keys:
+            for member in self.sets.pop(index, set()):
+                deleted += self.values.pop(member, None) is not None
+        return deleted
+
+@pytest.fixture
+def db_session():
+    """Synchronous session mock whose single-row queries find nothing."""
+    session = Mock()
+    session.execute.return_value = Mock(scalar_one_or_none=Mock(return_value=None))
+    return session
+
+@pytest.fixture
+def redis_client():
+    """Synchronous Redis client mock with nothing cached."""
+    client = MagicMock()
+    client.get.return_value = None
+    return client
+
+@pytest.fixture
+def lua_script(redis_client):
+    """Script returned by register_script on the Redis client mock."""
+    return redis_client.register_script.return_value
+
+@pytest.fixture
+def redis_pipeline(redis_client):
+    """Pipeline yielded by the Redis client mock's pipeline() context manager."""
+    return redis_client.pipeline.return_value.__enter__.return_value
+
+@pytest.fixture
+def risk_repository(db_session, redis_client):
+    """RiskRepository over the synchronous session and Redis client mocks."""
+    return RiskRepository(db_session=db_session, cache_client=redis_client)
+
+@pytest.fixture
+def task_store():
+    """In-memory store backing the task repository's cache writes and invalidations."""
+    return FakeIndexedCache()
+
+@pytest.fixture
+def task_repository(db_session, redis_client, lua_script, redis_pipeline, task_store):
+    """TaskRepository whose cache writes and invalidation script act on task_store."""
+    lua_script.side_effect = task_store.run_invalidate
+    redis_pipeline.setex.side_effect = (
+        lambda key, ttl, value: task_store.values.__setitem__(key, value)
+    )
+    redis_pipeline.sadd.side_effect = (
+        lambda index, key: task_store.sets.setdefault(index, set()).add(key)
+    )
+    db_session.execute.return_value.scalars.return_value.all.return_value = []
+    return TaskRepository(db_session=db_session, cache_client=redis_client)
+
+@pytest.fixture
+def async_redis_client():
+    """redis.asyncio client mock with nothing cached."""
+    client = AsyncMock()
+    client.get.return_value = None
+    return client
+
+@pytest.fixture
+def customer_read_session():
+    """AsyncSession mock serving the customer repository's reads; finds nothing by default."""
+    session = AsyncMock()
+    session.execute.return_value = Mock(scalar_one_or_none=Mock(return_value=None))
+    return session
+
+@pytest.fixture
+def make_customer_repository(async_redis_client):
+    """Build CustomerRepository instances sharing the Redis mock, each reading from a given session."""
+    def make(read_session: AsyncMock) -> CustomerRepository:
+        @contextlib.asynccontextmanager
+        async def scoped_read_session():
+            yield read_session
+
+        repository = CustomerRepository(db_session=AsyncMock(), cache_client=async_redis_client)
+        repository._read_session = scoped_read_session
+        return repository
+
+    return make
+
+@pytest.fixture
+def customer_repository(make_customer_repository, customer_read_session):
+    """CustomerRepository reading from customer_read_session."""
+    return make_customer_repository(customer_read_session)
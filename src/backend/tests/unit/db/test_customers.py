@@ -0,0 +1,125 @@
+"""
+Unit tests for CustomerRepository cache fills.
+Validates negative caching of unknown ids and single-flight loading of hot misses
+against mocked sessions and an async Redis client.
+
+Dependencies:
+- pytest==7.x
+- pytest-asyncio==0.21+
+"""
+
+import asyncio
+import pytest
+import uuid
+from unittest.mock import AsyncMock, Mock, patch
+
+from db.repositories.customers import (
+    CACHE_MISS_SENTINEL,
+    CACHE_TTL,
+    NEGATIVE_CACHE_TTL,
+    Customer,
+    customer_cache_key
+)
+from db.repositories.local_cache import LocalCache
+
+# Test constants
+MOCK_CUSTOMER_ID = uuid.uuid4()
+MOCK_PAYLOAD = b"\x81\xa2id\xa4test"
+
+@pytest.fixture(autouse=True)
+def isolated_local_cache():
+    """Give each test an empty in-process cache tier."""
+    with patch('db.repositories.customers.local_cache', LocalCache()) as cache:
+        yield cache
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_unknown_id_is_negatively_cached(
+    customer_repository, async_redis_client, customer_read_session
+):
+    """Test a miss for an unknown id stores the sentinel with the short TTL."""
+    assert await customer_repository._fetch_by_id(MOCK_CUSTOMER_ID) is None
+
+    async_redis_client.setex.assert_awaited_once_with(
+        customer_cache_key(MOCK_CUSTOMER_ID),
+        NEGATIVE_CACHE_TTL,
+        CACHE_MISS_SENTINEL
+    )
+    async_redis_client.set.assert_not_called()
+
+    # The sentinel is now served locally without Redis or the database
+    assert await customer_repository._fetch_by_id(MOCK_CUSTOMER_ID) is None
+    assert async_redis_client.get.await_count == 1
+    assert customer_read_session.execute.await_count == 1
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_cached_sentinel_skips_database(
+    customer_repository, async_redis_client, customer_read_session
+):
+    """Test a sentinel read from Redis is returned as None without a query."""
+    async_redis_client.get.return_value = CACHE_MISS_SENTINEL
+
+    assert await customer_repository._fetch_by_id(MOCK_CUSTOMER_ID) is None
+    customer_read_session.execute.assert_not_awaited()
+    async_redis_client.setex.assert_not_awaited()
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_found_customer_is_cached_with_full_ttl(
+    customer_repository, async_redis_client, customer_read_session
+):
+    """Test a loaded customer is stored with setex and the regular TTL."""
+    customer = Mock(to_cache=Mock(return_value=MOCK_PAYLOAD))
+    customer_read_session.execute.return_value.scalar_one_or_none.return_value = customer
+
+    assert await customer_repository._fetch_by_id(MOCK_CUSTOMER_ID) is customer
+    async_redis_client.setex.assert_awaited_once_with(
+        customer_cache_key(MOCK_CUSTOMER_ID),
+        CACHE_TTL,
+        MOCK_PAYLOAD
+    )
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_fill(
+    customer_repository, make_customer_repository, async_redis_client, customer_read_session
+):
+    """Test concurrent misses for one key issue a single query and cache write."""
+    gate = asyncio.Event()
+    customer = Mock(to_cache=Mock(return_value=MOCK_PAYLOAD))
+
+    async def gated_execute(*args, **kwargs):
+        await gate.wait()
+        return Mock(scalar_one_or_none=Mock(return_value=customer))
+
+    customer_read_session.execute.side_effect = gated_execute
+    follower_session = AsyncMock()
+    follower_repository = make_customer_repository(follower_session)
+
+    with patch.object(Customer, 'from_cache', return_value=customer) as from_cache:
+        leader = asyncio.create_task(customer_repository._fetch_by_id(MOCK_CUSTOMER_ID))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(follower_repository._fetch_by_id(MOCK_CUSTOMER_ID))
+        await asyncio.sleep(0)
+        gate.set()
+        results = await asyncio.gather(leader, follower)
+
+    assert results == [customer, customer]
+    assert customer_read_session.execute.await_count == 1
+    follower_session.execute.assert_not_awaited()
+    async_redis_client.setex.assert_awaited_once()
+    from_cache.assert_called_once_with(MOCK_PAYLOAD)
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_failed_fill_propagates_to_waiters(customer_repository, customer_read_session):
+    """Test a failing leader query raises in every waiting caller and clears the fill."""
+    customer_read_session.execute.side_effect = RuntimeError("connection lost")
+
+    with pytest.raises(RuntimeError):
+        await customer_repository._fetch_by_id(MOCK_CUSTOMER_ID)
+
+    # A later miss starts a fresh fill rather than reusing the failed one
+    customer_read_session.execute.side_effect = None
+    assert await customer_repository._fetch_by_id(MOCK_CUSTOMER_ID) is None
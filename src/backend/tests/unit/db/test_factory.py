@@ -0,0 +1,60 @@
+"""
+Unit tests for RepositoryFactory.
+Validates that asynchronous repositories share the AsyncSession and redis.asyncio
+client, RiskRepository gets the synchronous handles, and cleanup awaits the
+asynchronous closes.
+
+Dependencies:
+- pytest==7.x
+- pytest-asyncio==0.21+
+"""
+
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from db.repositories import RepositoryFactory
+
+@pytest.fixture
+def handles():
+    """Asynchronous and synchronous session and Redis client mocks."""
+    return {
+        'db_session': AsyncMock(),
+        'cache_client': AsyncMock(),
+        'sync_db_session': Mock(),
+        'sync_cache_client': Mock()
+    }
+
+@pytest.mark.unit
+def test_repositories_get_matching_handles(handles):
+    """Test async repositories get the async handles and risk the blocking ones."""
+    factory = RepositoryFactory(**handles)
+
+    assert factory.customers.db is handles['db_session']
+    assert factory.customers.cache is handles['cache_client']
+    assert factory.risk._session is handles['sync_db_session']
+    assert factory.risk._cache is handles['sync_cache_client']
+    handles['sync_cache_client'].register_script.assert_called_once()
+
+@pytest.mark.unit
+def test_risk_requires_sync_handles(handles):
+    """Test RiskRepository is not built over the asynchronous handles."""
+    factory = RepositoryFactory(handles['db_session'], handles['cache_client'])
+
+    with pytest.raises(ValueError):
+        factory.risk
+    handles['cache_client'].register_script.assert_not_called()
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_cleanup_awaits_async_closes(handles):
+    """Test cleanup awaits the AsyncSession and redis.asyncio closes."""
+    factory = RepositoryFactory(**handles)
+    factory.users
+
+    await factory.cleanup()
+
+    assert 'users' not in factory.__dict__
+    handles['db_session'].close.assert_awaited_once()
+    handles['cache_client'].close.assert_awaited_once()
+    handles['sync_db_session'].close.assert_called_once()
+    handles['sync_cache_client'].close.assert_called_once()
@@ -0,0 +1,219 @@
+"""
+Unit tests for RiskRepository cache stampede protection and batch lookups.
+Validates the GET_OR_LOCK script calls, waiting on another worker's load,
+negative caching, release of an abandoned load lock and get_risk_profiles.
+
+Dependencies:
+- pytest==7.x
+"""
+
+import pytest
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from unittest.mock import patch
+from sqlalchemy.exc import SQLAlchemyError
+
+from models.risk import RiskProfile, RiskProfileCache
+from core.exceptions import BaseCustomException
+from db.repositories.risk import (
+    CACHE_MISS_SENTINEL,
+    CACHE_TTL,
+    LOAD_LOCK_TTL,
+    LOAD_WAIT_ATTEMPTS,
+    LOADING_TOKEN,
+    NEGATIVE_CACHE_TTL
+)
+
+# Test constants
+MOCK_CUSTOMER_ID = uuid.uuid4()
+
+def build_profile(
+    customer_id: uuid.UUID = MOCK_CUSTOMER_ID,
+    assessed_at: Optional[datetime] = None
+) -> RiskProfile:
+    """Build a detached risk profile, for the mock customer by default."""
+    now = datetime.now(timezone.utc)
+    return RiskProfile.from_cache_struct(RiskProfileCache(
+        id=uuid.uuid4(),
+        customer_id=customer_id,
+        score=85.0,
+        severity_level=3,
+        factors={"usage_decline": 0.7},
+        recommendations=[],
+        assessed_at=assessed_at or now,
+        created_at=now,
+        updated_at=now,
+        is_deleted=False,
+        audit_log=[],
+        partition_key=None,
+        cache_hints=None
+    ))
+
+@pytest.mark.unit
+def test_cache_hit_skips_database(risk_repository, lua_script, db_session):
+    """Test a cached profile is decoded without querying."""
+    profile = build_profile()
+    lua_script.side_effect = [risk_repository._encode_profile(profile)]
+
+    cached = risk_repository.get_risk_profile(MOCK_CUSTOMER_ID)
+
+    assert cached.customer_id == MOCK_CUSTOMER_ID
+    assert cached.score == 85.0
+    db_session.execute.assert_not_called()
+    lua_script.assert_called_once_with(
+        keys=[risk_repository._get_cache_key(MOCK_CUSTOMER_ID)],
+        args=[LOADING_TOKEN, LOAD_LOCK_TTL]
+    )
+
+@pytest.mark.unit
+def test_miss_claims_lock_and_fills_cache(risk_repository, redis_client, lua_script, db_session):
+    """Test the caller that claims the lock queries once and replaces the token."""
+    profile = build_profile()
+    db_session.execute.return_value.scalar_one_or_none.return_value = profile
+    lua_script.side_effect = [None]
+
+    assert risk_repository.get_risk_profile(MOCK_CUSTOMER_ID) is profile
+
+    db_session.execute.assert_called_once()
+    redis_client.setex.assert_called_once()
+    assert redis_client.setex.call_args.kwargs['name'] == risk_repository._get_cache_key(MOCK_CUSTOMER_ID)
+    assert redis_client.setex.call_args.kwargs['time'] == CACHE_TTL
+
+@pytest.mark.unit
+def test_miss_without_profile_is_negatively_cached(risk_repository, redis_client, lua_script, db_session):
+    """Test a customer with no profile stores the sentinel, and the sentinel is served."""
+    lua_script.side_effect = [None, CACHE_MISS_SENTINEL]
+
+    assert risk_repository.get_risk_profile(MOCK_CUSTOMER_ID) is None
+    redis_client.setex.assert_called_once_with(
+        risk_repository._get_cache_key(MOCK_CUSTOMER_ID),
+        NEGATIVE_CACHE_TTL,
+        CACHE_MISS_SENTINEL
+    )
+
+    assert risk_repository.get_risk_profile(MOCK_CUSTOMER_ID) is None
+    db_session.execute.assert_called_once()
+
+@pytest.mark.unit
+def test_waits_for_other_workers_load(risk_repository, lua_script, db_session):
+    """Test a caller seeing the loading token waits for the result instead of querying."""
+    profile = build_profile()
+    lua_script.side_effect = [LOADING_TOKEN, LOADING_TOKEN, risk_repository._encode_profile(profile)]
+
+    with patch('db.repositories.risk.time.sleep') as sleep:
+        cached = risk_repository.get_risk_profile(MOCK_CUSTOMER_ID)
+
+    assert cached.id == profile.id
+    assert sleep.call_count == 2
+    assert lua_script.call_count == 3
+    db_session.execute.assert_not_called()
+
+@pytest.mark.unit
+def test_wait_exhausted_loads_without_lock(risk_repository, lua_script, db_session):
+    """Test a caller gives up waiting after LOAD_WAIT_ATTEMPTS and queries itself."""
+    profile = build_profile()
+    db_session.execute.return_value.scalar_one_or_none.return_value = profile
+    lua_script.side_effect = [LOADING_TOKEN] * LOAD_WAIT_ATTEMPTS
+
+    with patch('db.repositories.risk.time.sleep'):
+        assert risk_repository.get_risk_profile(MOCK_CUSTOMER_ID) is profile
+
+    assert lua_script.call_count == LOAD_WAIT_ATTEMPTS
+    db_session.execute.assert_called_once()
+
+@pytest.mark.unit
+def test_failed_load_releases_lock(risk_repository, lua_script, redis_pipeline, db_session):
+    """Test a lock holder whose query fails drops its loading token."""
+    lua_script.side_effect = [None]
+    db_session.execute.side_effect = SQLAlchemyError("connection lost")
+    redis_pipeline.get.return_value = LOADING_TOKEN
+
+    with pytest.raises(BaseCustomException):
+        risk_repository.get_risk_profile(MOCK_CUSTOMER_ID)
+
+    cache_key = risk_repository._get_cache_key(MOCK_CUSTOMER_ID)
+    redis_pipeline.watch.assert_called_once_with(cache_key)
+    redis_pipeline.multi.assert_called_once()
+    redis_pipeline.delete.assert_called_once_with(cache_key)
+    redis_pipeline.execute.assert_called_once()
+
+@pytest.mark.unit
+def test_release_keeps_value_written_by_another_worker(risk_repository, redis_pipeline):
+    """Test releasing the lock leaves a real value in place."""
+    redis_pipeline.get.return_value = CACHE_MISS_SENTINEL
+
+    risk_repository._release_load_lock(risk_repository._get_cache_key(MOCK_CUSTOMER_ID))
+
+    redis_pipeline.delete.assert_not_called()
+    redis_pipeline.execute.assert_not_called()
+
+@pytest.mark.unit
+def test_failed_load_without_lock_leaves_token(risk_repository, redis_client, lua_script, db_session):
+    """Test a caller that never held the lock does not release another worker's token."""
+    lua_script.side_effect = [LOADING_TOKEN] * LOAD_WAIT_ATTEMPTS
+    db_session.execute.side_effect = SQLAlchemyError("connection lost")
+
+    with patch('db.repositories.risk.time.sleep'), pytest.raises(BaseCustomException):
+        risk_repository.get_risk_profile(MOCK_CUSTOMER_ID)
+
+    redis_client.pipeline.assert_not_called()
+
+@pytest.mark.unit
+def test_get_risk_profiles_batches_cache_and_database(
+    risk_repository, redis_client, redis_pipeline, db_session
+):
+    """Test one MGET serves hits and sentinels and one query fills the rest, in input order."""
+    cached_id, sentinel_id, loaded_id, absent_id = (uuid.uuid4() for _ in range(4))
+    cached_profile = build_profile(cached_id)
+    newest = build_profile(loaded_id)
+    older = build_profile(loaded_id, assessed_at=newest.assessed_at - timedelta(days=1))
+
+    redis_client.mget.return_value = [
+        None,
+        risk_repository._encode_profile(cached_profile),
+        None,
+        CACHE_MISS_SENTINEL
+    ]
+    # Rows arrive newest first
+    db_session.execute.return_value.scalars.return_value.all.return_value = [newest, older]
+
+    profiles = risk_repository.get_risk_profiles([loaded_id, cached_id, absent_id, sentinel_id])
+
+    assert profiles[0] is newest
+    assert profiles[1].id == cached_profile.id
+    assert profiles[2] is None
+    assert profiles[3] is None
+
+    redis_client.mget.assert_called_once_with([
+        risk_repository._get_cache_key(customer_id)
+        for customer_id in (loaded_id, cached_id, absent_id, sentinel_id)
+    ])
+    db_session.execute.assert_called_once()
+    assert db_session.execute.call_args.args[1] == {'customer_ids': [loaded_id, absent_id]}
+
+    # Loaded profiles and absences are cached in one pipeline
+    assert redis_pipeline.setex.call_count == 2
+    redis_pipeline.setex.assert_any_call(
+        risk_repository._get_cache_key(loaded_id),
+        CACHE_TTL,
+        risk_repository._encode_profile(newest)
+    )
+    redis_pipeline.setex.assert_any_call(
+        risk_repository._get_cache_key(absent_id),
+        NEGATIVE_CACHE_TTL,
+        CACHE_MISS_SENTINEL
+    )
+    redis_pipeline.execute.assert_called_once()
+
+@pytest.mark.unit
+def test_get_risk_profiles_all_cached_skips_database(risk_repository, redis_client, db_session):
+    """Test a batch served entirely from the cache issues no query and no writes."""
+    profile = build_profile()
+    redis_client.mget.return_value = [risk_repository._encode_profile(profile)]
+
+    profiles = risk_repository.get_risk_profiles([MOCK_CUSTOMER_ID])
+
+    assert profiles[0].id == profile.id
+    db_session.execute.assert_not_called()
+    redis_client.pipeline.assert_not_called()
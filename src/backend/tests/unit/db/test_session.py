@@ -0,0 +1,91 @@
+"""
+Unit tests for request-scoped database session lifecycle.
+Validates that get_db shares one session per request and that the session is
+removed only after the response and dependency teardown have completed.
+
+Dependencies:
+- pytest==7.x
+- pytest-asyncio==0.21+
+"""
+
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+from api.middleware import DatabaseSessionMiddleware
+from db.session import current_request_id, get_db
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_db_shares_scoped_session_within_request():
+    """Test get_db yields the request's scoped session and leaves closing to the middleware."""
+    session = AsyncMock()
+    token = current_request_id.set("request-1")
+    try:
+        with patch('db.session.ScopedAsyncSession', Mock(return_value=session)):
+            first, second = get_db(), get_db()
+            assert await first.__anext__() is session
+            assert await second.__anext__() is session
+
+            # Teardown commits but does not close the shared session
+            with pytest.raises(StopAsyncIteration):
+                await first.__anext__()
+    finally:
+        current_request_id.reset(token)
+
+    session.commit.assert_awaited_once()
+    session.close.assert_not_awaited()
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_db_outside_request_closes_private_session():
+    """Test get_db creates and closes its own session when no request scope is active."""
+    session = AsyncMock()
+    with patch('db.session.AsyncSessionLocal', Mock(return_value=session)):
+        generator = get_db()
+        assert await generator.__anext__() is session
+        with pytest.raises(StopAsyncIteration):
+            await generator.__anext__()
+
+    session.commit.assert_awaited_once()
+    session.close.assert_awaited_once()
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_session_removed_after_response_and_teardown():
+    """Test the middleware removes the scoped session only after the send cycle ends."""
+    events = []
+
+    async def app(scope, receive, send):
+        events.append(current_request_id.get())
+        await send({'type': 'http.response.start', 'status': 200, 'headers': []})
+        await send({'type': 'http.response.body', 'body': b''})
+        # Yield-dependency teardown and background tasks run after the body is sent
+        events.append('teardown')
+
+    async def send(message):
+        events.append(message['type'])
+
+    with patch('api.middleware.ScopedAsyncSession') as scoped:
+        scoped.remove = AsyncMock(side_effect=lambda: events.append('remove'))
+        await DatabaseSessionMiddleware(app)({'type': 'http'}, AsyncMock(), send)
+
+    assert events[0] is not None
+    assert events[1:] == [
+        'http.response.start',
+        'http.response.body',
+        'teardown',
+        'remove'
+    ]
+    assert current_request_id.get() is None
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_session_middleware_passes_through_non_http():
+    """Test lifespan and websocket scopes get no request session."""
+    app = AsyncMock()
+    with patch('api.middleware.ScopedAsyncSession') as scoped:
+        scoped.remove = AsyncMock()
+        await DatabaseSessionMiddleware(app)({'type': 'lifespan'}, AsyncMock(), AsyncMock())
+
+    app.assert_awaited_once()
+    scoped.remove.assert_not_awaited()
@@ -0,0 +1,67 @@
+"""
+Unit tests for TaskRepository query-cache invalidation.
+Validates that cached filter results are indexed per customer and that the
+INVALIDATE_INDEXED_KEYS script is invoked once with every affected index.
+
+Dependencies:
+- pytest==7.x
+"""
+
+import pytest
+import uuid
+
+from db.repositories.tasks import (
+    CACHE_TTL,
+    CUSTOMER_INDEX_PREFIX,
+    INVALIDATE_INDEXED_KEYS
+)
+
+# Test constants
+MOCK_CUSTOMER_ID = uuid.uuid4()
+OTHER_CUSTOMER_ID = uuid.uuid4()
+
+@pytest.mark.unit
+def test_script_registered_once_per_repository(task_repository, redis_client):
+    """Test the Lua script is registered at construction, not per invalidation."""
+    redis_client.register_script.assert_called_once_with(INVALIDATE_INDEXED_KEYS)
+
+@pytest.mark.unit
+def test_filtered_results_indexed_under_customer(task_repository, task_store, redis_pipeline):
+    """Test a customer-scoped query result is added to that customer's index set."""
+    task_repository.get_tasks_by_filter({'customer_id': MOCK_CUSTOMER_ID})
+
+    index_key = f"{CUSTOMER_INDEX_PREFIX}{MOCK_CUSTOMER_ID}"
+    cache_key = task_repository._generate_cache_key({'customer_id': MOCK_CUSTOMER_ID}, 100, 0)
+    assert task_store.sets[index_key] == {cache_key}
+    assert cache_key in task_store.values
+    redis_pipeline.expire.assert_called_once_with(index_key, CACHE_TTL)
+
+@pytest.mark.unit
+def test_invalidation_deletes_indexed_keys_in_one_call(task_repository, task_store, lua_script):
+    """Test invalidating several customers sends one script call covering every index."""
+    task_repository.get_tasks_by_filter({'customer_id': MOCK_CUSTOMER_ID})
+    task_repository.get_tasks_by_filter({'customer_id': MOCK_CUSTOMER_ID, 'status': 'open'})
+    task_repository.get_tasks_by_filter({'customer_id': OTHER_CUSTOMER_ID})
+    assert len(task_store.values) == 3
+
+    task_repository._invalidate_task_caches(MOCK_CUSTOMER_ID, OTHER_CUSTOMER_ID)
+
+    lua_script.assert_called_once_with(keys=[
+        f"{CUSTOMER_INDEX_PREFIX}{MOCK_CUSTOMER_ID}",
+        f"{CUSTOMER_INDEX_PREFIX}{OTHER_CUSTOMER_ID}"
+    ])
+    assert task_store.values == {}
+    assert task_store.sets == {}
+
+@pytest.mark.unit
+def test_invalidation_without_customers_is_noop(task_repository, lua_script):
+    """Test no round-trip is made when there is nothing to invalidate."""
+    task_repository._invalidate_task_caches()
+    lua_script.assert_not_called()
+
+@pytest.mark.unit
+def test_script_chunks_deletes_within_unpack_limit():
+    """Test the script deletes members in chunks rather than one unbounded unpack."""
+    assert "for i = 1, #members, 500 do" in INVALIDATE_INDEXED_KEYS
+    assert "unpack(members, i, math.min(i + 499, #members))" in INVALIDATE_INDEXED_KEYS
+    assert "redis.call('DEL', index)" in INVALIDATE_INDEXED_KEYS
@@ -0,0 +1,217 @@
+"""
+Unit tests for user caching and the UserRepository async path.
+Validates that credentials never reach the shared cache.
+
+Dependencies:
+- pytest==7.x
+- pytest-asyncio==0.21+
+"""
+
+import pytest
+import uuid
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, Mock, patch
+from sqlalchemy.dialects import postgresql
+
+from models.user import User, UserCache, CACHE_EXCLUDED_FIELDS
+from db.repositories.users import (
+    CACHE_TTL as REPOSITORY_CACHE_TTL,
+    UserRepository,
+    decode_user,
+    encode_user,
+    user_cache_key
+)
+from services.user import UserService, CACHE_TTL
+
+# Test constants
+MOCK_USER_ID = uuid.uuid4()
+MOCK_PASSWORD_HASH = "$argon2id$v=19$m=65536,t=3,p=4$c2FsdA$aGFzaA"
+MOCK_MFA_SECRET = "JBSWY3DPEHPK3PXP"
+
+def build_user() -> User:
+    """Build a detached user carrying credentials, as loaded from the database."""
+    now = datetime.now(timezone.utc)
+    user = User.from_cache_struct(UserCache(
+        id=MOCK_USER_ID,
+        email="encrypted-email",
+        full_name="Test User",
+        roles=["cs_rep"],
+        is_active=True,
+        is_superuser=False,
+        mfa_enabled=True,
+        blitzy_sso_id=None,
+        failed_login_attempts=0,
+        lockout_until=None,
+        last_password_change=now,
+        created_at=now,
+        updated_at=now,
+        is_deleted=False,
+        audit_log=[],
+        partition_key=None,
+        cache_hints=None
+    ))
+    user.hashed_password = MOCK_PASSWORD_HASH
+    user.mfa_secret = MOCK_MFA_SECRET
+    user.mfa_backup_codes = ["backup01"]
+    return user
+
+@pytest.mark.unit
+def test_user_cache_excludes_credentials():
+    """Test the cache struct carries no credential or MFA column."""
+    assert not CACHE_EXCLUDED_FIELDS & set(UserCache.__struct_fields__)
+
+    payload = encode_user(build_user())
+    assert MOCK_PASSWORD_HASH.encode() not in payload
+    assert MOCK_MFA_SECRET.encode() not in payload
+    assert b"backup01" not in payload
+
+    # Round trip keeps the cached fields
+    cached = decode_user(payload)
+    assert cached.id == MOCK_USER_ID
+    assert cached.roles == ["cs_rep"]
+
+@pytest.mark.unit
+def test_user_cache_rejects_other_formats():
+    """Test entries written in another format read as misses."""
+    assert decode_user(b"\x01" + encode_user(build_user())[1:]) is None
+    assert decode_user(b'{"id": "legacy-json"}') is None
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_service_cache_user_excludes_credentials():
+    """Test UserService writes the credential-free entry to the shared cache."""
+    cache_client = AsyncMock()
+    with patch('services.user.get_field_encryption'):
+        service = UserService(
+            user_repository=AsyncMock(),
+            auth_service=Mock(),
+            cache_client=cache_client
+        )
+
+    await service._cache_user(build_user())
+
+    key, ttl, payload = cache_client.setex.await_args_list[0].args
+    assert key == user_cache_key(MOCK_USER_ID)
+    assert ttl == CACHE_TTL
+    assert MOCK_PASSWORD_HASH.encode() not in payload
+    assert MOCK_MFA_SECRET.encode() not in payload
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_service_reads_repository_entries():
+    """Test UserService awaits the async client and decodes the repository's entries."""
+    cache_client = AsyncMock()
+    cache_client.get.return_value = encode_user(build_user())
+    user_repository = AsyncMock()
+    with patch('services.user.get_field_encryption'):
+        service = UserService(
+            user_repository=user_repository,
+            auth_service=Mock(),
+            cache_client=cache_client
+        )
+
+    user = await service._get_user(MOCK_USER_ID)
+
+    assert user.id == MOCK_USER_ID
+    cache_client.get.assert_awaited_once_with(user_cache_key(MOCK_USER_ID))
+    user_repository.get_by_id.assert_not_awaited()
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_repository_get_by_id_fills_cache_on_miss():
+    """Test UserRepository awaits the async session on a miss and caches the row."""
+    user = build_user()
+    cache = AsyncMock()
+    cache.get.return_value = None
+    session = AsyncMock()
+    session.execute.return_value = Mock(scalar_one_or_none=Mock(return_value=user))
+    with patch('db.repositories.users.get_field_encryption'):
+        repository = UserRepository(db_session=session, cache_client=cache)
+
+    assert await repository.get_by_id(MOCK_USER_ID) is user
+
+    session.execute.assert_awaited_once()
+    key, ttl, payload = cache.setex.await_args.args
+    assert key == user_cache_key(MOCK_USER_ID)
+    assert ttl == REPOSITORY_CACHE_TTL
+    assert decode_user(payload).id == MOCK_USER_ID
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_repository_get_by_id_serves_cache_hit():
+    """Test a cached entry is returned without touching the session."""
+    cache = AsyncMock()
+    cache.get.return_value = encode_user(build_user())
+    session = AsyncMock()
+    with patch('db.repositories.users.get_field_encryption'):
+        repository = UserRepository(db_session=session, cache_client=cache)
+
+    user = await repository.get_by_id(MOCK_USER_ID)
+
+    assert user.id == MOCK_USER_ID
+    session.execute.assert_not_awaited()
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_repository_update_returns_detached_row():
+    """Test update issues one UPDATE ... RETURNING and detaches the row before commit."""
+    user = build_user()
+    calls = []
+    session = AsyncMock()
+    session.execute.return_value = Mock(scalar_one_or_none=Mock(return_value=user))
+    session.expunge = Mock(side_effect=lambda instance: calls.append('expunge'))
+    session.commit.side_effect = lambda: calls.append('commit')
+    cache = AsyncMock()
+    with patch('db.repositories.users.get_field_encryption') as encryption:
+        encryption.return_value.encrypt.return_value = "encrypted-new-email"
+        repository = UserRepository(db_session=session, cache_client=cache)
+
+    updated = await repository.update(
+        MOCK_USER_ID,
+        {'email': 'New@Example.com', 'roles': ['cs_manager'], 'not_a_column': 1}
+    )
+
+    assert updated is user
+    assert calls == ['expunge', 'commit']
+    session.execute.assert_awaited_once()
+    encryption.return_value.encrypt.assert_called_once_with('new@example.com')
+
+    # One statement writes the valid columns and stamps updated_at
+    statement = session.execute.await_args.args[0]
+    params = statement.compile(dialect=postgresql.dialect()).params
+    assert params['email'] == "encrypted-new-email"
+    assert params['roles'] == ['cs_manager']
+    assert isinstance(params['updated_at'], datetime)
+    assert 'not_a_column' not in params
+    assert statement.is_update
+
+    cache.delete.assert_awaited_once_with(user_cache_key(MOCK_USER_ID))
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_repository_update_rejects_invalid_roles():
+    """Test role validation runs before the UPDATE is sent."""
+    session = AsyncMock()
+    with patch('db.repositories.users.get_field_encryption'):
+        repository = UserRepository(db_session=session, cache_client=AsyncMock())
+
+    with pytest.raises(ValueError, match="Invalid role assignment"):
+        await repository.update(MOCK_USER_ID, {'roles': ['superadmin']})
+
+    session.execute.assert_not_awaited()
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_repository_update_missing_user_rolls_back():
+    """Test an update matching no live row rolls back and leaves the cache alone."""
+    session = AsyncMock()
+    session.execute.return_value = Mock(scalar_one_or_none=Mock(return_value=None))
+    cache = AsyncMock()
+    with patch('db.repositories.users.get_field_encryption'):
+        repository = UserRepository(db_session=session, cache_client=cache)
+
+    assert await repository.update(MOCK_USER_ID, {'full_name': 'Renamed'}) is None
+
+    session.rollback.assert_awaited_once()
+    session.commit.assert_not_awaited()
+    cache.delete.assert_not_awaited()